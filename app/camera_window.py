@@ -11,13 +11,15 @@ from typing import Optional
 
 import cv2
 import numpy as np
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, pyqtSignal
 from PyQt6.QtGui import QImage, QPixmap, QFont, QColor, QPainter, QPen, QBrush
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QTextEdit, QSizePolicy, QFrame,
 )
 
+from core.frame_pool import FrameBuffer
+from core.overlay import draw_hands
 from domain.enums import HandState, GestureEvent
 
 # ---- Colores por estado (RGB para Qt) ---------------------------------
@@ -44,12 +46,18 @@ class CameraWindow(QWidget):
     Ventana principal de visualización.
 
     Características:
-    - Feed de cámara con landmarks ya dibujados por HandTracker.
+    - Feed de cámara con landmarks dibujados solo en los frames mostrados.
     - Overlay HUD: estado estable, predicción raw, confianza, buffer.
     - Panel lateral con log de eventos en tiempo real.
     - Botón para cerrar/ocultar (no termina la app).
+
+    Señal:
+        visibility_changed — True al mostrarse, False al ocultarse
+                             (el worker deja de emitir frames si está oculta).
     """
 
+    visibility_changed = pyqtSignal(bool)
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self._stable_state: HandState    = HandState.NO_HANDS
@@ -58,6 +66,10 @@ class CameraWindow(QWidget):
         self._state_buffer: deque        = deque(maxlen=6)
         self._last_events:  list[str]    = []
 
+        # Buffers reutilizados por on_frame (espejo BGR + conversión RGB)
+        self._mirror: Optional[np.ndarray] = None
+        self._rgb:    Optional[np.ndarray] = None
+
         self._setup_ui()
 
     # ------------------------------------------------------------------
@@ -173,6 +185,19 @@ class CameraWindow(QWidget):
         self._conf_bar = _ConfidenceBar()
         right.addWidget(self._conf_bar)
 
+        # Nivel de calidad del BudgetGovernor (oculto si no está activo)
+        self._tier_label = QLabel("")
+        self._tier_label.setStyleSheet("font-size:11px; color:#a0c4ff; padding:2px 0;")
+        self._tier_label.setVisible(False)
+        right.addWidget(self._tier_label)
+
+        # Métricas del pipeline (PipelineStats)
+        self._stats_label = QLabel("—")
+        self._stats_label.setObjectName("stats_label")
+        self._stats_label.setStyleSheet("font-size:10px; color:#888; padding:2px 0;")
+        self._stats_label.setWordWrap(True)
+        right.addWidget(self._stats_label)
+
         sep = QFrame()
         sep.setObjectName("separator")
         sep.setFrameShape(QFrame.Shape.HLine)
@@ -196,10 +221,22 @@ class CameraWindow(QWidget):
     # ------------------------------------------------------------------
     # Slots llamados desde CameraWorker via señales
     # ------------------------------------------------------------------
-    def on_frame(self, frame: np.ndarray) -> None:
-        """Recibe un frame BGR y lo muestra con overlay HUD."""
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        frame_rgb = cv2.flip(frame_rgb, 1)
+    def on_frame(self, buf: FrameBuffer, hands: list) -> None:
+        """
+        Recibe un FrameBuffer BGR del worker y lo muestra con landmarks y
+        overlay HUD. El buffer se libera en cuanto se copia a los buffers
+        propios; se dibuja sobre la copia espejada, nunca sobre el original.
+        """
+        try:
+            frame = buf.array
+            if self._rgb is None or self._rgb.shape != frame.shape:
+                self._mirror = np.empty_like(frame)
+                self._rgb    = np.empty_like(frame)
+            cv2.flip(frame, 1, dst=self._mirror)
+        finally:
+            buf.release()
+        draw_hands(self._mirror, hands, mirrored=True)
+        frame_rgb = cv2.cvtColor(self._mirror, cv2.COLOR_BGR2RGB, dst=self._rgb)
 
         # Overlay HUD encima del frame
         self._draw_hud(frame_rgb)
@@ -265,6 +302,29 @@ class CameraWindow(QWidget):
         sb = self._log.verticalScrollBar()
         sb.setValue(sb.maximum())
 
+    def on_stats(self, stats: dict) -> None:
+        """Muestra fps, latencia captura→fin y el coste medio de cada etapa."""
+        lines = [
+            f"{stats.get('fps', 0.0):.1f} fps   "
+            f"lat {stats.get('latency_ms', 0.0):.0f} ms "
+            f"(máx {stats.get('latency_max_ms', 0.0):.0f})"
+        ]
+        for key, value in stats.items():
+            if key in ("fps", "latency_ms", "latency_max_ms"):
+                continue
+            if key.endswith("_ms"):
+                lines.append(f"{key[:-3]}: {value:.1f} ms")
+            elif isinstance(value, float) and not value.is_integer():
+                lines.append(f"{key}: {value:.2f}")
+            else:
+                lines.append(f"{key}: {value:g}" if isinstance(value, float) else f"{key}: {value}")
+        self._stats_label.setText("\n".join(lines))
+
+    def on_tier(self, tier: str) -> None:
+        """Muestra el nivel de calidad activo."""
+        self._tier_label.setText(f"Calidad: {tier}")
+        self._tier_label.setVisible(True)
+
     def on_status(self, msg: str) -> None:
         """Mensajes de sistema/debug al log."""
         if msg.startswith("[EVENT]") or msg.startswith("[STATE]"):
@@ -314,6 +374,14 @@ class CameraWindow(QWidget):
         cv2.rectangle(frame, (14, 108), (14 + bar_w, 116), (r, g, b), -1)
 
     # ------------------------------------------------------------------
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.visibility_changed.emit(True)
+
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        self.visibility_changed.emit(False)
+
     def closeEvent(self, event) -> None:
         """Interceptar cierre de ventana → solo ocultar, no destruir."""
         event.ignore()
@@ -5,21 +5,67 @@ señales con la información necesaria para actualizar la UI.
 Separa completamente el procesamiento de la interfaz gráfica.
 """
 from __future__ import annotations
+import threading
 import time
 from typing import Optional
 
-import numpy as np
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from app.config import AppConfig
+from core.budget_governor import BudgetGovernor, QualityTier, apply_thread_limits, make_tiers
 from core.camera import Camera
+from core.feature_cache import FeatureCache
+from core.flight_recorder import FlightRecorder
+from core.frame_broadcast import FramePublisher
+from core.frame_pool import FrameBuffer, FramePool
+from core.frame_source import open_source
+from core.geometric_classifier import GeometricClassifier
 from core.hand_tracker import HandTracker
+from core.idle_governor import IdleGovernor
+from core.motion_gate import MotionGate
+from core.overlay import hand_points
 from core.state_classifier import StateClassifier
 from core.state_stabilizer import StateStabilizer
 from core.gesture_manager import GestureManager
 from core.cooldown_manager import CooldownManager
+from core.pipeline_stats import PipelineStats
+from core.remote_tracker import RemoteHandTracker
+from core.stage_pipeline import Stage, StagePipeline
 from domain.enums import HandState, GestureEvent
-from domain.models import FrameData
+from domain.models import FrameData, FrameTiming, HandIds, HandsData, HandsRaw, HandStates
+
+
+class _FrameJob:
+    """Estado de un frame mientras recorre las etapas del pipeline."""
+
+    __slots__ = ("buf", "timing", "resumed", "hands_data", "hands_raw", "hand_ids",
+                 "raw_state", "confidence", "current", "hand_results", "hand_states")
+
+    def __init__(self, buf: FrameBuffer, timing: FrameTiming) -> None:
+        self.buf: Optional[FrameBuffer] = buf
+        self.timing = timing
+        self.resumed = False          # primer frame tras un corte de captura
+        self.hands_data: HandsData = {}
+        self.hands_raw:  HandsRaw  = {}
+        self.hand_ids:   HandIds   = {}
+        self.raw_state  = HandState.NO_HANDS
+        self.confidence = 1.0
+        self.current    = HandState.NO_HANDS
+        self.hand_results: dict[str, tuple[HandState, float]] = {}
+        self.hand_states:  HandStates = {}
+
+    def release(self) -> None:
+        """Devuelve el buffer al pool (idempotente)."""
+        if self.buf is not None:
+            self.buf.release()
+            self.buf = None
+
+    @staticmethod
+    def merge(old: "_FrameJob", new: "_FrameJob") -> "_FrameJob":
+        """Cola coalesce: gana el frame nuevo pero hereda un reinicio pendiente."""
+        new.resumed = new.resumed or old.resumed
+        old.release()
+        return new
 
 
 class CameraWorker(QThread):
@@ -27,28 +73,70 @@ class CameraWorker(QThread):
     QThread que ejecuta el pipeline completo de visión + gestos.
 
     Señales emitidas cada frame:
-        frame_ready   — frame BGR como np.ndarray (para mostrar en la UI)
+        frame_ready   — (FrameBuffer BGR con una referencia para la UI,
+                        landmarks normalizados por mano para el overlay);
+                        el receptor debe llamar a release(). Solo se emite
+                        mientras la vista previa está activa.
         state_changed — (stable_state, raw_state, confidence)
         event_fired   — GestureEvent detectado
         status_msg    — string de log para mostrar en la UI
+
+    Señal periódica (cada ``stats_interval`` segundos):
+        stats_ready   — dict con fps, latencia captura→fin y ms por etapa
+
+    Señal ocasional:
+        tier_changed  — nombre del nivel de calidad activo (BudgetGovernor)
     """
 
-    frame_ready   = pyqtSignal(np.ndarray)
+    frame_ready   = pyqtSignal(object, object)          # FrameBuffer, list[np.ndarray]
     state_changed = pyqtSignal(object, object, float)   # HandState, HandState, float
     event_fired   = pyqtSignal(object)                  # GestureEvent
     status_msg    = pyqtSignal(str)
+    stats_ready   = pyqtSignal(dict)
+    tier_changed  = pyqtSignal(str)
 
     def __init__(self, config: AppConfig, parent=None) -> None:
         super().__init__(parent)
         self._config  = config
         self._running = False
+        self._preview = False   # True mientras hay una ventana mostrando frames
 
         # Componentes del pipeline (se crean en run() para vivir en el hilo correcto)
+        self._pool = FramePool()
         self._camera:     Optional[Camera]          = None
-        self._tracker:    Optional[HandTracker]     = None
+        self._tracker:    Optional[HandTracker | RemoteHandTracker] = None
         self._classifier: Optional[StateClassifier] = None
         self._stabilizer: Optional[StateStabilizer] = None
+        self._hand_stabilizers: dict[str, StateStabilizer] = {}   # por mano (classifier_per_hand)
         self._manager:    Optional[GestureManager]  = None
+        self._idle:       Optional[IdleGovernor]    = None
+        self._gate:       Optional[MotionGate]      = None
+        self._budget:     Optional[BudgetGovernor]  = None
+        self._broadcast:  Optional[FramePublisher]  = None
+        self._recorder:   Optional[FlightRecorder]  = None
+
+        # Último resultado del tracker (reutilizado por el motion gate)
+        self._last_hands: tuple[HandsData, HandsRaw, HandIds] = ({}, {}, {})
+        self._track_cost: float = 0.0   # EMA del coste de HandTracker (s)
+
+        # Ejecución por etapas (StagePipeline) — None = secuencial
+        self._pipeline:   Optional[StagePipeline]   = None
+        self._tracker_lock = threading.Lock()
+        # Nivel decidido en la etapa output; lo aplica la etapa track, dueña
+        # de cámara, IdleGovernor y tracker (y el hilo al que limitar la CPU)
+        self._pending_tier: Optional[QualityTier] = None
+        self._tier_lock = threading.Lock()
+        self._prev_stable: Optional[HandState] = None
+        self._last_seq = -1
+        # Etapas que aún deben reiniciarse porque el frame que lo pedía
+        # (job.resumed) se descartó antes de llegar a ellas
+        self._reset_pending: set[str] = set()
+        self._reset_lock = threading.Lock()
+
+        # Hot-plug: True mientras la cámara no entrega frames
+        self._capture_gap   = False
+        self._camera_lost   = False
+        self._stats = PipelineStats(interval=config.stats_interval)
 
     # ------------------------------------------------------------------
     def run(self) -> None:
@@ -56,68 +144,438 @@ class CameraWorker(QThread):
         cfg = self._config
 
         try:
-            self._camera     = Camera(cfg.camera_device, cfg.fps_limit)
-            self._tracker    = HandTracker()
-            self._classifier = StateClassifier(cfg.model_path)
+            source = open_source(
+                cfg.camera_source,
+                device=cfg.camera_device,
+                path=cfg.camera_source_path,
+                pacing=cfg.camera_pacing,
+                fps=cfg.fps_limit,
+                size=cfg.synthetic_size,
+                loop=cfg.camera_loop,
+            )
+            self._camera     = Camera(
+                source,
+                cfg.fps_limit,
+                threaded=cfg.camera_threaded,
+                buffer_size=cfg.camera_buffer_size,
+                pool=self._pool,
+            )
+            # En modo proceso, MediaPipe corre en otro núcleo y fuera del GIL
+            tracker_cls      = RemoteHandTracker if cfg.tracker_process else HandTracker
+            self._tracker    = tracker_cls(
+                max_input_side=cfg.tracker_max_input_side,
+                roi_enabled=cfg.tracker_roi_enabled,
+                roi_margin=cfg.tracker_roi_margin,
+                roi_rescan_interval=cfg.tracker_roi_rescan,
+                roi_input_side=cfg.tracker_roi_input_side,
+                keyframe_interval=cfg.tracker_keyframe_interval,
+                flow_max_error=cfg.tracker_flow_max_error,
+            )
+            cache = None
+            if cfg.classifier_cache_enabled:
+                cache = FeatureCache(
+                    dist_step=cfg.classifier_cache_dist_step,
+                    angle_step=cfg.classifier_cache_angle_step,
+                    max_size=cfg.classifier_cache_size,
+                    max_age=cfg.classifier_cache_max_age,
+                )
+            fast_path = GeometricClassifier(
+                fist_max_dist=cfg.fast_path_fist_max_dist,
+                fist_max_angle=cfg.fast_path_fist_max_angle,
+                palm_min_dist=cfg.fast_path_palm_min_dist,
+                palm_min_angle=cfg.fast_path_palm_min_angle,
+            )
+            self._classifier = StateClassifier(
+                cfg.model_path,
+                backend=cfg.classifier_backend,
+                cache=cache,
+                early_exit_chunk=cfg.classifier_early_exit_chunk if cfg.classifier_early_exit else 0,
+                early_exit_margin=cfg.classifier_early_exit_margin,
+                fast_path=fast_path,
+                fast_path_mode=cfg.classifier_fast_path,
+            )
+            if cfg.classifier_early_exit and not self._classifier.early_exit:
+                self.status_msg.emit(
+                    f"[WARN] Salida anticipada desactivada: con el backend '{self._classifier.backend}' "
+                    f"no ahorra tiempo (use classifier_backend='sklearn')"
+                )
+            elif cfg.classifier_early_exit and cfg.classifier_per_hand:
+                self.status_msg.emit(
+                    "[WARN] Con classifier_per_hand los frames con dos manos evalúan "
+                    "el bosque completo (la salida anticipada solo aplica a una fila)"
+                )
+            if self._classifier.fallback_reason:
+                self.status_msg.emit(
+                    f"[WARN] Backend '{cfg.classifier_backend}' no soportado "
+                    f"({self._classifier.fallback_reason}) — usando sklearn"
+                )
             self._stabilizer = StateStabilizer(
                 window=cfg.state_window,
                 consensus=cfg.state_consensus,
                 min_confidence=cfg.min_confidence,
             )
+            if cfg.classifier_per_hand:
+                self._hand_stabilizers = {
+                    side: StateStabilizer(
+                        window=cfg.state_window,
+                        consensus=cfg.state_consensus,
+                        min_confidence=cfg.min_confidence,
+                    )
+                    for side in ("Left", "Right")
+                }
+            if cfg.idle_enabled:
+                self._idle = IdleGovernor(
+                    active_fps=cfg.fps_limit,
+                    idle_fps=cfg.idle_fps,
+                    idle_after=cfg.idle_after,
+                )
+            if cfg.motion_gate_enabled:
+                self._gate = MotionGate(
+                    pixel_threshold=cfg.motion_gate_threshold,
+                    min_changed=cfg.motion_gate_min_changed,
+                    max_reuse_age=cfg.motion_gate_max_age,
+                )
+            if cfg.budget_enabled:
+                self._budget = BudgetGovernor(
+                    make_tiers(cfg.fps_limit),
+                    cpu_share=cfg.budget_cpu_share,
+                    deadline=cfg.budget_deadline_ms / 1000.0,
+                )
+            if cfg.recorder_enabled:
+                self._recorder = FlightRecorder(
+                    seconds=cfg.recorder_seconds,
+                    fps=cfg.fps_limit,
+                    thumb_size=cfg.recorder_thumb_size,
+                )
+            if cfg.broadcast_enabled:
+                self._broadcast = FramePublisher(cfg.broadcast_name, cfg.broadcast_slots)
             cooldown      = CooldownManager(default_cooldown=cfg.cooldown)
             self._manager = GestureManager(cooldown)
         except Exception as exc:
             self.status_msg.emit(f"[ERROR] Inicialización: {exc}")
+            # Liberar lo ya creado: hilo de captura, proceso del tracker, memoria compartida
+            self._cleanup()
             return
 
-        self._running = True
-        prev_stable: HandState | None = None
-        self.status_msg.emit("✅ Pipeline iniciado")
+        try:
+            self._running = True
+            self._prev_stable = None
+            self._last_seq = -1
+            self._reset_pending.clear()
+            self.status_msg.emit("✅ Pipeline iniciado")
+            if self._budget is not None:
+                self._request_tier(self._budget.tier)
+
+            if cfg.pipeline_enabled:
+                self._pipeline = StagePipeline(
+                    [
+                        Stage("track",    self._stage_track,    cfg.pipeline_queue_size, cfg.pipeline_track_policy,
+                              merge=_FrameJob.merge),
+                        Stage("classify", self._stage_classify, cfg.pipeline_queue_size, cfg.pipeline_classify_policy),
+                        Stage("output",   self._stage_output,   cfg.pipeline_queue_size, cfg.pipeline_output_policy),
+                    ],
+                    on_drop=self._drop_job,
+                    on_error=lambda stage, exc: self.status_msg.emit(f"[ERROR] Etapa {stage}: {exc}"),
+                )
+                self._pipeline.start()
+
+            while self._running:
+                buf = self._camera.read_buffer()
+                if buf is None:
+                    if self._camera.finished:
+                        self.status_msg.emit("[INFO] Fin de la fuente de video")
+                        break
+                    self._on_capture_gap()
+                    time.sleep(0.05)
+                    continue
+
+                job = _FrameJob(buf, FrameTiming(capture_ts=buf.timestamp, seq=buf.seq))
+                if self._capture_gap:
+                    self._on_capture_resumed()
+                    job.resumed = True
+
+                if self._pipeline is not None:
+                    # Etapas concurrentes: captura → track → classify → output
+                    self._pipeline.submit(job)
+                else:
+                    self._stage_track(job)
+                    self._stage_classify(job)
+                    self._stage_output(job)
+        except Exception as exc:
+            self.status_msg.emit(f"[ERROR] Pipeline: {exc}")
+        finally:
+            self._running = False
+            self._cleanup()
+
+    # ------------------------------------------------------------------
+    # Etapas (secuenciales o en StagePipeline; cada una corre en un solo hilo)
+    # ------------------------------------------------------------------
+    def _drop_job(self, job: "_FrameJob") -> None:
+        """
+        Frame descartado (política de cola, error de etapa o parada).
+        Si traía un reinicio, lo hereda el siguiente frame de cada etapa:
+        reiniciar una etapa que ya lo vio no tiene efecto.
+        """
+        if job.resumed:
+            with self._reset_lock:
+                self._reset_pending.update(("track", "classify", "output"))
+        job.release()
+
+    def _take_reset(self, stage: str, job: "_FrameJob") -> bool:
+        """True si ``stage`` debe reiniciar su estado temporal con este frame."""
+        with self._reset_lock:
+            if stage in self._reset_pending:
+                self._reset_pending.discard(stage)
+                job.resumed = True
+        return job.resumed
+
+    def _stage_track(self, job: "_FrameJob") -> "_FrameJob":
+        """Broadcast + motion gate + HandTracker + ritmo de reposo."""
+        if self._take_reset("track", job):
+            # Tras un hueco: ni el resultado, ni el ROI, ni el flujo óptico,
+            # ni las identidades de las manos valen para el frame nuevo
+            self._last_hands = ({}, {}, {})
+            self._tracker.reset()
+            if self._gate is not None:
+                self._gate.reset()
+        with self._tier_lock:
+            tier, self._pending_tier = self._pending_tier, None
+        if tier is not None:
+            self._apply_tier(tier)
+
+        # Publicar antes del tracker: otros procesos reciben el frame limpio
+        if self._broadcast is not None:
+            self._publish(job.buf.array, job.timing)
 
-        while self._running:
-            frame = self._camera.read()
-            if frame is None:
-                self.status_msg.emit("[WARN] Frame vacío — reintentando")
-                time.sleep(0.05)
+        job.hands_data, job.hands_raw, job.hand_ids = self._track(job.buf.array, job.timing)
+        self._update_idle(bool(job.hands_data), job.timing.capture_ts)
+        return job
+
+    def _stage_classify(self, job: "_FrameJob") -> "_FrameJob":
+        """Clasificación + estabilización temporal."""
+        if self._take_reset("classify", job):
+            self._stabilizer.reset()
+            for stabilizer in self._hand_stabilizers.values():
+                stabilizer.reset()
+
+        if job.hands_data and self._hand_stabilizers:
+            job.raw_state, job.confidence, job.hand_results = self._classifier.predict_hands(
+                job.hands_data, job.timing
+            )
+        elif job.hands_data:
+            job.raw_state, job.confidence = self._classifier.predict(job.hands_data, job.timing)
+
+        self._stabilizer.update(job.raw_state, job.confidence, job.timing)
+        job.current = self._stabilizer.current or HandState.NO_HANDS
+
+        # Cada mano con su propio filtro; una mano que desaparece vuelve a empezar
+        for side, stabilizer in self._hand_stabilizers.items():
+            result = job.hand_results.get(side)
+            if result is None:
+                stabilizer.reset()
                 continue
+            stabilizer.update(*result, job.timing)
+            if stabilizer.current is not None:
+                job.hand_states[side] = stabilizer.current
+        return job
 
-            # Track + classify
-            hands_data, hands_raw = self._tracker.process(frame)
+    def _stage_output(self, job: "_FrameJob") -> None:
+        """Gestos (en orden de captura), caja negra, UI y estadísticas."""
+        if job.timing.seq <= self._last_seq:
+            # Nunca debería ocurrir (colas FIFO); los gestos no toleran desorden
+            self._stats.count("out_of_order")
+            self._drop_job(job)
+            return
+        self._last_seq = job.timing.seq
+        if self._take_reset("output", job):
+            self._manager.reset_all()
 
-            if hands_data:
-                raw_state, confidence = self._classifier.predict(hands_data)
-            else:
-                raw_state, confidence = HandState.NO_HANDS, 1.0
-
-            # Stabilise
-            self._stabilizer.update(raw_state, confidence)
-            current = self._stabilizer.current or HandState.NO_HANDS
-
-            # Notificar cambio de estado
-            if current != prev_stable:
-                self.status_msg.emit(f"[STATE] {prev_stable} → {current}")
-                prev_stable = current
-
-            self.state_changed.emit(current, raw_state, confidence)
-
-            # Gestos
-            if current not in (HandState.NO_HANDS, HandState.UNKNOWN):
-                frame_data = FrameData(
-                    state=current,
-                    hands=hands_data,
-                    hands_raw=hands_raw,
-                    timestamp=time.time(),
-                )
+        timing  = job.timing
+        current = job.current
+
+        # Notificar cambio de estado
+        if current != self._prev_stable:
+            self.status_msg.emit(f"[STATE] {self._prev_stable} → {current}")
+            self._prev_stable = current
+
+        self.state_changed.emit(current, job.raw_state, job.confidence)
+
+        # Gestos
+        events: list[GestureEvent] = []
+        if current not in (HandState.NO_HANDS, HandState.UNKNOWN):
+            frame_data = FrameData(
+                state=current,
+                hands=job.hands_data,
+                hands_raw=job.hands_raw,
+                hand_ids=job.hand_ids,
+                hand_states=job.hand_states,
+                timestamp=timing.capture_ts,
+                timing=timing,
+            )
+            with timing.stage("gestures"):
                 events = self._manager.process(frame_data)
-                for event in events:
-                    self.status_msg.emit(f"[EVENT] {event.value}")
-                    self.event_fired.emit(event)
+            for event in events:
+                self.status_msg.emit(f"[EVENT] {event.value}")
+                self.event_fired.emit(event)
+
+        # Caja negra: miniatura + landmarks + decisiones del frame
+        if self._recorder is not None:
+            with timing.stage("record"):
+                self._recorder.record(
+                    job.buf.array, timing.capture_ts, timing.seq, job.hands_data,
+                    job.raw_state, current, job.confidence, events,
+                )
+
+        # Emitir frame para la UI solo si se está mostrando: referencia
+        # extra en vez de copia; el buffer vuelve al pool cuando la UI
+        # lo libera. Con la ventana oculta no hay coste de render.
+        if self._preview:
+            self.frame_ready.emit(job.buf.retain(), hand_points(job.hands_raw))
+        job.release()
+
+        self._update_budget(timing)
+        self._stats.add_frame(timing)
+        if self._stats.due():
+            if self._pipeline is not None:
+                for name, value in self._pipeline.stats().items():
+                    self._stats.set(name, value)
+            for name, value in self._classifier.stats().items():
+                self._stats.set(name, value)
+            self.stats_ready.emit(self._stats.snapshot())
+
+    # ------------------------------------------------------------------
+    def _track(self, frame, timing: FrameTiming) -> tuple[HandsData, HandsRaw, HandIds]:
+        """
+        Corre HandTracker salvo que el motion gate indique que la escena
+        no cambió; en ese caso reutiliza el resultado anterior.
+        """
+        if self._gate is not None:
+            with timing.stage("gate"):
+                run = self._gate.should_run(frame, timing.capture_ts)
+            if not run:
+                self._stats.count("gate_skipped")
+                self._stats.count("gate_saved_ms", 1000.0 * self._track_cost)
+                return self._last_hands
+
+        with self._tracker_lock:
+            self._last_hands = self._tracker.process(frame, timing)
+            propagated = self._tracker.propagated
+        if propagated:
+            self._stats.count("flow_frames")
+        cost = timing.stages.get("track", 0.0)
+        self._track_cost = cost if self._track_cost == 0.0 else 0.9 * self._track_cost + 0.1 * cost
+        return self._last_hands
 
-            # Emitir frame para la UI (copia para thread-safety)
-            self.frame_ready.emit(frame.copy())
+    def _publish(self, frame, timing: FrameTiming) -> None:
+        """Copia el frame al anillo compartido; si falla, desactiva el broadcast."""
+        try:
+            with timing.stage("broadcast"):
+                self._broadcast.publish(frame, timing.capture_ts)
+        except OSError as exc:
+            self.status_msg.emit(f"[WARN] Broadcast desactivado: {exc}")
+            self._broadcast.close()
+            self._broadcast = None
+
+    def _on_capture_gap(self) -> None:
+        """Sin frame: avisa una sola vez por corte en vez de cada 50 ms."""
+        if not self._camera.connected and not self._camera_lost:
+            self._camera_lost = True
+            self.status_msg.emit("[CAMERA] Cámara desconectada — reintentando conexión")
+        elif not self._capture_gap:
+            self.status_msg.emit("[WARN] Frame vacío — reintentando")
+        self._capture_gap = True
+
+    def _on_capture_resumed(self) -> None:
+        """
+        Vuelven los frames: solo se reinicia el estado temporal; tracker,
+        clasificador y gestor de gestos siguen vivos.
+        """
+        if self._camera_lost:
+            self.status_msg.emit(
+                f"[CAMERA] Cámara reconectada (reconexiones: {self._camera.reconnects})"
+            )
+        self._capture_gap = False
+        self._camera_lost = False
+        # El reinicio de gate / estabilizador / gestos lo hace cada etapa
+        # al ver job.resumed, en su propio hilo y en orden.
+
+    def _update_budget(self, timing: FrameTiming) -> None:
+        """
+        Alimenta al BudgetGovernor con el coste de procesamiento del frame.
+        Solo cuentan frames que pasaron por el tracker y fuera de reposo.
+        El coste es track + classify: gestos, grabación o broadcast no
+        dependen del nivel de calidad, y con el pipeline activo sus etapas
+        corren en paralelo y sumarlas exageraría la carga.
+        """
+        if self._budget is None or "track" not in timing.stages:
+            return
+        if self._idle is not None and self._idle.idle:
+            return
+        cost = timing.stages["track"] + timing.stages.get("classify", 0.0)
+        tier = self._budget.update(cost, timing.capture_ts)
+        self._stats.set("load", self._budget.load)
+        if tier is not None:
+            self.status_msg.emit(
+                f"[BUDGET] Nivel {tier.name}: {tier.fps:g} fps, "
+                f"entrada {tier.input_side or 'completa'}, modelo {tier.model_complexity}"
+            )
+            self._request_tier(tier)
+
+    def _request_tier(self, tier: QualityTier) -> None:
+        """Encola un nivel para la etapa track (el último pedido gana)."""
+        with self._tier_lock:
+            self._pending_tier = tier
+
+    def _apply_tier(self, tier: QualityTier) -> None:
+        """Solo desde la etapa track: comparte hilo con _update_idle."""
+        if self._idle is not None:
+            self._idle.set_active_fps(tier.fps)
+        if self._idle is None or not self._idle.idle:
+            self._camera.set_fps_limit(tier.fps)
+        with self._tracker_lock:
+            self._tracker.set_max_input_side(tier.input_side)
+            self._tracker.set_model_complexity(tier.model_complexity)
+        error = apply_thread_limits(tier)
+        if error is not None:
+            self.status_msg.emit(f"[WARN] Nivel {tier.name} aplicado solo en parte: {error}")
+        self.tier_changed.emit(tier.name)
+
+    def _update_idle(self, hands_present: bool, now: float) -> None:
+        """Ajusta el ritmo de captura según la presencia de manos."""
+        if self._idle is None:
+            return
+        transition = self._idle.update(hands_present, now)
+        if transition is None:
+            return
+        self._camera.set_fps_limit(self._idle.fps)
+        self._stats.set("idle", float(self._idle.idle))
+        if transition == IdleGovernor.IDLE:
+            self.status_msg.emit(f"[POWER] Sin manos — reposo a {self._idle.fps:g} fps")
+        else:
+            self.status_msg.emit(f"[POWER] Mano detectada — ritmo completo {self._idle.fps:g} fps")
+
+    def set_preview_enabled(self, enabled: bool) -> None:
+        """Activa/desactiva la emisión de frame_ready (ventana visible u oculta)."""
+        self._preview = enabled
+
+    def dump_recording(self) -> None:
+        """
+        Guarda la caja negra en disco (llamable desde el hilo de la UI).
+        La codificación corre en un hilo aparte; el resultado llega por status_msg.
+        """
+        if self._recorder is None:
+            self.status_msg.emit("[WARN] Grabación no disponible")
+            return
+
+        def done(path, error) -> None:
+            if error is not None:
+                self.status_msg.emit(f"[ERROR] Grabación: {error}")
+            else:
+                self.status_msg.emit(f"[RECORD] Grabación guardada en {path}")
 
-        # Cleanup
-        self._cleanup()
+        out = self._recorder.dump(self._config.recorder_dir, on_done=done)
+        if out is None:
+            self.status_msg.emit("[WARN] Grabación vacía o en curso")
 
     # ------------------------------------------------------------------
     def stop(self) -> None:
@@ -125,8 +583,16 @@ class CameraWorker(QThread):
         self.wait(3000)  # espera hasta 3s a que termine
 
     def _cleanup(self) -> None:
+        if self._pipeline:
+            self._pipeline.stop()
+            self._pipeline = None
         if self._camera:
             self._camera.release()
+            self._camera = None
         if self._tracker:
             self._tracker.release()
+            self._tracker = None
+        if self._broadcast:
+            self._broadcast.close()
+            self._broadcast = None
         self.status_msg.emit("🛑 Pipeline detenido")
\ No newline at end of file
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional, Tuple
 
 
 @dataclass
@@ -10,17 +11,88 @@ class AppConfig:
     No more scattered module-level constants.
     """
     # ---- paths ---------------------------------------------------------
-    model_path: Path = Path("models/hand_state_rf.pkl")
+    model_path: Path = Path("models/hand_state_rf.pkl")   # o .gkm (tools/convert_model.py)
 
     # ---- camera --------------------------------------------------------
     camera_device: int = 0
     fps_limit: int = 30
+    camera_threaded: bool = True     # grabber thread, latest-frame-wins
+    camera_buffer_size: int = 1      # CAP_PROP_BUFFERSIZE (0 = backend default)
+
+    # ---- idle low-power mode ------------------------------------------
+    idle_enabled: bool = False
+    idle_after: float = 10.0         # segundos sin manos antes de bajar el ritmo
+    idle_fps: float = 2.0            # ritmo de comprobación de presencia en reposo
+
+    # ---- motion gate (reutiliza HandsData en escenas estáticas) --------
+    motion_gate_enabled: bool = False
+    motion_gate_threshold: int = 8      # diferencia mínima de gris por píxel
+    motion_gate_min_changed: int = 3    # píxeles cambiados (miniatura 64x48)
+    motion_gate_max_age: float = 0.5    # segundos máximos reutilizando un resultado
+
+    # ---- CPU budget governor (niveles de calidad) ---------------------
+    budget_enabled: bool = False
+    budget_cpu_share: float = 0.6        # fracción de un núcleo para el pipeline
+    budget_deadline_ms: float = 0.0      # deadline fijo por frame (0 = usa cpu_share)
+
+    # ---- hand tracker input reduction -------------------------------
+    tracker_max_input_side: int = 0      # reescala frames completos (0 = desactivado)
+    tracker_roi_enabled: bool = False    # recorta alrededor de las manos previas
+    tracker_roi_margin: float = 0.25
+    tracker_roi_rescan: int = 15         # frames entre escaneos completos
+    tracker_roi_input_side: int = 256
+    tracker_keyframe_interval: int = 0   # MediaPipe cada k frames + optical flow (0 = siempre)
+    tracker_flow_max_error: float = 1.5  # error forward-backward (px) que fuerza re-detección
+    tracker_process: bool = False        # HandTracker en un proceso aparte (memoria compartida)
+
+    # ---- pipelined execution (track / classify / output en hilos) -----
+    pipeline_enabled: bool = False               # False = las tres etapas en el hilo del worker
+    pipeline_queue_size: int = 2                 # frames en espera por etapa
+    pipeline_track_policy: str = "coalesce"      # drop_oldest | block | coalesce
+    pipeline_classify_policy: str = "drop_oldest"
+    pipeline_output_policy: str = "block"        # los gestos ven todos los frames clasificados
+
+    # ---- frame source (webcam / recordings / synthetic) ---------------
+    camera_source: str = "device"              # device | video | images | synthetic
+    camera_source_path: Optional[Path] = None  # video file or image directory
+    camera_pacing: str = "realtime"            # realtime | fast
+    camera_loop: bool = False
+    synthetic_size: Tuple[int, int] = (640, 480)
+
+    # ---- flight recorder (caja negra de los últimos segundos) ---------
+    recorder_enabled: bool = False
+    recorder_seconds: float = 10.0
+    recorder_thumb_size: Tuple[int, int] = (160, 120)
+    recorder_dir: Path = Path("recordings")
+
+    # ---- frame broadcast (memoria compartida para otros procesos) -----
+    broadcast_enabled: bool = False
+    broadcast_name: str = "gesturekey-frames"  # nombre del segmento compartido
+    broadcast_slots: int = 4                   # frames en el anillo
 
     # ---- classifier / stabilizer ---------------------------------------
+    classifier_backend: str = "compiled"   # compiled | sklearn | knn | mlp (.npz en model_path)
+    classifier_cache_enabled: bool = False # reutiliza el resultado mientras la pose no cambia
+    classifier_cache_size: int = 64
+    classifier_cache_max_age: float = 0.5  # s que un resultado puede reutilizarse
+    classifier_cache_dist_step: float = 0.02   # cuantización de distancias (unidades normalizadas)
+    classifier_cache_angle_step: float = 5.0   # cuantización de ángulos (grados)
+    classifier_early_exit: bool = False    # el bosque deja de votar cuando el estado ya está decidido (solo backend sklearn)
+    classifier_early_exit_chunk: int = 16  # árboles por paso
+    classifier_early_exit_margin: Optional[float] = None   # ventaja mínima (fracción); None = salida exacta
+    classifier_fast_path: str = "off"      # off | on | shadow (reglas geométricas FIST / PALM; experimental: validar en "shadow" antes de "on")
+    fast_path_fist_max_dist: float = 1.0   # distancia muñeca→punta máxima (dedos) para FIST
+    fast_path_fist_max_angle: float = 120.0  # ángulo de articulación máximo (grados) para FIST
+    fast_path_palm_min_dist: float = 1.4   # distancia muñeca→punta mínima (dedos) para PALM
+    fast_path_palm_min_angle: float = 155.0  # ángulo mínimo de los cinco dedos para PALM
+    classifier_per_hand: bool = False      # estado de cada mano (FrameData.hand_states); lote de 3 filas con dos manos (~+70% de coste)
     min_confidence: float = 0.60
     state_window: int = 4
     state_consensus: int = 2
 
+    # ---- diagnostics ---------------------------------------------------
+    stats_interval: float = 1.0      # segundos entre snapshots de PipelineStats
+
     # ---- global cooldown (seconds) ------------------------------------
     cooldown: float = 0.6
 
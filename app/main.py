@@ -45,6 +45,12 @@ def main() -> None:
         cooldown=0.6,
     )
 
+    # Con el backend compilado preferir el modelo convertido (.gkm, se mapea
+    # sin deserializar); sklearn necesita el .pkl original
+    converted = config.model_path.with_suffix(".gkm")
+    if config.classifier_backend == "compiled" and converted.exists():
+        config.model_path = converted
+
     tray = TrayApp(config)
     tray.start()
 
@@ -39,6 +39,7 @@ class TrayApp:
         # ---- Worker en hilo separado ---------------------------------
         self._worker = CameraWorker(config)
         self._connect_worker()
+        self._window.visibility_changed.connect(self._on_window_visibility)
 
         # ---- System tray --------------------------------------------
         self._tray = QSystemTrayIcon()
@@ -104,8 +105,18 @@ class TrayApp:
         self._act_status.setEnabled(False)
         menu.addAction(self._act_status)
 
+        self._act_tier = QAction("Calidad: —", menu)
+        self._act_tier.setEnabled(False)
+        self._act_tier.setVisible(self._config.budget_enabled)
+        menu.addAction(self._act_tier)
+
         menu.addSeparator()
 
+        self._act_record = QAction("Guardar grabación", menu)
+        self._act_record.triggered.connect(self._dump_recording)
+        self._act_record.setVisible(self._config.recorder_enabled)
+        menu.addAction(self._act_record)
+
         act_restart = QAction("Reiniciar pipeline", menu)
         act_restart.triggered.connect(self._restart_pipeline)
         menu.addAction(act_restart)
@@ -122,10 +133,13 @@ class TrayApp:
     # Conexión de señales worker → UI
     # ------------------------------------------------------------------
     def _connect_worker(self) -> None:
+        self._worker.set_preview_enabled(self._window.isVisible())
         self._worker.frame_ready.connect(self._window.on_frame)
         self._worker.state_changed.connect(self._on_state_changed)
         self._worker.event_fired.connect(self._window.on_event)
         self._worker.status_msg.connect(self._window.on_status)
+        self._worker.stats_ready.connect(self._window.on_stats)
+        self._worker.tier_changed.connect(self._on_tier_changed)
 
     # ------------------------------------------------------------------
     # Slots
@@ -151,6 +165,10 @@ class TrayApp:
         self._window.activateWindow()
         self._act_show.setText(" Ocultar cámara")
 
+    def _on_window_visibility(self, visible: bool) -> None:
+        """Con la ventana oculta el worker no emite frames (sin coste de render)."""
+        self._worker.set_preview_enabled(visible)
+
     def _on_state_changed(
         self, stable: HandState, raw: HandState, confidence: float
     ) -> None:
@@ -164,6 +182,21 @@ class TrayApp:
         self._tray.setIcon(make_status_icon(state_str))
         self._act_status.setText(f" Estado: {state_str}  ({confidence*100:.0f}%)")
 
+    def _on_tier_changed(self, tier: str) -> None:
+        """Nivel de calidad elegido por el BudgetGovernor."""
+        self._window.on_tier(tier)
+        self._act_tier.setText(f" Calidad: {tier}")
+
+    def _dump_recording(self) -> None:
+        """Vuelca la caja negra del worker (últimos segundos) a disco."""
+        self._worker.dump_recording()
+        self._tray.showMessage(
+            "Gesture Control",
+            f"Guardando grabación en {self._config.recorder_dir}…",
+            QSystemTrayIcon.MessageIcon.Information,
+            1500,
+        )
+
     def _restart_pipeline(self) -> None:
         self._worker.stop()
         self._worker = CameraWorker(self._config)
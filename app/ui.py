@@ -4,12 +4,14 @@ OpenCVUI — all rendering logic isolated from detection and business logic.
 The pipeline never calls cv2 directly — it delegates to this class.
 """
 from __future__ import annotations
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 import cv2
+import numpy as np
 
 from domain.enums import HandState
 from app.config import AppConfig
+from core.overlay import draw_hands
 
 _STATE_COLORS = {
     HandState.PALM:          (0,   255,  0),
@@ -30,6 +32,7 @@ class OpenCVUI:
     def __init__(self, config: AppConfig, window_name: str = "Gesture Control") -> None:
         self._cfg  = config
         self._name = window_name
+        self._mirror: Optional[Any] = None   # flip target reused across render() calls
 
     def render(
         self,
@@ -38,11 +41,17 @@ class OpenCVUI:
         raw_state: HandState,
         confidence: float,
         state_buffer: Any,      # deque / sequence of HandState
+        hands: Sequence[np.ndarray] = (),   # core.overlay.hand_points()
     ) -> None:
-        """Flip frame, draw overlays, show window."""
-        frame = cv2.flip(frame, 1)
+        """Flip frame, draw overlays, show window. ``frame`` is not modified."""
+        if self._mirror is None or self._mirror.shape != frame.shape:
+            self._mirror = frame.copy()
+        frame = cv2.flip(frame, 1, dst=self._mirror)
         h, w = frame.shape[:2]
 
+        # Hand skeletons (only drawn for frames that are actually shown)
+        draw_hands(frame, hands, mirrored=True)
+
         # Centre divider
         cv2.line(frame, (w // 2, 0), (w // 2, h), (255, 255, 255), 2)
 
@@ -0,0 +1,179 @@
+"""
+Utilidades compartidas por los benchmarks del clasificador de estados.
+
+Si no se indica un modelo entrenado (models/hand_state_rf.pkl no está en
+el repositorio) se entrena uno sintético con el mismo esquema de
+FEATURE_NAMES y las mismas clases sobre manos sintéticas etiquetadas
+(dedos extendidos / doblados según el estado), suficiente para medir
+latencias y comparar modelos entre sí.
+"""
+from __future__ import annotations
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Asegurar que el root del proyecto esté en el path
+_ROOT = Path(__file__).parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from core.state_classifier import FEATURE_NAMES, _extract_features
+from domain.enums import HandState
+from domain.models import HandsData
+
+DEFAULT_MODEL = _ROOT / "models" / "hand_state_rf.pkl"
+
+_CLASSES = [s.value for s in HandState if s not in (HandState.UNKNOWN, HandState.NO_HANDS)]
+
+
+# Dedos extendidos por estado (THUMB, INDEX, MIDDLE, RING, PINKY)
+_EXTENDED = {
+    "PALM":          (1, 1, 1, 1, 1),
+    "FIST":          (0, 0, 0, 0, 0),
+    "PINCH":         (1, 1, 0, 0, 0),   # pulgar e índice se tocan
+    "TWO_FINGERS":   (0, 1, 1, 0, 0),
+    "THREE_FINGERS": (0, 1, 1, 1, 0),
+    "FOUR_FINGERS":  (0, 1, 1, 1, 1),
+}
+_FINGER_ANGLE = np.radians([150, 105, 90, 75, 60])   # dirección de cada dedo (y hacia arriba)
+_FINGER_BASE  = [0.12, 0.25, 0.25, 0.24, 0.22]       # muñeca → nudillo
+_SEGMENTS     = [0.07, 0.06, 0.05]
+
+
+def synthetic_hand(state: str, rng: np.random.Generator) -> np.ndarray:
+    """Mano (21, 3) float32 normalizada en la pose de ``state``, con rotación, escala y ruido."""
+    hand = np.zeros((21, 3), dtype=np.float32)
+    for f, (angle, base, extended) in enumerate(zip(_FINGER_ANGLE, _FINGER_BASE, _EXTENDED[state])):
+        direction = np.array([np.cos(angle), -np.sin(angle)])
+        point = base * direction
+        hand[1 + 4 * f, :2] = point
+        # Doblado: cada falange gira ~70° hacia la palma (con variación por mano)
+        bend = np.radians(rng.normal(5, 12) if extended else rng.normal(60, 25)) * (1 if f else -1)
+        heading = angle
+        for j, seg in enumerate(_SEGMENTS):
+            heading -= bend if f else -bend
+            point = point + seg * np.array([np.cos(heading), -np.sin(heading)])
+            hand[2 + 4 * f + j, :2] = point
+    if state == "PINCH":
+        hand[8, :2] = hand[4, :2] + rng.normal(0, 0.01, 2)
+    theta = rng.normal(0, np.radians(12))
+    rot = np.array([[np.cos(theta), -np.sin(theta)], [np.sin(theta), np.cos(theta)]])
+    hand[:, :2] = rng.uniform(0.8, 1.2) * hand[:, :2] @ rot.T
+    hand += rng.normal(0, 0.02, hand.shape).astype(np.float32)
+    # Misma normalización que HandTracker: muñeca en el origen, muñeca→MCP medio = 1
+    hand -= hand[0]
+    hand /= max(float(np.hypot(*hand[9, :2])), 1e-6)
+    return hand
+
+
+def synthetic_dataset(n: int, seed: int = 0) -> Tuple[List[HandsData], np.ndarray]:
+    """Frames etiquetados: mano derecha en un estado aleatorio, a veces también la izquierda."""
+    rng = np.random.default_rng(seed)
+    labels = rng.choice(_CLASSES, size=n)
+    frames: List[HandsData] = []
+    for state in labels:
+        hands = {"Right": synthetic_hand(state, rng)}
+        if rng.random() < 0.3:
+            hands["Left"] = synthetic_hand(state, rng)
+        frames.append(hands)
+    return frames, labels
+
+
+def random_hands(n: int, seed: int = 0) -> List[HandsData]:
+    """Frames sin etiqueta para medir latencias."""
+    return synthetic_dataset(n, seed)[0]
+
+
+def load_frames(path: Path) -> Tuple[List[HandsData], np.ndarray]:
+    """
+    Frames y etiquetas de un .npz en orden temporal.
+
+    Formato: landmarks (n, 2, 21, 3) con NaN si la mano no está, sides
+    (por defecto Right, Left) y labels (n,); si faltan labels se usan
+    stable + state_names, así una grabación de la caja negra sirve tal cual.
+    Los frames sin manos se omiten.
+    """
+    with np.load(path, allow_pickle=False) as data:
+        landmarks = data["landmarks"]
+        sides = [str(s) for s in data["sides"]] if "sides" in data else ["Right", "Left"]
+        if "labels" in data:
+            labels = data["labels"].astype(str)
+        else:
+            labels = data["state_names"].astype(str)[data["stable"]]
+    frames: List[HandsData] = []
+    keep: List[int] = []
+    for i, hands in enumerate(landmarks):
+        present = {side: hands[k] for k, side in enumerate(sides) if not np.isnan(hands[k, 0, 0])}
+        if present:
+            frames.append(present)
+            keep.append(i)
+    return frames, labels[keep]
+
+
+def features_of(hands: HandsData) -> np.ndarray:
+    return np.concatenate((_extract_features(hands.get("Left")), _extract_features(hands.get("Right"))))
+
+
+def train_forest(X: np.ndarray, y: np.ndarray, n_estimators: int = 100, seed: int = 0):
+    """
+    RandomForest con el esquema FEATURE_NAMES, sin pandas: se entrena sobre
+    el ndarray y se fijan los nombres de columna como lo haría un DataFrame.
+    """
+    from sklearn.ensemble import RandomForestClassifier
+
+    model = RandomForestClassifier(n_estimators=n_estimators, random_state=seed)
+    model.fit(X, y)
+    model.feature_names_in_ = np.array(FEATURE_NAMES, dtype=object)
+    return model
+
+
+def synthetic_model_path(n_estimators: int = 100, samples: int = 4000, seed: int = 0) -> Path:
+    """Entrena un RandomForest sintético con el esquema real y lo guarda en un .pkl temporal."""
+    import joblib
+
+    frames, y = synthetic_dataset(samples, seed)
+    X = np.array([features_of(h) for h in frames])
+    model = train_forest(X, y, n_estimators, seed)
+
+    path = Path(tempfile.gettempdir()) / f"gesturekey_synthetic_rf_v3_{n_estimators}_{seed}.pkl"
+    joblib.dump(model, path)
+    return path
+
+
+def resolve_model(path: Optional[Path]) -> Path:
+    """El modelo indicado, el del proyecto si existe, o uno sintético."""
+    if path is not None:
+        return path
+    if DEFAULT_MODEL.exists():
+        return DEFAULT_MODEL
+    print(f"[INFO] {DEFAULT_MODEL} no existe — usando un RandomForest sintético")
+    return synthetic_model_path()
+
+
+def time_calls(fn: Callable[[object], object], items: Sequence[object], warmup: int = 50) -> Dict[str, float]:
+    """Latencia por llamada en µs: media, p50 y p99."""
+    for item in items[:warmup]:
+        fn(item)
+    samples = np.empty(len(items))
+    for i, item in enumerate(items):
+        t0 = time.perf_counter()
+        fn(item)
+        samples[i] = time.perf_counter() - t0
+    samples *= 1e6
+    return {
+        "mean_us": float(samples.mean()),
+        "p50_us": float(np.percentile(samples, 50)),
+        "p99_us": float(np.percentile(samples, 99)),
+    }
+
+
+def print_table(rows: Dict[str, Dict[str, float]]) -> None:
+    keys = list(next(iter(rows.values())).keys())
+    width = max(len(name) for name in rows)
+    print(f"{'':<{width}}  " + "  ".join(f"{k:>12}" for k in keys))
+    for name, row in rows.items():
+        print(f"{name:<{width}}  " + "  ".join(f"{row[k]:>12.2f}" for k in keys))
@@ -0,0 +1,134 @@
+"""
+backend_compare.py — precisión y coste de cada backend del clasificador.
+
+Entrena k-NN y MLP sobre la parte de entrenamiento del dataset, los
+exporta a .npz y carga cada backend por la misma vía que StateClassifier
+(open_backend). Sobre la parte de test informa de precisión, matriz de
+confusión por estado, tamaño del modelo, tiempo de carga y latencia
+p50/p99 por frame, para elegir el modelo más barato que cumpla el umbral.
+
+Dataset: .npz con landmarks + labels, o una grabación de la caja negra
+(ver _common.load_frames). Sin --dataset se usan manos sintéticas
+etiquetadas.
+
+Uso:
+    python benchmarks/backend_compare.py [--dataset rec.npz] [--model models/hand_state_rf.pkl]
+"""
+from __future__ import annotations
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from _common import FEATURE_NAMES, features_of, load_frames, print_table, synthetic_dataset, time_calls, train_forest
+from core.classifier_backends import KNNBackend, MLPBackend, open_backend
+
+_IGNORED = {"NO HANDS", "UNKNOWN"}
+
+
+def load_dataset(path: Path) -> Tuple[np.ndarray, np.ndarray]:
+    """Filas FEATURE_NAMES (n, 20) float32 y etiquetas (n,), sin estados vacíos."""
+    frames, labels = load_frames(path)
+    keep = [i for i, label in enumerate(labels) if label not in _IGNORED]
+    X = np.array([features_of(frames[i]) for i in keep], dtype=np.float32)
+    return X, labels[keep]
+
+
+def split(X: np.ndarray, y: np.ndarray, test: float, seed: int) -> Tuple[np.ndarray, ...]:
+    order = np.random.default_rng(seed).permutation(len(X))
+    cut = int(len(X) * (1.0 - test))
+    return X[order[:cut]], y[order[:cut]], X[order[cut:]], y[order[cut:]]
+
+
+def train_models(X: np.ndarray, y: np.ndarray, out: Path, rf: Path | None, k: int, hidden: int) -> Dict[str, Path]:
+    """Entrena los modelos que falten y devuelve {backend: ruta}."""
+    import joblib
+
+    if rf is None:
+        rf = out / "rf.pkl"
+        joblib.dump(train_forest(X, y), rf)
+
+    knn = out / "knn.npz"
+    KNNBackend.fit(X, y, FEATURE_NAMES, k=k).save(knn)
+
+    mlp = out / "mlp.npz"
+    MLPBackend.fit(X, y, FEATURE_NAMES, hidden=(hidden, hidden)).save(mlp)
+
+    return {"sklearn": rf, "compiled": rf, "knn": knn, "mlp": mlp}
+
+
+def confusion(y_true: np.ndarray, y_pred: np.ndarray, classes: List[str]) -> np.ndarray:
+    index = {c: i for i, c in enumerate(classes)}
+    matrix = np.zeros((len(classes), len(classes)), dtype=int)
+    for t, p in zip(y_true, y_pred):
+        matrix[index[t], index[p]] += 1
+    return matrix
+
+
+def print_confusion(name: str, matrix: np.ndarray, classes: List[str]) -> None:
+    short = [c[:6] for c in classes]
+    width = max(len(c) for c in classes)
+    print(f"\n{name} (filas = real, columnas = predicho)")
+    print(f"{'':<{width}}  " + " ".join(f"{c:>6}" for c in short) + "  recall")
+    for c, row in zip(classes, matrix):
+        recall = row[classes.index(c)] / max(row.sum(), 1)
+        print(f"{c:<{width}}  " + " ".join(f"{v:>6}" for v in row) + f"  {recall:6.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dataset", type=Path, default=None)
+    parser.add_argument("--model", type=Path, default=None, help="Random Forest entrenado (.pkl)")
+    parser.add_argument("--test", type=float, default=0.3, help="fracción de test")
+    parser.add_argument("--samples", type=int, default=6000, help="tamaño del dataset sintético")
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--hidden", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.dataset is not None:
+        X, y = load_dataset(args.dataset)
+    else:
+        print("[INFO] Sin --dataset — usando manos sintéticas etiquetadas")
+        frames, y = synthetic_dataset(args.samples, args.seed)
+        X = np.array([features_of(h) for h in frames], dtype=np.float32)
+    X_train, y_train, X_test, y_test = split(X, y, args.test, args.seed)
+    classes = sorted(set(y))
+    print(f"[INFO] {len(X_train)} filas de entrenamiento, {len(X_test)} de test, {len(classes)} estados")
+
+    rows: Dict[str, Dict[str, float]] = {}
+    matrices: Dict[str, np.ndarray] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = train_models(X_train, y_train, Path(tmp), args.model, args.k, args.hidden)
+        for kind, path in paths.items():
+            t0 = time.perf_counter()
+            try:
+                backend = open_backend(kind, path)
+            except TypeError as exc:
+                print(f"[WARN] {kind}: {exc}")
+                continue
+            load_ms = 1000.0 * (time.perf_counter() - t0)
+
+            pred = backend.classes_.astype(str)[backend.predict_proba(X_test).argmax(axis=1)]
+            latency = time_calls(backend.predict_proba, [X_test[i:i + 1] for i in range(min(len(X_test), 1000))])
+            rows[kind] = {
+                "accuracy": float((pred == y_test).mean()),
+                "size_kb": backend.nbytes / 1024.0,
+                "file_kb": path.stat().st_size / 1024.0,
+                "load_ms": load_ms,
+                "p50_us": latency["p50_us"],
+                "p99_us": latency["p99_us"],
+            }
+            matrices[kind] = confusion(y_test, pred, classes)
+
+    print()
+    print_table(rows)
+    for kind, matrix in matrices.items():
+        print_confusion(kind, matrix, classes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+cache_bench.py — FeatureCache frente a la ruta sin caché.
+
+Recorre secuencias de poses sostenidas (manos sintéticas con temblor
+frame a frame, o una grabación de la caja negra en orden) con un reloj
+de captura a --fps, primero sin caché y luego con varias resoluciones de
+cuantización. Para cada una informa de tasa de aciertos, coste medio por
+frame, tiempo ahorrado y concordancia de estado/confianza con la ruta
+sin caché, para elegir el paso más grueso que no cambie decisiones.
+
+Uso:
+    python benchmarks/cache_bench.py [--model ...] [--dataset rec.npz] [--fps 30]
+"""
+from __future__ import annotations
+import argparse
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+
+from _common import _CLASSES, load_frames, print_table, resolve_model, synthetic_hand
+from core.feature_cache import FeatureCache
+from core.state_classifier import StateClassifier
+from domain.enums import HandState
+from domain.models import FrameTiming, HandsData
+
+_STEPS = [(0.01, 2.0), (0.02, 5.0), (0.03, 8.0), (0.05, 12.0)]   # (dist_step, angle_step)
+
+
+def held_poses(segments: int, seed: int = 0) -> List[HandsData]:
+    """Poses sostenidas 1-3 s con temblor y deriva lenta, como al hacer scroll."""
+    rng = np.random.default_rng(seed)
+    frames: List[HandsData] = []
+    for _ in range(segments):
+        base = synthetic_hand(str(rng.choice(_CLASSES)), rng)
+        drift = rng.normal(0, 0.0005, (1, 3)).astype(np.float32)
+        for t in range(int(rng.integers(30, 90))):
+            jitter = rng.normal(0, 0.002, base.shape).astype(np.float32)
+            frames.append({"Right": base + t * drift + jitter})
+    return frames
+
+
+def run(classifier: StateClassifier, frames: List[HandsData], fps: float) -> Tuple[List[Tuple[HandState, float]], float]:
+    """Resultados por frame y µs medios de predict()."""
+    results = []
+    t0 = time.perf_counter()
+    for i, hands in enumerate(frames):
+        results.append(classifier.predict(hands, FrameTiming(capture_ts=i / fps, seq=i)))
+    return results, 1e6 * (time.perf_counter() - t0) / len(frames)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", type=Path, default=None)
+    parser.add_argument("--backend", default="compiled")
+    parser.add_argument("--dataset", type=Path, default=None, help="grabación en orden temporal")
+    parser.add_argument("--segments", type=int, default=40)
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--max-age", type=float, default=0.5)
+    parser.add_argument("--size", type=int, default=64)
+    args = parser.parse_args()
+
+    model_path = resolve_model(args.model)
+    frames = load_frames(args.dataset)[0] if args.dataset else held_poses(args.segments)
+
+    reference, ref_us = run(StateClassifier(model_path, args.backend), frames, args.fps)
+    rows = {"sin caché": {"hit_rate": 0.0, "us_frame": ref_us, "saved_ms": 0.0,
+                          "agree": 1.0, "conf_diff": 0.0}}
+
+    for dist_step, angle_step in _STEPS:
+        cache = FeatureCache(dist_step=dist_step, angle_step=angle_step,
+                             max_size=args.size, max_age=args.max_age)
+        results, us = run(StateClassifier(model_path, args.backend, cache=cache), frames, args.fps)
+        stats = cache.stats()
+        rows[f"paso {dist_step:g} / {angle_step:g}°"] = {
+            "hit_rate": stats["cache_hit_rate"],
+            "us_frame": us,
+            "saved_ms": stats["cache_saved_ms"],
+            "agree": float(np.mean([r[0] == c[0] for r, c in zip(reference, results)])),
+            "conf_diff": float(np.mean([abs(r[1] - c[1]) for r, c in zip(reference, results)])),
+        }
+
+    print(f"{len(frames)} frames, max_age {args.max_age} s a {args.fps:g} fps\n")
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+classifier_bench.py — coste por frame de StateClassifier.predict.
+
+Compara la ruta anterior (DataFrame de pandas de una fila + predict +
+predict_proba, es decir, recorrer el bosque dos veces) con la actual
+(fila float32 preasignada + un único predict_proba + argmax) en cada
+backend, el coste de predict_hands (estado combinado + uno por mano en
+una sola llamada) en frames con dos manos, y el modo por lotes de
+CompiledForest.
+
+Uso:
+    python benchmarks/classifier_bench.py [--model models/hand_state_rf.pkl] [--frames 2000]
+"""
+from __future__ import annotations
+import argparse
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+
+from _common import FEATURE_NAMES, features_of, print_table, random_hands, resolve_model, time_calls
+from core.compiled_forest import CompiledForest
+from core.state_classifier import StateClassifier
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", type=Path, default=None)
+    parser.add_argument("--frames", type=int, default=2000)
+    args = parser.parse_args()
+
+    model_path = resolve_model(args.model)
+    frames = random_hands(args.frames)
+    rows = {}
+
+    try:
+        import pandas as pd
+    except ImportError:
+        print("[INFO] pandas no instalado — se omite la ruta anterior")
+    else:
+        legacy = joblib.load(model_path)
+        legacy.verbose = 0
+
+        def legacy_predict(hands):
+            X = pd.DataFrame([features_of(hands)], columns=FEATURE_NAMES)
+            legacy.predict(X)[0]
+            return float(max(legacy.predict_proba(X)[0]))
+
+        rows["pandas + predict x2"] = time_calls(legacy_predict, frames)
+
+    for backend in ("compiled", "sklearn"):
+        classifier = StateClassifier(model_path, backend=backend)
+        rows[f"StateClassifier[{classifier.backend}]"] = time_calls(classifier.predict, frames)
+
+    print_table(rows)
+    base = rows.get("pandas + predict x2")
+    if base is not None:
+        print()
+        for name, row in list(rows.items())[1:]:
+            print(f"Ahorro por frame {name}: {base['mean_us'] - row['mean_us']:.1f} µs "
+                  f"({base['mean_us'] / row['mean_us']:.2f}x)")
+
+    # Estado por mano: tres filas en una llamada frente a predict de una fila
+    two_hands = [hands for hands in frames if len(hands) == 2]
+    per_hand = {}
+    for backend in ("compiled", "sklearn"):
+        classifier = StateClassifier(model_path, backend=backend)
+        per_hand[f"predict[{classifier.backend}]"] = time_calls(classifier.predict, two_hands)
+        per_hand[f"predict_hands[{classifier.backend}]"] = time_calls(classifier.predict_hands, two_hands)
+    print(f"\nFrames con dos manos ({len(two_hands)})")
+    print_table(per_hand)
+
+    # Lote: todos los frames en una sola llamada (p. ej. reprocesar grabaciones)
+    forest = CompiledForest.from_sklearn(joblib.load(model_path))
+    X = np.array([features_of(hands) for hands in frames], dtype=np.float32)
+    t0 = time.perf_counter()
+    forest.predict_proba(X)
+    print(f"\nCompiledForest por lotes: {1e6 * (time.perf_counter() - t0) / len(X):.2f} µs/frame")
+
+
+if __name__ == "__main__":
+    main()
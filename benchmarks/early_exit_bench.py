@@ -0,0 +1,71 @@
+"""
+early_exit_bench.py — inferencia anticipada del bosque frente a la completa.
+
+Para cada backend de bosque (sklearn, compiled) clasifica las mismas
+filas evaluando todos los árboles, con salida exacta (solo se para
+cuando los árboles restantes ya no pueden cambiar el estado) y con
+varios márgenes. Informa de árboles evaluados por frame, coste medio,
+concordancia de estado y de confianza, y si la decisión respecto a
+min_confidence del estabilizador cambia.
+
+Solo los backends con ``anytime`` la usan en StateClassifier: en el
+bosque compilado cada bloque recorre de nuevo todos los niveles, así que
+evaluar por bloques cuesta más que evaluar el bosque entero (la tabla lo
+muestra).
+
+Uso:
+    python benchmarks/early_exit_bench.py [--model ...] [--dataset rec.npz] [--chunk 16]
+"""
+from __future__ import annotations
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+from _common import features_of, load_frames, print_table, random_hands, resolve_model
+from core.classifier_backends import open_backend
+
+_MARGINS = [None, 0.7, 0.5, 0.3]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", type=Path, default=None)
+    parser.add_argument("--dataset", type=Path, default=None)
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--chunk", type=int, default=16)
+    parser.add_argument("--min-confidence", type=float, default=0.60)
+    args = parser.parse_args()
+
+    model_path = resolve_model(args.model)
+    frames = load_frames(args.dataset)[0] if args.dataset else random_hands(args.frames, seed=3)
+    X = np.array([features_of(hands) for hands in frames], dtype=np.float32)
+
+    for kind in ("sklearn", "compiled"):
+        backend = open_backend(kind, model_path)
+        t0 = time.perf_counter()
+        reference = [backend.predict_proba(x[None])[0] for x in X]
+        rows = {"completo": {"trees": float(backend.n_trees),
+                             "us_frame": 1e6 * (time.perf_counter() - t0) / len(X),
+                             "agree": 1.0, "conf_diff": 0.0, "gate_agree": 1.0}}
+        for margin in _MARGINS:
+            t0 = time.perf_counter()
+            results = [backend.predict_proba_anytime(x, args.chunk, margin) for x in X]
+            us = 1e6 * (time.perf_counter() - t0) / len(X)
+            ref_conf = np.array([r.max() for r in reference])
+            conf = np.array([p.max() for p, _ in results])
+            rows["exacto" if margin is None else f"margen {margin:g}"] = {
+                "trees": float(np.mean([trees for _, trees in results])),
+                "us_frame": us,
+                "agree": float(np.mean([r.argmax() == p.argmax() for r, (p, _) in zip(reference, results)])),
+                "conf_diff": float(np.mean(np.abs(ref_conf - conf))),
+                "gate_agree": float(np.mean((ref_conf >= args.min_confidence) == (conf >= args.min_confidence))),
+            }
+        usage = "usada por StateClassifier" if backend.anytime else "desactivada en StateClassifier"
+        print(f"\n[{kind}] {len(X)} frames, bloques de {args.chunk} árboles — {usage}")
+        print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+fast_path_bench.py — reglas geométricas (GeometricClassifier) frente al modelo.
+
+Sobre frames etiquetados clasifica cada uno con el modelo completo y con
+las reglas. Por estado informa de la fracción que resuelven las reglas,
+su concordancia con el modelo y con la etiqueta; después mide el coste
+medio por frame de StateClassifier en los modos "off", "shadow" y "on"
+(mejor de --repeat pasadas), y la precisión final de cada uno.
+
+El modo "on" solo compensa si las reglas resuelven más frames que el
+punto de equilibrio (coste de las reglas / coste del modelo) que se
+imprime al final. Con los umbrales por defecto y manos sintéticas
+resuelven ~1%: úsese "shadow" con datos reales para ajustar los umbrales
+(--fist-max-dist, ...) antes de activar classifier_fast_path.
+
+Dataset: .npz con landmarks + labels o una grabación de la caja negra
+(ver _common.load_frames). Sin --dataset se usan manos sintéticas.
+
+Uso:
+    python benchmarks/fast_path_bench.py [--model ...] [--dataset rec.npz] [--backend compiled]
+"""
+from __future__ import annotations
+import argparse
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from _common import features_of, load_frames, print_table, resolve_model, synthetic_dataset
+from core.geometric_classifier import GeometricClassifier
+from core.state_classifier import StateClassifier
+
+
+def per_state(labels: np.ndarray, model: List[str], rules: List[str]) -> Dict[str, Dict[str, float]]:
+    """Resueltos por las reglas y concordancia, agrupado por etiqueta."""
+    rows: Dict[str, Dict[str, float]] = {}
+    for state in sorted(set(labels)) + ["TOTAL"]:
+        idx = np.arange(len(labels)) if state == "TOTAL" else np.flatnonzero(labels == state)
+        hit = [i for i in idx if rules[i] is not None]
+        rows[state] = {
+            "frames": float(len(idx)),
+            "resolved": len(hit) / max(len(idx), 1),
+            "agree_model": float(np.mean([rules[i] == model[i] for i in hit])) if hit else 1.0,
+            "agree_label": float(np.mean([rules[i] == labels[i] for i in hit])) if hit else 1.0,
+            "model_acc": float(np.mean([model[i] == labels[i] for i in idx])) if len(idx) else 0.0,
+        }
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", type=Path, default=None)
+    parser.add_argument("--dataset", type=Path, default=None)
+    parser.add_argument("--backend", default="compiled")
+    parser.add_argument("--frames", type=int, default=2000, help="tamaño del dataset sintético")
+    parser.add_argument("--repeat", type=int, default=5, help="pasadas por modo (se toma la mejor)")
+    parser.add_argument("--fist-max-dist", type=float, default=1.0)
+    parser.add_argument("--fist-max-angle", type=float, default=120.0)
+    parser.add_argument("--palm-min-dist", type=float, default=1.4)
+    parser.add_argument("--palm-min-angle", type=float, default=155.0)
+    args = parser.parse_args()
+
+    model_path = resolve_model(args.model)
+    if args.dataset is not None:
+        frames, labels = load_frames(args.dataset)
+    else:
+        print("[INFO] Sin --dataset — usando manos sintéticas etiquetadas")
+        frames, labels = synthetic_dataset(args.frames, seed=7)
+    rules = GeometricClassifier(
+        fist_max_dist=args.fist_max_dist,
+        fist_max_angle=args.fist_max_angle,
+        palm_min_dist=args.palm_min_dist,
+        palm_min_angle=args.palm_min_angle,
+    )
+
+    reference = StateClassifier(model_path, args.backend)
+    model = [reference.predict(hands)[0].value for hands in frames]
+    features = [features_of(hands) for hands in frames]
+    t0 = time.perf_counter()
+    decided = [rules.classify(row) for row in features]
+    rules_us = 1e6 * (time.perf_counter() - t0) / len(frames)
+    print(f"\n[{reference.backend}] {len(frames)} frames — reglas frente a modelo")
+    print_table(per_state(labels, model, [None if s is None else s.value for s in decided]))
+
+    # Pasadas intercaladas entre modos: la deriva de la máquina afecta a todos por igual
+    modes = ("off", "shadow", "on")
+    best = {mode: float("inf") for mode in modes}
+    results: Dict[str, List[str]] = {}
+    stats: Dict[str, Dict[str, float]] = {}
+    for _ in range(max(args.repeat, 1)):
+        for mode in modes:
+            classifier = StateClassifier(model_path, args.backend, fast_path=rules, fast_path_mode=mode)
+            t0 = time.perf_counter()
+            results[mode] = [classifier.predict(hands)[0].value for hands in frames]
+            best[mode] = min(best[mode], 1e6 * (time.perf_counter() - t0) / len(frames))
+            stats[mode] = classifier.stats()
+
+    rows: Dict[str, Dict[str, float]] = {}
+    for mode in modes:
+        rows[mode] = {
+            "us_frame": best[mode],
+            "resolved": stats[mode].get("fast_path_rate", 0.0),
+            "rule_agree": stats[mode].get("fast_path_agree", 1.0),
+            "agree_model": float(np.mean([r == m for r, m in zip(results[mode], model)])),
+            "accuracy": float(np.mean([r == label for r, label in zip(results[mode], labels)])),
+        }
+    print()
+    print_table(rows)
+    resolved = rows["on"]["resolved"]
+    break_even = rules_us / max(rows["off"]["us_frame"], 1e-9)
+    verdict = "compensa" if resolved > break_even else "no compensa: mantener en \"shadow\""
+    print(f"\nReglas: {rules_us:.1f} µs/frame — equilibrio con {100 * break_even:.1f}% de frames resueltos"
+          f" (resueltos {100 * resolved:.1f}%, modo \"on\" {verdict})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+BudgetGovernor — keeps per-frame processing cost inside a CPU budget by
+stepping between quality tiers.
+
+Each tier fixes the capture rate, the tracker input size, the MediaPipe
+model_complexity, the OpenCV thread count and (Linux only) the niceness /
+CPU affinity of the pipeline thread. The governor compares an EMA of the measured
+per-frame cost with the frame budget of the current tier:
+
+  - load > high_water for ``down_dwell`` seconds → one tier down.
+  - the predicted load of the tier above (using the cost remembered from
+    the last time it ran) < low_water for ``up_dwell`` seconds → one up.
+
+The gap between the two water marks and the longer up-dwell are the
+hysteresis that prevents oscillation.
+"""
+from __future__ import annotations
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import cv2
+
+
+@dataclass(frozen=True)
+class QualityTier:
+    """One step of the quality ladder (index 0 = best quality)."""
+    name: str
+    fps: float
+    input_side: int        # HandTracker max_input_side (0 = full resolution)
+    model_complexity: int  # MediaPipe hands model (1 = full, 0 = lite)
+    cv_threads: int        # cv2.setNumThreads (-1 = OpenCV default)
+    nice: int = 0          # pipeline thread niceness (Linux)
+    cpus: int = 0          # restrict that thread to this many CPUs (0 = all)
+
+
+def make_tiers(max_fps: float = 30.0) -> List[QualityTier]:
+    """Default quality ladder derived from the configured FPS limit."""
+    return [
+        QualityTier("high",    max_fps,                  0,   1, -1),
+        QualityTier("medium",  max(1.0, max_fps * 0.75), 640, 1,  2),
+        QualityTier("low",     max(1.0, max_fps * 0.5),  480, 0,  1, nice=5,  cpus=2),
+        QualityTier("minimal", max(1.0, max_fps * 0.33), 320, 0,  1, nice=10, cpus=1),
+    ]
+
+
+class BudgetGovernor:
+    """
+    Parameters
+    ----------
+    tiers : sequence of QualityTier
+        Ordered from best to cheapest.
+    cpu_share : float
+        Fraction of one core the pipeline may use (budget = share / fps).
+    deadline : float
+        Fixed per-frame deadline in seconds; overrides cpu_share when > 0.
+    high_water, low_water : float
+        Load thresholds (cost / budget) for stepping down / up.
+    down_dwell, up_dwell : float
+        Seconds a condition must hold (and minimum time between changes).
+    alpha : float
+        EMA factor for the per-frame cost.
+    """
+
+    def __init__(
+        self,
+        tiers: Sequence[QualityTier],
+        cpu_share: float = 0.6,
+        deadline: float = 0.0,
+        high_water: float = 1.0,
+        low_water: float = 0.6,
+        down_dwell: float = 1.0,
+        up_dwell: float = 5.0,
+        alpha: float = 0.1,
+    ) -> None:
+        if not tiers:
+            raise ValueError("BudgetGovernor needs at least one tier")
+        self._tiers = list(tiers)
+        self._cpu_share = cpu_share
+        self._deadline = deadline
+        self._high = high_water
+        self._low = low_water
+        self._down_dwell = down_dwell
+        self._up_dwell = up_dwell
+        self._alpha = alpha
+
+        self._index = 0
+        self._cost: Optional[float] = None
+        self._tier_cost: Dict[int, float] = {}
+        self._changed_at: Optional[float] = None
+        self._over_since: Optional[float] = None
+        self._under_since: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    @property
+    def tier(self) -> QualityTier:
+        return self._tiers[self._index]
+
+    @property
+    def load(self) -> float:
+        """EMA cost divided by the current tier's budget."""
+        return (self._cost or 0.0) / self._budget(self._index)
+
+    def update(self, cost: float, now: float) -> Optional[QualityTier]:
+        """
+        Feed the processing cost (seconds) of one frame captured at ``now``.
+        Returns the new tier when a step happens, None otherwise.
+        """
+        a = self._alpha
+        self._cost = cost if self._cost is None else a * cost + (1 - a) * self._cost
+        self._tier_cost[self._index] = self._cost
+        if self._changed_at is None:
+            self._changed_at = now
+
+        if self.load > self._high and self._index < len(self._tiers) - 1:
+            self._under_since = None
+            if self._over_since is None:
+                self._over_since = now
+            if (now - self._over_since >= self._down_dwell
+                    and now - self._changed_at >= self._down_dwell):
+                return self._step(+1, now)
+            return None
+        self._over_since = None
+
+        if self._index > 0:
+            up = self._index - 1
+            predicted = max(self._tier_cost.get(up, 0.0), self._cost) / self._budget(up)
+            if predicted < self._low:
+                if self._under_since is None:
+                    self._under_since = now
+                if (now - self._under_since >= self._up_dwell
+                        and now - self._changed_at >= self._up_dwell):
+                    return self._step(-1, now)
+                return None
+        self._under_since = None
+        return None
+
+    # ------------------------------------------------------------------
+    def _budget(self, index: int) -> float:
+        if self._deadline > 0:
+            return self._deadline
+        return self._cpu_share / self._tiers[index].fps
+
+    def _step(self, delta: int, now: float) -> QualityTier:
+        self._index += delta
+        self._changed_at = now
+        self._over_since = None
+        self._under_since = None
+        # Start the new tier from its remembered cost, if any.
+        self._cost = self._tier_cost.get(self._index, self._cost)
+        return self.tier
+
+
+_base_limits: Dict[int, tuple] = {}   # native thread id -> (niceness, affinity) at first call
+
+
+def apply_thread_limits(tier: QualityTier) -> Optional[str]:
+    """
+    Apply the OpenCV thread count and, on Linux, the niceness and CPU
+    affinity of the calling thread, relative to the values it had on its
+    first call. Only the pipeline thread is throttled; the GUI thread and
+    the rest of the process keep their priority and CPUs.
+
+    Returns
+    -------
+    None when everything was applied, else what failed. Lowering niceness
+    again needs CAP_SYS_NICE, so after a step down the thread may stay at
+    a lower priority than a better tier asks for.
+    """
+    cv2.setNumThreads(tier.cv_threads)
+    if not sys.platform.startswith("linux"):
+        return None
+    tid = threading.get_native_id()
+    try:
+        if tid not in _base_limits:
+            _base_limits[tid] = (os.getpriority(os.PRIO_PROCESS, tid),
+                                 sorted(os.sched_getaffinity(tid)))
+        base_nice, base_cpus = _base_limits[tid]
+    except (OSError, AttributeError) as exc:
+        return f"cannot read thread limits: {exc}"
+
+    errors: List[str] = []
+    nice = base_nice + tier.nice
+    try:
+        if os.getpriority(os.PRIO_PROCESS, tid) != nice:
+            os.setpriority(os.PRIO_PROCESS, tid, nice)
+    except OSError as exc:
+        errors.append(f"niceness {nice}: {exc.strerror}")
+    try:
+        os.sched_setaffinity(tid, base_cpus[:tier.cpus] if tier.cpus > 0 else base_cpus)
+    except OSError as exc:
+        errors.append(f"affinity: {exc.strerror}")
+    return "; ".join(errors) or None
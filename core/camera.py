@@ -1,54 +1,280 @@
 """
-Camera — thin wrapper around OpenCV VideoCapture with FPS limiting.
+Camera — thin wrapper around a FrameSource (webcam, video file, image
+sequence or synthetic stream) with FPS limiting.
 No ML, no state detection, no gestures.
+
+Two capture modes:
+  - synchronous : read() sleeps until the next frame is due, then reads.
+  - threaded    : a grabber thread keeps draining the driver queue and
+                  publishes only the newest frame ("latest-frame-wins").
+                  Frames that are not due are grabbed but never decoded.
+
+Device loss (e.g. webcam unplugged) is detected after a run of failed
+grabs; the source is then reopened with exponential backoff on the
+capture side only, so tracker and model state downstream stay alive.
+
+Unpaced sources ("fast" pacing) bypass both the limiter and the grabber
+thread: every frame is delivered, in order, as fast as it is read.
+
+Frames are decoded straight into buffers from a FramePool; read_buffer()
+hands out one reference that the caller must release(). Every buffer is
+stamped with time.monotonic() taken right after grab(), i.e. before
+decoding, and with a per-camera sequence number.
 """
 from __future__ import annotations
+import threading
 import time
-from typing import Optional, Tuple
+from typing import Optional, Union
 
 import cv2
 import numpy as np
 
+from core.frame_pool import FrameBuffer, FramePool
+from core.frame_source import DeviceSource, FrameSource
+
 
 class Camera:
     """
     Parameters
     ----------
-    device : int
-        Camera index (0 = default webcam).
+    device : int | FrameSource
+        Camera index (0 = default webcam) or an already built FrameSource.
     fps_limit : int
         Maximum frames per second to process.
+    threaded : bool
+        Capture on a dedicated grabber thread (latest-frame-wins).
+    buffer_size : int
+        Driver-side buffer depth (CAP_PROP_BUFFERSIZE). 0 keeps the
+        backend default. Not every backend honours it.
+    pool : FramePool | None
+        Pool the frames are decoded into (a private one by default).
     """
 
-    def __init__(self, device: int = 0, fps_limit: int = 30) -> None:
-        self._cap = cv2.VideoCapture(device)
-        self._frame_time = 1.0 / fps_limit
-        self._prev_time: float = 0.0
+    # Seconds read() waits for the grabber before giving up.
+    _READ_TIMEOUT = 1.0
+    # Fraction of a frame interval a frame may arrive early and still count.
+    _SLACK = 0.25
+    # Consecutive failed grabs before the device is considered lost.
+    _LOSS_AFTER = 10
+    # Reconnect backoff (seconds): doubles from _BACKOFF_MIN up to _BACKOFF_MAX.
+    _BACKOFF_MIN = 0.5
+    _BACKOFF_MAX = 5.0
+
+    def __init__(
+        self,
+        device: Union[int, FrameSource] = 0,
+        fps_limit: int = 30,
+        threaded: bool = True,
+        buffer_size: int = 1,
+        pool: Optional[FramePool] = None,
+    ) -> None:
+        self._pool = pool or FramePool()
+        self._shape: Optional[tuple] = None
+        self._seq = 0
+        self._cap: FrameSource = (
+            device if isinstance(device, FrameSource) else DeviceSource(device)
+        )
+        self._paced = self._cap.paced
+        self._frame_time = 0.0
+        self._next_due: float = 0.0
+        self.set_fps_limit(fps_limit)
 
         if not self._cap.isOpened():
-            raise RuntimeError(f"Cannot open camera device {device}")
+            raise RuntimeError(f"Cannot open frame source {device}")
+
+        if buffer_size > 0:
+            self._cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+
+        # ---- device-loss / reconnect state --------------------------------
+        self._fail_count   = 0
+        self._lost         = False
+        self._backoff      = self._BACKOFF_MIN
+        self._next_attempt = 0.0
+        self._reconnects   = 0
+
+        # ---- grabber thread state --------------------------------------
+        self._threaded = threaded and self._paced
+        self._cond     = threading.Condition()
+        self._stop     = threading.Event()
+        self._latest: Optional[FrameBuffer] = None
+        self._latest_seq = 0
+        self._read_seq   = 0
+        self._failed     = False
+        self._thread: Optional[threading.Thread] = None
+
+        if self._threaded:
+            self._thread = threading.Thread(
+                target=self._grab_loop, name="CameraGrabber", daemon=True
+            )
+            self._thread.start()
 
     # ------------------------------------------------------------------
     def read(self) -> Optional[np.ndarray]:
         """
-        Block until the next frame is due (FPS limiter), then return it.
-        Returns None on read failure.
+        Return the next frame once it is due (FPS limiter).
+        Returns None on read failure. The array is owned by the caller.
+        """
+        buf = self.read_buffer()
+        return buf.detach() if buf is not None else None
+
+    def read_buffer(self) -> Optional[FrameBuffer]:
+        """
+        Like read(), but returns a pooled FrameBuffer with one reference
+        held by the caller. Returns None on read failure.
+        """
+        if not self._threaded:
+            delay = self._next_due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._take_slot(time.monotonic())
+            if not self._grab():
+                self._stop.wait(self._retry_delay())
+                return None
+            return self._retrieve(time.monotonic())
+
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._latest_seq != self._read_seq
+                or self._failed
+                or self._stop.is_set(),
+                timeout=max(self._READ_TIMEOUT, 2.0 * self._frame_time),
+            )
+            if self._latest_seq == self._read_seq:
+                return None
+            self._read_seq = self._latest_seq
+            buf, self._latest = self._latest, None
+            return buf
+
+    def set_fps_limit(self, fps_limit: float) -> None:
+        """
+        Change the capture rate on the fly (idle governor, CPU budget).
+        The new rate applies from the very next frame.
+        """
+        frame_time = 1.0 / fps_limit if self._paced and fps_limit > 0 else 0.0
+        if frame_time < self._frame_time:
+            self._next_due = 0.0  # speeding up: don't wait out the old slot
+        self._frame_time = frame_time
+
+    @property
+    def finished(self) -> bool:
+        """True once a finite source (video, image sequence) has run out."""
+        return self._cap.finished
+
+    @property
+    def connected(self) -> bool:
+        """False while the device is lost and being reopened."""
+        return not self._lost
+
+    @property
+    def reconnects(self) -> int:
+        """Number of successful reconnections since construction."""
+        return self._reconnects
+
+    # ------------------------------------------------------------------
+    def _take_slot(self, now: float) -> bool:
         """
-        # FPS limiting
-        while True:
-            now = time.time()
-            if now - self._prev_time >= self._frame_time:
-                self._prev_time = now
-                break
+        Claim the next pacing slot if it is due.
+        Keeps the average cadence without letting a stall cause a burst.
+        """
+        if now < self._next_due - self._SLACK * self._frame_time:
+            return False
+        self._next_due = max(self._next_due, now - self._frame_time) + self._frame_time
+        return True
+
+    def _grab(self) -> bool:
+        """grab() with device-loss detection and backoff reconnects."""
+        if self._lost and not self._try_reconnect():
+            return False
+        if self._cap.grab():
+            self._fail_count = 0
+            return True
+        if self._cap.finished:
+            return False
+        self._fail_count += 1
+        if self._fail_count >= self._LOSS_AFTER or not self._cap.isOpened():
+            self._lost = True
+            self._backoff = self._BACKOFF_MIN
+            self._next_attempt = time.monotonic()
+        return False
+
+    def _try_reconnect(self) -> bool:
+        now = time.monotonic()
+        if now < self._next_attempt:
+            return False
+        if self._cap.reopen():
+            self._lost = False
+            self._fail_count = 0
+            self._next_due = 0.0
+            self._reconnects += 1
+            return True
+        self._next_attempt = now + self._backoff
+        self._backoff = min(self._backoff * 2.0, self._BACKOFF_MAX)
+        return False
+
+    def _retry_delay(self) -> float:
+        """How long to wait after a failed grab before trying again."""
+        if self._lost:
+            return min(max(self._next_attempt - time.monotonic(), 0.0), 0.2)
+        return 0.05
+
+    def _retrieve(self, grab_ts: float) -> Optional[FrameBuffer]:
+        """Decode the grabbed frame into a pooled buffer stamped with grab_ts."""
+        buf = self._pool.acquire(self._shape) if self._shape is not None else None
+        ret, frame = self._cap.retrieve(buf.array if buf is not None else None)
+        if not ret or frame is None:
+            if buf is not None:
+                buf.release()
+            return None
+        if buf is None or frame is not buf.array:
+            # First frame, or the format changed: the decoder allocated.
+            if buf is not None:
+                buf.release()
+            buf = self._pool.adopt(frame)
+            self._shape = frame.shape
+        self._seq += 1
+        buf.timestamp = grab_ts
+        buf.seq = self._seq
+        return buf
+
+    def _grab_loop(self) -> None:
+        """Grabber thread: drain the device, decode only the frames that are due."""
+        while not self._stop.is_set():
+            if not self._grab():
+                with self._cond:
+                    self._failed = True
+                    self._cond.notify_all()
+                self._stop.wait(self._retry_delay())
+                continue
+
+            grab_ts = time.monotonic()
+            if not self._take_slot(grab_ts):
+                continue  # drained but not decoded
 
-        ret, frame = self._cap.read()
-        return frame if ret else None
+            buf = self._retrieve(grab_ts)
+            with self._cond:
+                self._failed = buf is None
+                if buf is not None:
+                    if self._latest is not None:
+                        self._latest.release()  # older unread frame is dropped
+                    self._latest = buf
+                    self._latest_seq += 1
+                self._cond.notify_all()
 
     def release(self) -> None:
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        with self._cond:
+            if self._latest is not None:
+                self._latest.release()
+                self._latest = None
         self._cap.release()
 
     def __enter__(self) -> "Camera":
         return self
 
     def __exit__(self, *_) -> None:
-        self.release()
\ No newline at end of file
+        self.release()
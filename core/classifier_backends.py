@@ -0,0 +1,409 @@
+"""
+Classifier backends — interchangeable hand-state models behind one interface.
+
+StateClassifier extracts the FEATURE_NAMES row and hands it to a backend;
+every backend answers ``predict_proba`` over its ``classes_``, so models
+can be swapped through configuration without touching CameraWorker.
+
+Kinds
+-----
+  sklearn  : any pickled scikit-learn classifier (joblib).
+  compiled : a forest evaluated by CompiledForest — a pickle compiled at
+             load time, or a .gkm file mapped without unpickling.
+  knn      : k-nearest neighbours over standardised feature rows (.npz).
+  mlp      : small ReLU multilayer perceptron evaluated in NumPy (.npz).
+
+The .npz models carry their own ``feature_names`` and ``classes``;
+``KNNBackend.fit`` / ``MLPBackend.fit`` build them and ``save``
+writes them (see benchmarks/backend_compare.py).
+"""
+from __future__ import annotations
+import copy
+import pickle
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+
+import joblib
+import numpy as np
+
+from core.compiled_forest import CompiledForest
+from core.model_format import SUFFIX as GKM_SUFFIX, load_forest
+
+BACKEND_KINDS = ("compiled", "sklearn", "knn", "mlp")
+
+
+class ClassifierBackend(ABC):
+    """Base class for all hand-state model backends."""
+
+    #: Kind name, as accepted by open_backend().
+    name: str = ""
+
+    #: Class labels, in the column order of predict_proba().
+    classes_: np.ndarray
+    #: Expected row width.
+    n_features_in_: int
+    #: Training column names, or None if the model was fitted without them.
+    feature_names_in_: Optional[List[str]] = None
+    #: Members of a voting ensemble; 0 = not one (see EnsembleBackend).
+    n_trees: int = 0
+    #: True when evaluating part of the ensemble costs proportionally less
+    #: than all of it, i.e. when predict_proba_anytime can save time.
+    anytime: bool = False
+
+    @abstractmethod
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """(n_samples, n_features) float32 → (n_samples, n_classes) probabilities."""
+
+    def predict_proba_anytime(
+        self, x: np.ndarray, chunk: int = 16, margin: Optional[float] = None
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Probabilities for one row, possibly from part of an ensemble.
+
+        Models that are not ensembles evaluate the whole model and report
+        0 trees; EnsembleBackend overrides this with early stopping.
+        """
+        return self.predict_proba(x.reshape(1, -1))[0], 0
+
+    @property
+    @abstractmethod
+    def nbytes(self) -> int:
+        """Approximate in-memory size of the model parameters."""
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} classes={len(self.classes_)} bytes={self.nbytes}>"
+
+
+class EnsembleBackend(ClassifierBackend):
+    """
+    A backend over a voting ensemble whose members can be evaluated in
+    slices (``tree_proba``), enabling anytime inference. ``n_trees`` may
+    still be 0 for models that turn out not to be forests; they then fall
+    back to the full predict_proba.
+    """
+
+    @abstractmethod
+    def tree_proba(self, x: np.ndarray, start: int, stop: int) -> np.ndarray:
+        """(stop - start, n_classes) distributions of ensemble members [start, stop) for one row."""
+
+    def predict_proba_anytime(
+        self, x: np.ndarray, chunk: int = 16, margin: Optional[float] = None
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Evaluate the ensemble in chunks of ``chunk`` trees and stop early.
+
+        Stops once the leading class cannot be overturned by the trees still
+        pending (the answer is then the full ensemble's), or — with a
+        ``margin`` — once its lead over the runner-up, as a fraction of the
+        trees evaluated, reaches that margin.
+
+        Returns
+        -------
+        (probabilities averaged over the evaluated trees, trees evaluated).
+        With every tree evaluated the result equals predict_proba exactly.
+        """
+        if not self.n_trees:
+            return super().predict_proba_anytime(x, chunk, margin)
+        total = self.n_trees
+        sums = np.zeros(len(self.classes_))
+        done = 0
+        while done < total:
+            stop = min(done + chunk, total)
+            # One tree at a time, in order: the same accumulation as predict_proba
+            for leaf in self.tree_proba(x, done, stop):
+                sums += leaf
+            done = stop
+            top = np.partition(sums, -2)
+            lead = top[-1] - top[-2]
+            if lead > total - done or (margin is not None and lead >= margin * done):
+                break
+        return sums / done, done
+
+
+# ---- scikit-learn ----------------------------------------------------------
+def _names_of(model: Any) -> Optional[List[str]]:
+    names = getattr(model, "feature_names_in_", None)
+    return None if names is None else [str(name) for name in names]
+
+
+class SklearnBackend(EnsembleBackend):
+    """A fitted scikit-learn classifier, called directly (n_trees > 0 for forests)."""
+
+    name = "sklearn"
+
+    def __init__(self, model: Any) -> None:
+        # Shallow copy: the caller's estimator keeps its schema and settings
+        model = copy.copy(model)
+        self._model = model
+        if hasattr(model, "verbose"):
+            model.verbose = 0
+        self.classes_ = np.asarray(model.classes_)
+        self.n_features_in_ = int(model.n_features_in_)
+        self.feature_names_in_ = _names_of(model)
+        trees = getattr(model, "estimators_", None)
+        if isinstance(trees, list) and all(hasattr(t, "tree_") for t in trees):
+            self.n_trees = len(trees)
+            self.anytime = True     # one Python call per tree: fewer trees, less time
+        # StateClassifier validates the names once; dropping them from the
+        # copy lets predict_proba accept a bare ndarray without re-checking
+        # (or warning) every frame.
+        if self.feature_names_in_ is not None:
+            del model.feature_names_in_
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        return self._model.predict_proba(X)
+
+    def tree_proba(self, x: np.ndarray, start: int, stop: int) -> np.ndarray:
+        X = x.reshape(1, -1)
+        return np.array([tree.predict_proba(X, check_input=False)[0]
+                         for tree in self._model.estimators_[start:stop]])
+
+    @property
+    def nbytes(self) -> int:
+        return len(pickle.dumps(self._model, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class CompiledBackend(EnsembleBackend):
+    """
+    A forest evaluated by CompiledForest (compiled at load, or mapped from .gkm).
+
+    Not ``anytime``: a traversal costs one vectorised step per tree level
+    whatever the number of trees, so evaluating the forest in chunks is
+    slower than evaluating it once (see benchmarks/early_exit_bench.py).
+    """
+
+    name = "compiled"
+
+    def __init__(self, forest: CompiledForest, feature_names: Optional[Sequence[str]] = None) -> None:
+        self._forest = forest
+        self.classes_ = forest.classes_
+        self.n_features_in_ = forest.n_features_in_
+        self.feature_names_in_ = None if feature_names is None else [str(n) for n in feature_names]
+        self.n_trees = forest.n_trees
+
+    @classmethod
+    def from_sklearn(cls, model: Any) -> "CompiledBackend":
+        """Raises TypeError if the model is not a supported forest."""
+        return cls(CompiledForest.from_sklearn(model), _names_of(model))
+
+    @classmethod
+    def load(cls, path: Path) -> "CompiledBackend":
+        """A .gkm file is memory-mapped; anything else is unpickled and compiled."""
+        if Path(path).suffix == GKM_SUFFIX:
+            return cls(*load_forest(path))
+        return cls.from_sklearn(joblib.load(path))
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        return self._forest.predict_proba(X)
+
+    def tree_proba(self, x: np.ndarray, start: int, stop: int) -> np.ndarray:
+        return self._forest.tree_proba(x, start, stop)
+
+    @property
+    def nbytes(self) -> int:
+        return self._forest.nbytes
+
+
+# ---- NumPy models (.npz) ---------------------------------------------------
+def _standardiser(X: np.ndarray) -> tuple:
+    mean = X.mean(axis=0)
+    std = X.std(axis=0)
+    std[std == 0] = 1.0
+    return mean.astype(np.float32), std.astype(np.float32)
+
+
+class KNNBackend(ClassifierBackend):
+    """
+    k-nearest neighbours (Euclidean, standardised features, uniform vote).
+
+    Parameters
+    ----------
+    X : np.ndarray
+        (n_train, n_features) standardised training rows.
+    y : np.ndarray
+        (n_train,) int — index into ``classes``.
+    classes, feature_names : sequence
+    mean, std : np.ndarray
+        Standardisation applied to incoming rows.
+    k : int
+    """
+
+    name = "knn"
+
+    def __init__(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        classes: Sequence[Any],
+        feature_names: Sequence[str],
+        mean: np.ndarray,
+        std: np.ndarray,
+        k: int = 5,
+    ) -> None:
+        self._X = np.asarray(X, dtype=np.float32)
+        self._y = np.asarray(y, dtype=np.intp)
+        self._sq = (self._X ** 2).sum(axis=1)
+        self._mean = mean
+        self._std = std
+        self._k = min(int(k), len(self._X))
+        self.classes_ = np.asarray(classes)
+        self.n_features_in_ = self._X.shape[1]
+        self.feature_names_in_ = [str(name) for name in feature_names]
+
+    @classmethod
+    def fit(
+        cls, X: np.ndarray, labels: Sequence[Any], feature_names: Sequence[str], k: int = 5
+    ) -> "KNNBackend":
+        classes, y = np.unique(np.asarray(labels), return_inverse=True)
+        mean, std = _standardiser(X)
+        return cls((X - mean) / std, y, classes, feature_names, mean, std, k)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        Z = (np.asarray(X, dtype=np.float32) - self._mean) / self._std
+        # |z - x|² up to the per-row constant |z|², which does not change the ranking
+        d = self._sq[np.newaxis, :] - 2.0 * Z @ self._X.T
+        nearest = np.argpartition(d, self._k - 1, axis=1)[:, :self._k]
+        votes = self._y[nearest]
+        proba = np.zeros((len(Z), len(self.classes_)))
+        for c in range(len(self.classes_)):
+            proba[:, c] = (votes == c).sum(axis=1)
+        return proba / self._k
+
+    def save(self, path: Path) -> None:
+        np.savez(
+            path, kind=self.name, X=self._X, y=self._y, k=self._k,
+            mean=self._mean, std=self._std,
+            classes=self.classes_.astype(str), feature_names=np.array(self.feature_names_in_),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "KNNBackend":
+        data = _load_npz(path, cls.name)
+        return cls(data["X"], data["y"], data["classes"], data["feature_names"],
+                   data["mean"], data["std"], int(data["k"]))
+
+    @property
+    def nbytes(self) -> int:
+        return self._X.nbytes + self._y.nbytes
+
+
+class MLPBackend(ClassifierBackend):
+    """
+    ReLU MLP with a softmax output, evaluated with plain matrix products.
+
+    Parameters
+    ----------
+    weights, biases : sequence of np.ndarray
+        Per layer, ``W`` is (n_in, n_out) and ``b`` is (n_out,).
+    classes, feature_names : sequence
+    mean, std : np.ndarray
+        Standardisation applied to incoming rows.
+    """
+
+    name = "mlp"
+
+    def __init__(
+        self,
+        weights: Sequence[np.ndarray],
+        biases: Sequence[np.ndarray],
+        classes: Sequence[Any],
+        feature_names: Sequence[str],
+        mean: np.ndarray,
+        std: np.ndarray,
+    ) -> None:
+        self._weights = [np.asarray(w, dtype=np.float32) for w in weights]
+        self._biases = [np.asarray(b, dtype=np.float32) for b in biases]
+        self._mean = mean
+        self._std = std
+        self.classes_ = np.asarray(classes)
+        self.n_features_in_ = self._weights[0].shape[0]
+        self.feature_names_in_ = [str(name) for name in feature_names]
+
+    @classmethod
+    def fit(
+        cls,
+        X: np.ndarray,
+        labels: Sequence[Any],
+        feature_names: Sequence[str],
+        hidden: Sequence[int] = (32, 32),
+        max_iter: int = 600,
+    ) -> "MLPBackend":
+        """Train with scikit-learn's MLPClassifier on standardised rows and export it."""
+        from sklearn.neural_network import MLPClassifier
+
+        mean, std = _standardiser(X)
+        mlp = MLPClassifier(hidden_layer_sizes=tuple(hidden), max_iter=max_iter, random_state=0)
+        mlp.fit((X - mean) / std, np.asarray(labels))
+        return cls.from_sklearn(mlp, mean, std, feature_names)
+
+    @classmethod
+    def from_sklearn(
+        cls, mlp: Any, mean: np.ndarray, std: np.ndarray, feature_names: Sequence[str]
+    ) -> "MLPBackend":
+        """Export a fitted MLPClassifier (activation="relu") trained on standardised rows."""
+        if getattr(mlp, "activation", None) != "relu" or len(mlp.classes_) < 3:
+            raise TypeError("Only multi-class ReLU MLPClassifier models can be exported")
+        return cls(mlp.coefs_, mlp.intercepts_, mlp.classes_, feature_names, mean, std)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        h = (np.asarray(X, dtype=np.float32) - self._mean) / self._std
+        last = len(self._weights) - 1
+        for i, (w, b) in enumerate(zip(self._weights, self._biases)):
+            h = h @ w + b
+            if i < last:
+                np.maximum(h, 0.0, out=h)
+        h = h - h.max(axis=1, keepdims=True)
+        np.exp(h, out=h)
+        return h / h.sum(axis=1, keepdims=True)
+
+    def save(self, path: Path) -> None:
+        layers = {f"W{i}": w for i, w in enumerate(self._weights)}
+        layers.update({f"b{i}": b for i, b in enumerate(self._biases)})
+        np.savez(
+            path, kind=self.name, layers=len(self._weights), mean=self._mean, std=self._std,
+            classes=self.classes_.astype(str), feature_names=np.array(self.feature_names_in_),
+            **layers,
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "MLPBackend":
+        data = _load_npz(path, cls.name)
+        n = int(data["layers"])
+        return cls([data[f"W{i}"] for i in range(n)], [data[f"b{i}"] for i in range(n)],
+                   data["classes"], data["feature_names"], data["mean"], data["std"])
+
+    @property
+    def nbytes(self) -> int:
+        return sum(w.nbytes + b.nbytes for w, b in zip(self._weights, self._biases))
+
+
+def _load_npz(path: Path, kind: str) -> dict:
+    with np.load(path, allow_pickle=False) as data:
+        found = str(data["kind"]) if "kind" in data else "?"
+        if found != kind:
+            raise ValueError(f"{path} holds a {found!r} model, expected {kind!r}")
+        return {key: data[key] for key in data.files}
+
+
+# ---- factory ---------------------------------------------------------------
+def open_backend(kind: str, path: Path) -> ClassifierBackend:
+    """
+    Load the model at ``path`` as a backend of the given kind.
+
+    Raises
+    ------
+    ValueError
+        Unknown kind, or an .npz model of another kind.
+    TypeError
+        "compiled" on a model CompiledForest cannot flatten.
+    """
+    if kind == "sklearn":
+        return SklearnBackend(joblib.load(path))
+    if kind == "compiled":
+        return CompiledBackend.load(path)
+    if kind == "knn":
+        return KNNBackend.load(path)
+    if kind == "mlp":
+        return MLPBackend.load(path)
+    raise ValueError(f"Unknown classifier backend {kind!r} (expected one of {BACKEND_KINDS})")
@@ -22,14 +22,20 @@ class CooldownManager:
         self._default = default_cooldown
         self._last: Dict[str, float] = {}
 
-    def ok(self, name: str, cooldown: float | None = None) -> bool:
+    def ok(
+        self, name: str, cooldown: float | None = None, now: float | None = None
+    ) -> bool:
         """
         Return True (and record the timestamp) if the cooldown has elapsed
         since the last accepted event of this name.
+
+        ``now`` is a monotonic timestamp; gestures pass the frame's capture
+        time so cooldowns are not skewed by processing jitter.
         """
-        now = time.time()
+        if now is None:
+            now = time.monotonic()
         threshold = cooldown if cooldown is not None else self._default
-        if now - self._last.get(name, 0.0) > threshold:
+        if now - self._last.get(name, float("-inf")) > threshold:
             self._last[name] = now
             return True
         return False
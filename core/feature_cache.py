@@ -0,0 +1,135 @@
+"""
+FeatureCache — skips the hand-state model while the pose is unchanged.
+
+A held pose (e.g. TWO_FINGERS while scrolling) yields nearly the same
+feature row frame after frame. The row is quantised — distances to
+``dist_step``, angles to ``angle_step`` — and the packed integers are the
+key of a small LRU of (HandState, confidence) results.
+
+  - landmark jitter pushes some of the 20 values across a bucket edge on
+    most frames, so a key miss falls back to the most recent entry of the
+    same ``slot`` (callers caching several kinds of row per frame give each
+    kind its own slot) when every value is within one step of the row
+    that produced it;
+  - entries older than ``max_age`` seconds are not served, so a stale
+    decision cannot outlive a slow pose change hidden inside one bucket;
+  - the LRU is bounded to ``max_size`` keys;
+  - coarser steps raise the hit rate at the cost of agreement with the
+    uncached path (see benchmarks/cache_bench.py).
+
+The time saved is estimated as hits × the running mean cost of a miss.
+"""
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from domain.enums import HandState
+
+Result = Tuple[HandState, float]
+
+
+class FeatureCache:
+    """
+    Parameters
+    ----------
+    n_features : int
+        Width of the feature row.
+    n_dists : int
+        Leading entries of every 10-wide block that are distances; the rest
+        are angles (StateClassifier rows are [dists, angles] per hand).
+    dist_step : float
+        Quantisation step for wrist→tip distances (normalised units).
+    angle_step : float
+        Quantisation step for joint angles (degrees).
+    max_size : int
+        Maximum number of cached poses.
+    max_age : float
+        Seconds a result may be reused after it was computed.
+    """
+
+    def __init__(
+        self,
+        n_features: int = 20,
+        n_dists: int = 5,
+        dist_step: float = 0.02,
+        angle_step: float = 5.0,
+        max_size: int = 64,
+        max_age: float = 0.5,
+    ) -> None:
+        block = np.r_[np.full(n_dists, dist_step), np.full(10 - n_dists, angle_step)]
+        self._inv_step = 1.0 / np.resize(block, n_features)
+        self._max_size = max(1, max_size)
+        self._max_age = max_age
+        self._entries: "OrderedDict[bytes, Tuple[Result, float, np.ndarray]]" = OrderedDict()
+        self._last: Dict[int, bytes] = {}    # latest key stored per slot
+        self._lock = threading.Lock()
+        self._key = np.empty(n_features, dtype=np.int32)
+        self._miss_cost = 0.0
+        self._hits = 0
+        self._misses = 0
+
+    # ------------------------------------------------------------------
+    def key(self, features: np.ndarray) -> bytes:
+        """Quantised, packed form of a feature row."""
+        np.rint(features * self._inv_step, out=self._key, casting="unsafe")
+        return self._key.tobytes()
+
+    def get(self, features: np.ndarray, now: Optional[float] = None, slot: int = 0) -> Optional[Result]:
+        """Cached result for this row if present and fresh (counts a hit or a miss)."""
+        now = time.monotonic() if now is None else now
+        key = self.key(features)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._last.get(slot) in self._entries:
+                # Same pose, bucket edge crossed: compare with this slot's latest row
+                key = self._last[slot]
+                entry = self._entries[key]
+                if np.abs((features - entry[2]) * self._inv_step).max() > 1.0:
+                    entry = None
+            if entry is not None and now - entry[1] <= self._max_age:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def put(
+        self, features: np.ndarray, result: Result, cost: float, now: Optional[float] = None, slot: int = 0
+    ) -> None:
+        """Store a freshly computed result; ``cost`` is the model time it took (s)."""
+        now = time.monotonic() if now is None else now
+        key = self.key(features)
+        with self._lock:
+            self._entries[key] = (result, now, features.copy())
+            self._entries.move_to_end(key)
+            self._last[slot] = key
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+            self._miss_cost = cost if self._miss_cost == 0.0 else 0.95 * self._miss_cost + 0.05 * cost
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._last.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Hits, misses, hit rate and estimated ms saved since the previous call."""
+        with self._lock:
+            hits, misses = self._hits, self._misses
+            self._hits = self._misses = 0
+            size = len(self._entries)
+            saved = 1000.0 * hits * self._miss_cost
+        total = hits + misses
+        return {
+            "cache_hits": hits,
+            "cache_misses": misses,
+            "cache_hit_rate": hits / total if total else 0.0,
+            "cache_saved_ms": saved,
+            "cache_size": size,
+        }
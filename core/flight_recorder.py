@@ -0,0 +1,227 @@
+"""
+FlightRecorder — black-box ring of the last N seconds of the pipeline.
+
+Every frame stores a downscaled thumbnail, the normalised landmarks of
+each hand, raw / stable states, confidence and the GestureEvents fired.
+All storage is preallocated at construction; the hot path is one
+bilinear cv2.resize into a scratch thumbnail (outside the lock), then a
+copy into the next slot plus a few scalar writes — nothing is encoded
+until dump() is called.
+
+dump() snapshots the ring (one memcpy under a lock) and encodes it to
+disk in a background thread:
+
+    <dir>/<YYYYmmdd-HHMMSS>/
+        recording.npz   — all arrays, oldest frame first
+        timeline.json   — per-frame states, confidences and events
+        preview.avi     — thumbnails as MJPG video (if the codec is available)
+"""
+from __future__ import annotations
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from domain.enums import GestureEvent, HandState
+from domain.models import HandsData
+
+_STATES = list(HandState)
+_EVENTS = list(GestureEvent)
+_SIDES  = ("Right", "Left")
+_MAX_EVENTS = 4    # events kept per frame (more than one is already rare)
+
+
+class FlightRecorder:
+    """
+    Parameters
+    ----------
+    seconds : float
+        Length of history kept at ``fps``.
+    fps : float
+        Expected frame rate (sizes the ring; lower real rates keep more time).
+    thumb_size : (width, height)
+        Resolution of the stored frames.
+    """
+
+    def __init__(
+        self,
+        seconds: float = 10.0,
+        fps: float = 30.0,
+        thumb_size: Tuple[int, int] = (160, 120),
+    ) -> None:
+        self._capacity = max(1, int(seconds * fps))
+        self._size = thumb_size
+        n = self._capacity
+        w, h = thumb_size
+
+        self._thumbs     = np.zeros((n, h, w, 3), dtype=np.uint8)
+        self._timestamps = np.zeros(n, dtype=np.float64)
+        self._seqs       = np.zeros(n, dtype=np.int64)
+        self._landmarks  = np.full((n, len(_SIDES), 21, 3), np.nan, dtype=np.float32)
+        self._raw        = np.zeros(n, dtype=np.int8)
+        self._stable     = np.zeros(n, dtype=np.int8)
+        self._confidence = np.zeros(n, dtype=np.float32)
+        self._events     = np.full((n, _MAX_EVENTS), -1, dtype=np.int8)
+        # resize target; record() runs on one thread, so only it touches this
+        self._scratch    = np.zeros((h, w, 3), dtype=np.uint8)
+
+        self._count = 0                  # frames recorded since start / clear
+        self._lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    def record(
+        self,
+        frame: np.ndarray,
+        timestamp: float,
+        seq: int,
+        hands: HandsData,
+        raw_state: HandState,
+        stable_state: HandState,
+        confidence: float,
+        events: Iterable[GestureEvent] = (),
+    ) -> None:
+        """
+        Store one processed frame (overwrites the oldest slot). Call from a
+        single thread; dump() may run concurrently.
+        """
+        # The resize is the expensive part: keep it out of the lock so a
+        # dump() snapshot never waits on it
+        cv2.resize(frame, self._size, dst=self._scratch, interpolation=cv2.INTER_LINEAR)
+        raw = _STATES.index(raw_state)
+        stable = _STATES.index(stable_state)
+        codes = [_EVENTS.index(event) for event in events][:_MAX_EVENTS]
+
+        with self._lock:
+            i = self._count % self._capacity
+            self._thumbs[i] = self._scratch
+            self._timestamps[i] = timestamp
+            self._seqs[i] = seq
+            for k, side in enumerate(_SIDES):
+                lm = hands.get(side)
+                if lm is None:
+                    self._landmarks[i, k] = np.nan
+                else:
+                    self._landmarks[i, k] = lm
+            self._raw[i] = raw
+            self._stable[i] = stable
+            self._confidence[i] = confidence
+            self._events[i] = -1
+            self._events[i, :len(codes)] = codes
+            self._count += 1
+
+    def __len__(self) -> int:
+        return min(self._count, self._capacity)
+
+    @property
+    def busy(self) -> bool:
+        """True while a previous dump is still being written."""
+        return self._writer is not None and self._writer.is_alive()
+
+    def dump(
+        self,
+        directory: Path,
+        on_done: Optional[Callable[[Optional[Path], Optional[Exception]], None]] = None,
+    ) -> Optional[Path]:
+        """
+        Snapshot the ring and write it under ``directory`` in a background
+        thread. Returns the output folder, or None if the ring is empty or
+        a previous dump is still running. ``on_done(path, error)`` is
+        called from the writer thread.
+        """
+        if self.busy:
+            return None
+        snapshot = self._snapshot()
+        if snapshot is None:
+            return None
+        out = Path(directory) / time.strftime("%Y%m%d-%H%M%S")
+        self._writer = threading.Thread(
+            target=self._write, args=(out, snapshot, on_done),
+            name="FlightRecorderDump", daemon=True,
+        )
+        self._writer.start()
+        return out
+
+    def clear(self) -> None:
+        with self._lock:
+            self._count = 0
+
+    # ------------------------------------------------------------------
+    def _snapshot(self) -> Optional[Dict[str, np.ndarray]]:
+        """Copy the valid part of the ring, oldest frame first."""
+        with self._lock:
+            n = len(self)
+            if n == 0:
+                return None
+            start = self._count % self._capacity if self._count > self._capacity else 0
+            order = (np.arange(n) + start) % self._capacity
+            return {
+                "thumbs":     self._thumbs[order],
+                "timestamps": self._timestamps[order],
+                "seqs":       self._seqs[order],
+                "landmarks":  self._landmarks[order],
+                "raw":        self._raw[order],
+                "stable":     self._stable[order],
+                "confidence": self._confidence[order],
+                "events":     self._events[order],
+            }
+
+    def _write(
+        self,
+        out: Path,
+        snap: Dict[str, np.ndarray],
+        on_done: Optional[Callable[[Optional[Path], Optional[Exception]], None]],
+    ) -> None:
+        try:
+            out.mkdir(parents=True, exist_ok=True)
+            np.savez_compressed(
+                out / "recording.npz",
+                state_names=np.array([s.value for s in _STATES]),
+                event_names=np.array([e.value for e in _EVENTS]),
+                sides=np.array(_SIDES),
+                **snap,
+            )
+            (out / "timeline.json").write_text(
+                json.dumps(self._timeline(snap), indent=1), encoding="utf-8"
+            )
+            self._write_preview(out / "preview.avi", snap)
+        except Exception as exc:
+            if on_done is not None:
+                on_done(None, exc)
+            return
+        if on_done is not None:
+            on_done(out, None)
+
+    @staticmethod
+    def _timeline(snap: Dict[str, np.ndarray]) -> List[dict]:
+        t0 = float(snap["timestamps"][0])
+        rows = []
+        for i in range(len(snap["seqs"])):
+            rows.append({
+                "seq": int(snap["seqs"][i]),
+                "t": round(float(snap["timestamps"][i]) - t0, 4),
+                "hands": [s for k, s in enumerate(_SIDES)
+                          if not np.isnan(snap["landmarks"][i, k, 0, 0])],
+                "raw": _STATES[snap["raw"][i]].value,
+                "stable": _STATES[snap["stable"][i]].value,
+                "confidence": round(float(snap["confidence"][i]), 3),
+                "events": [_EVENTS[e].value for e in snap["events"][i] if e >= 0],
+            })
+        return rows
+
+    def _write_preview(self, path: Path, snap: Dict[str, np.ndarray]) -> None:
+        ts = snap["timestamps"]
+        span = float(ts[-1] - ts[0])
+        fps = (len(ts) - 1) / span if span > 0 else 30.0
+        writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), fps, self._size)
+        if not writer.isOpened():
+            return  # npz already holds the frames
+        try:
+            for thumb in snap["thumbs"]:
+                writer.write(thumb)
+        finally:
+            writer.release()
@@ -0,0 +1,237 @@
+"""
+Frame broadcast — share captured frames with other local processes.
+
+A webcam can only be opened by one process. FramePublisher copies every
+captured frame into a ring of slots inside a multiprocessing.shared_memory
+segment; FrameReader (usable from any process) maps the same segment and
+returns NumPy views into it without copying.
+
+Layout
+------
+    header  : magic, version, slots, height, width, channels,
+              slot stride, latest published sequence, closed flag
+    slot[i] : seq_begin, seq_end, capture timestamp, pixel data
+
+Each slot is a seqlock: the producer writes seq_begin, then the pixels,
+then seq_end. A reader accepts a slot only if both counters match the
+sequence it expects, and SharedFrame.valid() re-checks after use so a
+zero-copy consumer can tell if the producer lapped it. The producer
+never waits for readers; readers that fall behind only see their
+``dropped`` counter grow.
+
+Usage (reader side)
+-------------------
+    reader = FrameReader("gesturekey-frames")
+    frame  = reader.read(timeout=1.0)
+    if frame is not None:
+        use(frame.array)          # view into shared memory
+        if not frame.valid():     # overwritten while in use → discard
+            ...
+"""
+from __future__ import annotations
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+
+_MAGIC   = b"GKFB"
+_VERSION = 1
+
+# magic, version, slots, height, width, channels, slot_stride, latest_seq, closed
+_HEADER = struct.Struct("<4sIIIIIQQI")
+_HEADER_SIZE = 64
+_LATEST_OFFSET = struct.calcsize("<4sIIIIIQ")
+_CLOSED_OFFSET = _LATEST_OFFSET + 8
+
+# seq_begin, seq_end, timestamp
+_SLOT = struct.Struct("<QQd")
+_SLOT_HEADER_SIZE = 32
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without letting this process unlink it at exit."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python ≥ 3.13
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        except Exception:
+            pass
+        return shm
+
+
+class FramePublisher:
+    """
+    Producer side. Owns (creates and unlinks) the shared segment.
+
+    Parameters
+    ----------
+    name : str
+        Shared-memory segment name readers attach to.
+    slots : int
+        Ring length; a slot is overwritten after ``slots`` newer frames.
+    """
+
+    def __init__(self, name: str = "gesturekey-frames", slots: int = 4) -> None:
+        self._name  = name
+        self._slots = max(2, slots)
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._shape: Optional[Tuple[int, int, int]] = None
+        self._stride = 0
+        self._seq = 0
+
+    # ------------------------------------------------------------------
+    def publish(self, frame: np.ndarray, timestamp: float) -> None:
+        """Copy one BGR frame into the next ring slot. Never blocks."""
+        shape = frame.shape if frame.ndim == 3 else (*frame.shape, 1)
+        if shape != self._shape:
+            self._create(shape)
+
+        self._seq += 1
+        slot = (self._seq - 1) % self._slots
+        base = _HEADER_SIZE + slot * self._stride
+        buf  = self._shm.buf
+
+        struct.pack_into("<Q", buf, base, self._seq)                    # seq_begin
+        pixels = np.ndarray(shape, dtype=np.uint8, buffer=buf,
+                            offset=base + _SLOT_HEADER_SIZE)
+        np.copyto(pixels, frame.reshape(shape))
+        struct.pack_into("<Qd", buf, base + 8, self._seq, timestamp)    # seq_end, ts
+        struct.pack_into("<Q", buf, _LATEST_OFFSET, self._seq)
+
+    def close(self) -> None:
+        """Mark the segment closed (readers detach) and unlink it."""
+        if self._shm is None:
+            return
+        struct.pack_into("<I", self._shm.buf, _CLOSED_OFFSET, 1)
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = None
+        self._shape = None
+
+    # ------------------------------------------------------------------
+    def _create(self, shape: Tuple[int, int, int]) -> None:
+        self.close()
+        h, w, c = shape
+        self._stride = _SLOT_HEADER_SIZE + ((h * w * c + 63) // 64) * 64
+        size = _HEADER_SIZE + self._slots * self._stride
+        try:
+            self._shm = shared_memory.SharedMemory(name=self._name, create=True, size=size)
+        except FileExistsError:
+            # Stale segment from a crashed run — replace it.
+            stale = shared_memory.SharedMemory(name=self._name)
+            stale.close()
+            stale.unlink()
+            self._shm = shared_memory.SharedMemory(name=self._name, create=True, size=size)
+        _HEADER.pack_into(self._shm.buf, 0, _MAGIC, _VERSION, self._slots,
+                          h, w, c, self._stride, 0, 0)
+        self._shape = shape
+        self._seq = 0
+
+
+class SharedFrame:
+    """A zero-copy view of one published frame."""
+
+    __slots__ = ("array", "seq", "timestamp", "_buf", "_base")
+
+    def __init__(self, array: np.ndarray, seq: int, timestamp: float, buf, base: int) -> None:
+        self.array = array
+        self.seq = seq
+        self.timestamp = timestamp
+        self._buf = buf
+        self._base = base
+
+    def valid(self) -> bool:
+        """True if the producer has not started overwriting this slot."""
+        return struct.unpack_from("<Q", self._buf, self._base)[0] == self.seq
+
+
+class FrameReader:
+    """
+    Consumer side. Attaches lazily and re-attaches when the producer
+    recreates the segment (restart or resolution change).
+
+    Parameters
+    ----------
+    name : str
+        Segment name used by the FramePublisher.
+    """
+
+    def __init__(self, name: str = "gesturekey-frames") -> None:
+        self._name = name
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._slots = 0
+        self._shape: Tuple[int, int, int] = (0, 0, 0)
+        self._stride = 0
+        self._last_seq = 0
+        self.dropped = 0   # frames published but never returned to this reader
+        self.torn = 0      # slots overwritten while being read
+
+    # ------------------------------------------------------------------
+    def latest(self) -> Optional[SharedFrame]:
+        """Newest frame if one was published since the last call, else None."""
+        if not self._ensure_attached():
+            return None
+        buf = self._shm.buf
+        latest = struct.unpack_from("<Q", buf, _LATEST_OFFSET)[0]
+        if latest < self._last_seq:
+            self._last_seq = 0          # producer restarted its sequence
+        if latest == 0 or latest == self._last_seq:
+            return None
+
+        base = _HEADER_SIZE + ((latest - 1) % self._slots) * self._stride
+        begin, end, ts = _SLOT.unpack_from(buf, base)
+        if begin != latest or end != latest:
+            self.torn += 1
+            return None
+
+        if self._last_seq:
+            self.dropped += latest - self._last_seq - 1
+        self._last_seq = latest
+        array = np.ndarray(self._shape, dtype=np.uint8, buffer=buf,
+                           offset=base + _SLOT_HEADER_SIZE)
+        return SharedFrame(array, latest, ts, buf, base)
+
+    def read(self, timeout: float = 1.0, poll: float = 0.002) -> Optional[SharedFrame]:
+        """Wait up to ``timeout`` seconds for a new frame."""
+        deadline = time.monotonic() + timeout
+        while True:
+            frame = self.latest()
+            if frame is not None or time.monotonic() >= deadline:
+                return frame
+            time.sleep(poll)
+
+    def close(self) -> None:
+        if self._shm is not None:
+            try:
+                self._shm.close()
+            except BufferError:
+                pass  # a SharedFrame view is still alive; the GC will unmap
+            self._shm = None
+
+    # ------------------------------------------------------------------
+    def _ensure_attached(self) -> bool:
+        if self._shm is not None:
+            closed = struct.unpack_from("<I", self._shm.buf, _CLOSED_OFFSET)[0]
+            if not closed:
+                return True
+            self.close()
+        try:
+            shm = _attach(self._name)
+        except FileNotFoundError:
+            return False
+        magic, version, slots, h, w, c, stride, _, closed = _HEADER.unpack_from(shm.buf, 0)
+        if magic != _MAGIC or version != _VERSION or closed:
+            shm.close()
+            return False
+        self._shm = shm
+        self._slots, self._shape, self._stride = slots, (h, w, c), stride
+        self._last_seq = 0
+        return True
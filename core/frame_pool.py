@@ -0,0 +1,142 @@
+"""
+FramePool — reference-counted pool of preallocated frame buffers.
+
+Capture writes straight into a pooled buffer, every consumer (tracker,
+UI, ...) retain()s it while in use and release()s it when done. The
+buffer goes back to the free list only when the last reference is
+released, so full-resolution arrays are recycled instead of being
+reallocated every frame.
+
+A buffer that is never released is simply garbage-collected: leaks cost
+reuse, not memory.
+"""
+from __future__ import annotations
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class FrameBuffer:
+    """
+    One pooled frame.
+
+    Attributes
+    ----------
+    array : np.ndarray
+        The pixel data. Only valid while the caller holds a reference.
+    timestamp : float
+        time.monotonic() at grab time, set by the producer.
+    seq : int
+        Producer-assigned frame sequence number.
+    """
+
+    __slots__ = ("array", "timestamp", "seq", "_pool", "_refs")
+
+    def __init__(self, array: np.ndarray, pool: Optional["FramePool"]) -> None:
+        self.array = array
+        self.timestamp = 0.0
+        self.seq = 0
+        self._pool = pool
+        self._refs = 1
+
+    def retain(self) -> "FrameBuffer":
+        """Add a reference (e.g. before handing the frame to another thread)."""
+        if self._pool is None:
+            self._refs += 1
+        else:
+            with self._pool._lock:
+                self._refs += 1
+        return self
+
+    def release(self) -> None:
+        """Drop a reference; the last one returns the buffer to its pool."""
+        if self._pool is None:
+            self._refs -= 1
+            return
+        self._pool._release(self)
+
+    def detach(self) -> np.ndarray:
+        """Take the array out of the pool for good and return it."""
+        self._pool = None
+        return self.array
+
+    @property
+    def refcount(self) -> int:
+        return self._refs
+
+    def __repr__(self) -> str:
+        shape = "x".join(str(d) for d in self.array.shape)
+        return f"<FrameBuffer {shape} refs={self._refs}>"
+
+
+class FramePool:
+    """
+    Thread-safe free list of equally shaped buffers.
+
+    Parameters
+    ----------
+    max_free : int
+        Maximum number of idle buffers kept around. Extra released
+        buffers are dropped instead of being pooled.
+    """
+
+    def __init__(self, max_free: int = 8) -> None:
+        self._max_free = max_free
+        self._lock = threading.Lock()
+        self._free: List[FrameBuffer] = []
+        self._shape: Optional[Tuple[int, ...]] = None
+        self._dtype = np.dtype(np.uint8)
+        self._stats: Dict[str, int] = {"allocated": 0, "reused": 0, "adopted": 0}
+
+    # ------------------------------------------------------------------
+    def acquire(self, shape: Tuple[int, ...], dtype=np.uint8) -> FrameBuffer:
+        """Return a buffer of the given shape with one reference held."""
+        dtype = np.dtype(dtype)
+        with self._lock:
+            self._set_format(tuple(shape), dtype)
+            if self._free:
+                buf = self._free.pop()
+                buf._refs = 1
+                self._stats["reused"] += 1
+                return buf
+            self._stats["allocated"] += 1
+        return FrameBuffer(np.empty(shape, dtype=dtype), self)
+
+    def adopt(self, array: np.ndarray) -> FrameBuffer:
+        """
+        Wrap an array allocated elsewhere (e.g. a decoder that could not
+        write in place) so it joins the pool once released.
+        """
+        with self._lock:
+            self._set_format(array.shape, array.dtype)
+            self._stats["adopted"] += 1
+        return FrameBuffer(array, self)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, free=len(self._free))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._free.clear()
+
+    # ------------------------------------------------------------------
+    def _set_format(self, shape: Tuple[int, ...], dtype: np.dtype) -> None:
+        """Called with the lock held. A format change flushes the free list."""
+        if shape != self._shape or dtype != self._dtype:
+            self._shape = shape
+            self._dtype = dtype
+            self._free.clear()
+
+    def _release(self, buf: FrameBuffer) -> None:
+        with self._lock:
+            buf._refs -= 1
+            if buf._refs > 0:
+                return
+            if (buf._pool is self
+                    and buf.array.shape == self._shape
+                    and buf.array.dtype == self._dtype
+                    and len(self._free) < self._max_free):
+                self._free.append(buf)
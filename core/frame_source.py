@@ -0,0 +1,362 @@
+"""
+Frame sources — everything Camera can read frames from.
+
+Every source mimics the small subset of the cv2.VideoCapture API that
+Camera uses (isOpened / grab / retrieve / read / release), so a webcam,
+a recorded video, a folder of images and a generated stream are
+interchangeable. retrieve()/read() accept an optional ``out`` array and
+decode into it when shape and dtype match (see core.frame_pool).
+
+Pacing
+------
+"realtime" : finite sources sleep to their nominal FPS, so the pipeline
+             sees them exactly like a live camera (including frame drops).
+"fast"     : frames are produced as fast as the consumer reads them.
+             Nothing is dropped, which makes throughput runs deterministic.
+"""
+from __future__ import annotations
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+PACING_MODES = ("realtime", "fast")
+SOURCE_KINDS = ("device", "video", "images", "synthetic")
+
+_IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".webp"}
+
+
+class FrameSource(ABC):
+    """Base class for all frame sources."""
+
+    #: True when frames arrive on their own clock (webcam, realtime pacing).
+    #: Camera only applies its FPS limiter / grabber thread to paced sources.
+    paced: bool = True
+
+    @abstractmethod
+    def isOpened(self) -> bool:
+        ...
+
+    @abstractmethod
+    def grab(self) -> bool:
+        """Advance to the next frame without decoding it."""
+
+    @abstractmethod
+    def retrieve(self, out: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Decode the frame selected by the last grab().
+        Writes into ``out`` when possible; callers must use the returned array.
+        """
+
+    def read(self, out: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        if not self.grab():
+            return False, None
+        return self.retrieve(out)
+
+    def set(self, prop: int, value: float) -> bool:
+        """Property setter (only meaningful for real devices)."""
+        return False
+
+    def reopen(self) -> bool:
+        """
+        Try to re-acquire the underlying device after it was lost.
+        Returns True when the source is usable again.
+        """
+        return False
+
+    @property
+    def finished(self) -> bool:
+        """True once a finite source has delivered its last frame."""
+        return False
+
+    @abstractmethod
+    def release(self) -> None:
+        ...
+
+
+# ---- pacing ----------------------------------------------------------------
+class _Pacer:
+    """Sleeps so that successive tick() calls are 1/fps apart."""
+
+    def __init__(self, fps: float, realtime: bool) -> None:
+        self._interval = 1.0 / fps if fps > 0 else 0.0
+        self._realtime = realtime
+        self._next = 0.0
+
+    def tick(self) -> None:
+        if not self._realtime or self._interval == 0.0:
+            return
+        now = time.monotonic()
+        if self._next > now:
+            time.sleep(self._next - now)
+            now = self._next
+        self._next = max(self._next + self._interval, now)
+
+
+def _check_pacing(pacing: str) -> bool:
+    if pacing not in PACING_MODES:
+        raise ValueError(f"Unknown pacing {pacing!r} (expected one of {PACING_MODES})")
+    return pacing == "realtime"
+
+
+# ---- sources ---------------------------------------------------------------
+class DeviceSource(FrameSource):
+    """
+    Physical camera through cv2.VideoCapture.
+
+    Parameters
+    ----------
+    device : int
+        Camera index (0 = default webcam).
+    """
+
+    paced = True
+
+    def __init__(self, device: int = 0) -> None:
+        self._device = device
+        self._cap = cv2.VideoCapture(device)
+        self._props: dict = {}   # re-applied after reopen()
+
+    def isOpened(self) -> bool:
+        return self._cap.isOpened()
+
+    def grab(self) -> bool:
+        return self._cap.grab()
+
+    def retrieve(self, out: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        return self._cap.retrieve(out)
+
+    def read(self, out: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        return self._cap.read(out)
+
+    def set(self, prop: int, value: float) -> bool:
+        self._props[prop] = value
+        return self._cap.set(prop, value)
+
+    def reopen(self) -> bool:
+        self._cap.release()
+        self._cap = cv2.VideoCapture(self._device)
+        if not self._cap.isOpened():
+            return False
+        for prop, value in self._props.items():
+            self._cap.set(prop, value)
+        return True
+
+    def release(self) -> None:
+        self._cap.release()
+
+
+class VideoFileSource(FrameSource):
+    """
+    Recorded video file.
+
+    Parameters
+    ----------
+    path : Path
+        Any container/codec OpenCV can decode.
+    pacing : str
+        "realtime" (native FPS of the file) or "fast".
+    loop : bool
+        Rewind to the first frame at end of file.
+    """
+
+    def __init__(self, path: Path, pacing: str = "realtime", loop: bool = False) -> None:
+        self._path = Path(path)
+        self._cap  = cv2.VideoCapture(str(self._path))
+        self._loop = loop
+        self._done = False
+        self.paced = _check_pacing(pacing)
+        fps = self._cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self._pacer = _Pacer(fps, self.paced)
+
+    def isOpened(self) -> bool:
+        return self._cap.isOpened()
+
+    def grab(self) -> bool:
+        if self._done:
+            return False
+        self._pacer.tick()
+        if self._cap.grab():
+            return True
+        if self._loop:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            if self._cap.grab():
+                return True
+        self._done = True
+        return False
+
+    def retrieve(self, out: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        return self._cap.retrieve(out)
+
+    @property
+    def finished(self) -> bool:
+        return self._done
+
+    def release(self) -> None:
+        self._cap.release()
+
+
+class ImageSequenceSource(FrameSource):
+    """
+    Directory of still images, played in file-name order.
+
+    Parameters
+    ----------
+    directory : Path
+    fps : float
+        Nominal frame rate used by "realtime" pacing.
+    pacing : str
+        "realtime" or "fast".
+    loop : bool
+        Restart from the first image after the last one.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        fps: float = 30.0,
+        pacing: str = "realtime",
+        loop: bool = False,
+    ) -> None:
+        self._files: List[Path] = sorted(
+            p for p in Path(directory).iterdir()
+            if p.suffix.lower() in _IMAGE_EXTENSIONS
+        ) if Path(directory).is_dir() else []
+        self._index = -1
+        self._loop  = loop
+        self._done  = False
+        self.paced  = _check_pacing(pacing)
+        self._pacer = _Pacer(fps, self.paced)
+
+    def isOpened(self) -> bool:
+        return bool(self._files)
+
+    def grab(self) -> bool:
+        if self._done or not self._files:
+            return False
+        self._pacer.tick()
+        self._index += 1
+        if self._index >= len(self._files):
+            if not self._loop:
+                self._done = True
+                return False
+            self._index = 0
+        return True
+
+    def retrieve(self, out: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        # imread always allocates; the caller adopts the new array.
+        if not 0 <= self._index < len(self._files):
+            return False, None
+        frame = cv2.imread(str(self._files[self._index]), cv2.IMREAD_COLOR)
+        return frame is not None, frame
+
+    @property
+    def finished(self) -> bool:
+        return self._done
+
+    def release(self) -> None:
+        self._files = []
+
+
+class SyntheticSource(FrameSource):
+    """
+    Deterministic generated stream: a static gradient background with a
+    bright disc moving on a Lissajous path. Frame *n* is always identical
+    for the same parameters, so runs are reproducible.
+
+    Parameters
+    ----------
+    size : (width, height)
+    fps : float
+        Nominal frame rate used by "realtime" pacing.
+    pacing : str
+        "realtime" or "fast".
+    num_frames : int | None
+        Stop after this many frames (None = endless).
+    """
+
+    def __init__(
+        self,
+        size: Tuple[int, int] = (640, 480),
+        fps: float = 30.0,
+        pacing: str = "realtime",
+        num_frames: Optional[int] = None,
+    ) -> None:
+        w, h = size
+        self._w, self._h = w, h
+        self._fps = fps
+        self._num_frames = num_frames
+        self._index = -1
+        self._done  = False
+        self.paced  = _check_pacing(pacing)
+        self._pacer = _Pacer(fps, self.paced)
+
+        gx = np.linspace(0, 255, w, dtype=np.float32)[None, :]
+        gy = np.linspace(0, 255, h, dtype=np.float32)[:, None]
+        self._background = np.empty((h, w, 3), dtype=np.uint8)
+        self._background[..., 0] = (gx * 0.5 + gy * 0.1).astype(np.uint8)
+        self._background[..., 1] = (gy * 0.4).astype(np.uint8)
+        self._background[..., 2] = (gx * 0.2 + 40).astype(np.uint8)
+
+    def isOpened(self) -> bool:
+        return True
+
+    def grab(self) -> bool:
+        if self._done:
+            return False
+        self._pacer.tick()
+        self._index += 1
+        if self._num_frames is not None and self._index >= self._num_frames:
+            self._done = True
+            return False
+        return True
+
+    def retrieve(self, out: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        if self._index < 0 or self._done:
+            return False, None
+        if out is not None and out.shape == self._background.shape and out.dtype == np.uint8:
+            frame = out
+            np.copyto(frame, self._background)
+        else:
+            frame = self._background.copy()
+        t = self._index / self._fps
+        cx = int(self._w * (0.5 + 0.35 * np.sin(1.3 * t)))
+        cy = int(self._h * (0.5 + 0.35 * np.sin(0.9 * t + 0.5)))
+        cv2.circle(frame, (cx, cy), max(4, self._h // 10), (230, 220, 210), -1)
+        return True, frame
+
+    @property
+    def finished(self) -> bool:
+        return self._done
+
+    def release(self) -> None:
+        self._done = True
+
+
+# ---- factory ---------------------------------------------------------------
+def open_source(
+    kind: str = "device",
+    device: int = 0,
+    path: Optional[Path] = None,
+    pacing: str = "realtime",
+    fps: float = 30.0,
+    size: Tuple[int, int] = (640, 480),
+    loop: bool = False,
+) -> FrameSource:
+    """Build a FrameSource from configuration values."""
+    if kind == "device":
+        return DeviceSource(device)
+    if kind == "video":
+        if path is None:
+            raise ValueError("Video source requires a path")
+        return VideoFileSource(path, pacing=pacing, loop=loop)
+    if kind == "images":
+        if path is None:
+            raise ValueError("Image-sequence source requires a directory")
+        return ImageSequenceSource(path, fps=fps, pacing=pacing, loop=loop)
+    if kind == "synthetic":
+        return SyntheticSource(size=size, fps=fps, pacing=pacing)
+    raise ValueError(f"Unknown frame source {kind!r} (expected one of {SOURCE_KINDS})")
@@ -0,0 +1,110 @@
+"""
+GeometricClassifier — rule-based fast path for unambiguous hand states.
+
+Many frames can be classified from finger geometry alone, using the same
+per-finger features StateClassifier builds (wrist→tip distance and the
+base-joint-tip angle of every FINGERS triple, on hands normalised so the
+wrist→middle-MCP length is 1):
+
+  FIST : every fingertip close to the wrist and the four fingers bent.
+  PALM : every finger extended (long, near-180° joints), thumb open.
+
+Anything else — or two hands in different poses — returns None and goes
+to the model. Thresholds are deliberately conservative: the fast path
+should only take frames the model would classify the same way, which
+StateClassifier's "shadow" mode and benchmarks/fast_path_bench.py measure.
+
+This is an experiment meant to run in "shadow" mode first. The check
+costs a couple of microseconds per frame, so "on" pays off only once the
+rules resolve more frames than that cost relative to the model's. With
+the default thresholds they resolve about 1% of synthetic frames, which
+is roughly break-even. Tune the thresholds on recorded data before
+using "on".
+"""
+from __future__ import annotations
+from typing import List, Optional
+
+import numpy as np
+
+from domain.enums import HandState
+
+_THUMB = 0
+_FINGERS = slice(1, 5)   # INDEX, MIDDLE, RING, PINKY within a per-hand block
+
+
+class GeometricClassifier:
+    """
+    Parameters
+    ----------
+    fist_max_dist : float
+        Largest finger wrist→tip distance (palm lengths) for FIST.
+    fist_max_thumb_dist : float
+        Largest thumb wrist→tip distance for FIST.
+    fist_max_angle : float
+        Largest joint angle (degrees) of the four fingers for FIST.
+    palm_min_dist : float
+        Smallest finger wrist→tip distance for PALM.
+    palm_min_thumb_dist : float
+        Smallest thumb wrist→tip distance for PALM.
+    palm_min_angle : float
+        Smallest joint angle of all five fingers for PALM.
+    confidence : float
+        Confidence reported for a rule decision.
+    """
+
+    def __init__(
+        self,
+        fist_max_dist: float = 1.0,
+        fist_max_thumb_dist: float = 0.9,
+        fist_max_angle: float = 120.0,
+        palm_min_dist: float = 1.4,
+        palm_min_thumb_dist: float = 1.0,
+        palm_min_angle: float = 155.0,
+        confidence: float = 0.95,
+    ) -> None:
+        self._fist_max_dist = fist_max_dist
+        self._fist_max_thumb_dist = fist_max_thumb_dist
+        self._fist_max_angle = fist_max_angle
+        self._palm_min_dist = palm_min_dist
+        self._palm_min_thumb_dist = palm_min_thumb_dist
+        self._palm_min_angle = palm_min_angle
+        self.confidence = confidence
+
+    # ------------------------------------------------------------------
+    def classify(self, features: np.ndarray) -> Optional[HandState]:
+        """
+        Parameters
+        ----------
+        features : np.ndarray
+            StateClassifier row: 10 values per hand (5 distances, 5 angles),
+            all zeros for a hand that is not present.
+
+        Returns
+        -------
+        HandState.FIST / HandState.PALM when every present hand clearly
+        matches the same rule, else None.
+        """
+        # Plain floats: numpy reductions on 5-element slices cost more than
+        # the comparisons themselves, and this runs on every frame
+        values = features.tolist()
+        decided: Optional[HandState] = None
+        for start in range(0, len(values), 10):
+            block = values[start:start + 10]
+            if not any(block):
+                continue                      # hand not present
+            state = self._classify_hand(block[:5], block[5:])
+            if state is None or (decided is not None and state != decided):
+                return None
+            decided = state
+        return decided
+
+    def _classify_hand(self, dists: List[float], angles: List[float]) -> Optional[HandState]:
+        if (dists[_THUMB] <= self._fist_max_thumb_dist
+                and max(dists[_FINGERS]) <= self._fist_max_dist
+                and max(angles[_FINGERS]) <= self._fist_max_angle):
+            return HandState.FIST
+        if (dists[_THUMB] >= self._palm_min_thumb_dist
+                and min(dists[_FINGERS]) >= self._palm_min_dist
+                and min(angles) >= self._palm_min_angle):
+            return HandState.PALM
+        return None
@@ -8,9 +8,11 @@ Design decisions:
   - Transition gestures (pause, mute) are checked first and short-circuit.
   - Each gesture receives a FrameData value object — no positional arg soup.
   - Pause state gates all other gestures.
+  - Mono-hand gestures reset when the main hand becomes a different
+    physical hand (persistent hand ID changes), never on a side flip.
 """
 from __future__ import annotations
-from typing import List
+from typing import List, Optional
 
 from domain.enums import GestureEvent
 from domain.models import FrameData
@@ -58,6 +60,8 @@ class GestureManager:
         # ---- multi-hand gestures -------------------------------------
         self._task_view = TaskViewGesture(cooldown)
 
+        self._main_hand_id: Optional[int] = None
+
     # ------------------------------------------------------------------
     def process(self, frame_data: FrameData) -> List[GestureEvent]:
         """
@@ -86,7 +90,12 @@ class GestureManager:
 
         events: List[GestureEvent] = []
 
-        # 4. Mono-hand gestures
+        # 4. Mono-hand gestures (smoothing belongs to one physical hand)
+        hand_id = frame_data.main_hand_id
+        if hand_id is not None and hand_id != self._main_hand_id:
+            if self._main_hand_id is not None:
+                self._reset_mono_hand()
+            self._main_hand_id = hand_id
         if frame_data.main_hand is not None:
             events.extend(self._scroll.detect(frame_data))
             events.extend(self._volume.detect(frame_data))
@@ -99,6 +108,12 @@ class GestureManager:
 
         return events
 
+    def _reset_mono_hand(self) -> None:
+        for gesture in [
+            self._scroll, self._volume, self._zoom, self._screenshot, self._close_window,
+        ]:
+            gesture.reset()
+
     def reset_all(self) -> None:
         """Force-reset every gesture detector (e.g. on hand loss)."""
         for gesture in [
@@ -0,0 +1,174 @@
+"""
+HandIdentityTracker — stable hand IDs and "Left"/"Right" sides across frames.
+
+Deciding the side from which half of the image the wrist is in flips a
+hand's identity whenever it crosses the centre line, and every gesture
+then resets its smoothing and arm timers. Instead, each hand becomes a
+track with a persistent ID and a sticky side:
+
+  - detections are matched to tracks by nearest neighbour against a
+    constant-velocity prediction of the palm centre, with a penalty when
+    MediaPipe's handedness disagrees with the track's side;
+  - a track that misses a few frames coasts on its velocity before it is
+    dropped, so a brief detection gap keeps the same ID;
+  - a new track takes its side from a confident handedness label, then
+    from the image half (the old rule), then whatever side is still free.
+
+MediaPipe assumes a mirrored (selfie) image while frames here are not
+flipped, so its "Left" label is this app's "Right" side and vice versa.
+"""
+from __future__ import annotations
+import itertools
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_PALM = [0, 5, 9, 13, 17]
+_SIDES = ("Right", "Left")
+_MIRROR = {"Left": "Right", "Right": "Left"}
+
+Handedness = Tuple[str, float]   # (MediaPipe label, score)
+
+
+@dataclass
+class _Track:
+    id: int
+    side: str
+    pos: np.ndarray        # palm centre, full-frame normalised (x, y)
+    vel: np.ndarray        # per-frame displacement
+    missed: int = 0
+
+
+class HandIdentityTracker:
+    """
+    Parameters
+    ----------
+    max_jump : float
+        Largest distance (normalised image units) between a track's
+        prediction and a detection that still counts as the same hand.
+    handedness_weight : float
+        Cost added (scaled by the label score) when MediaPipe's handedness
+        contradicts the track's side.
+    handedness_min_score : float
+        Minimum score for a handedness label to decide a new track's side.
+    max_missed : int
+        Frames a track may go undetected before its ID is retired.
+    """
+
+    def __init__(
+        self,
+        max_jump: float = 0.25,
+        handedness_weight: float = 0.15,
+        handedness_min_score: float = 0.8,
+        max_missed: int = 3,
+    ) -> None:
+        self._max_jump = max_jump
+        self._handedness_weight = handedness_weight
+        self._handedness_min_score = handedness_min_score
+        self._max_missed = max_missed
+        self._tracks: List[_Track] = []
+        self._next_id = 1
+
+    # ------------------------------------------------------------------
+    def assign(
+        self,
+        raw: np.ndarray,
+        handedness: Optional[Sequence[Handedness]] = None,
+    ) -> List[Tuple[str, int]]:
+        """
+        Match this frame's hands to tracks.
+
+        Parameters
+        ----------
+        raw : np.ndarray
+            (n, 21, 3) full-frame normalised landmarks.
+        handedness : sequence of (label, score) | None
+            MediaPipe handedness per detection (None on optical-flow frames).
+
+        Returns
+        -------
+        list of (side, id), one per detection, in input order.
+        """
+        centres = raw[:, _PALM, :2].mean(axis=1)
+        sides = [self._label_side(handedness, i) for i in range(len(raw))]
+        match = self._match(centres, sides)
+
+        result: List[Tuple[str, int]] = []
+        matched = set()
+        for i, t in enumerate(match):
+            if t is None:
+                continue
+            track = self._tracks[t]
+            track.vel = 0.5 * track.vel + 0.5 * (centres[i] - track.pos)
+            track.pos = centres[i]
+            track.missed = 0
+            matched.add(t)
+
+        # Unmatched tracks coast on their velocity until they expire
+        for t, track in enumerate(self._tracks):
+            if t not in matched:
+                track.missed += 1
+                track.pos = track.pos + track.vel
+        keep = [track for track in self._tracks if track.missed <= self._max_missed]
+        matched_tracks = [self._tracks[t] if t is not None else None for t in match]
+        self._tracks = keep
+
+        for i, track in enumerate(matched_tracks):
+            if track is None:
+                confident = sides[i] is not None and sides[i][1] >= self._handedness_min_score
+                track = self._new_track(centres[i], sides[i][0] if confident else None)
+            result.append((track.side, track.id))
+        return result
+
+    def reset(self) -> None:
+        self._tracks = []
+
+    # ------------------------------------------------------------------
+    def _label_side(
+        self, handedness: Optional[Sequence[Handedness]], i: int
+    ) -> Optional[Tuple[str, float]]:
+        """(side, score) from MediaPipe's label, mapped to the unmirrored frame."""
+        if handedness is None or i >= len(handedness):
+            return None
+        label, score = handedness[i]
+        return _MIRROR.get(label, label), score
+
+    def _cost(self, centre: np.ndarray, side: Optional[Tuple[str, float]], track: _Track) -> float:
+        dist = float(np.hypot(*(centre - (track.pos + track.vel))))
+        if dist > self._max_jump:
+            return np.inf
+        if side is not None and side[0] != track.side:
+            dist += self._handedness_weight * side[1]
+        return dist
+
+    def _match(
+        self, centres: np.ndarray, sides: List[Optional[Tuple[str, float]]]
+    ) -> List[Optional[int]]:
+        """Cheapest detection→track assignment (brute force; n ≤ 2 in practice)."""
+        n, m = len(centres), len(self._tracks)
+        cost = np.array([[self._cost(centres[i], sides[i], track) for track in self._tracks]
+                         for i in range(n)]).reshape(n, m)
+        unmatched = self._max_jump + self._handedness_weight   # price of a new ID
+
+        best: List[Optional[int]] = [None] * n
+        best_cost = n * unmatched
+        for perm in itertools.permutations(list(range(m)) + [None] * n, n):
+            total = sum(unmatched if t is None else cost[i, t] for i, t in enumerate(perm))
+            if total < best_cost:
+                best, best_cost = list(perm), total
+        return best
+
+    def _new_track(self, centre: np.ndarray, label_side: Optional[str]) -> _Track:
+        taken = {track.side for track in self._tracks if track.missed == 0}
+        # Image half of the palm: left half of the unmirrored frame → "Right"
+        positional = "Right" if centre[0] < 0.5 else "Left"
+        for side in (label_side, positional, *_SIDES):
+            if side is not None and side not in taken:
+                break
+        # A coasting track on that side gives way to the new hand
+        self._tracks = [track for track in self._tracks if track.side != side]
+        track = _Track(self._next_id, side, centre.copy(), np.zeros(2, dtype=centre.dtype))
+        self._next_id += 1
+        self._tracks.append(track)
+        return track
@@ -1,28 +1,199 @@
 """
 HandTracker — encapsulates all MediaPipe logic and landmark processing.
 The rest of the application never imports mediapipe directly.
+
+Input reduction
+---------------
+  - max_input_side : full frames larger than this are downscaled before
+                     inference (normalised landmarks are unaffected).
+  - ROI mode       : once hands are known, only a square crop around the
+                     previous hand boxes (plus margin) is fed to MediaPipe,
+                     resized to roi_input_side. A full-frame re-scan runs
+                     every roi_rescan_interval frames and whenever the crop
+                     loses a hand. Landmarks are remapped to full-frame
+                     coordinates, so callers never see the difference.
+
+Keyframe tracking
+-----------------
+  - keyframe_interval : MediaPipe runs on every k-th frame only; in between
+                        the 21 landmarks of each hand are propagated with
+                        pyramidal Lucas-Kanade optical flow on a greyscale
+                        frame (z is carried over from the last keyframe).
+  - flow_max_error    : forward-backward error (pixels) above which the
+                        propagation is rejected and MediaPipe re-detects
+                        immediately. New hands only appear on keyframes.
 """
 from __future__ import annotations
-import math
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 
 import cv2
 import mediapipe as mp
+import numpy as np
+
+from core.hand_identity import Handedness, HandIdentityTracker
+from domain.models import FrameTiming, HandIds, HandsData, HandsRaw
+
+Box = Tuple[int, int, int]   # (x0, y0, side) — square crop in frame pixels
+
+
+class _RoiSelector:
+    """
+    Keeps a sticky square region of interest around the tracked hands.
+
+    The box only moves when a hand leaves its inner area, which keeps
+    MediaPipe's own frame-to-frame tracking stable.
+    """
+
+    def __init__(self, margin: float, rescan_interval: int) -> None:
+        self._margin = margin
+        self._rescan_interval = rescan_interval
+        self._box: Optional[Box] = None
+        self._hands = 0
+        self._since_scan = 0
+
+    def select(self) -> Optional[Box]:
+        """Box to crop this frame, or None for a full-frame scan."""
+        if self._box is None or self._since_scan >= self._rescan_interval:
+            return None
+        return self._box
+
+    def update(self, pixels: np.ndarray, w: int, h: int, cropped: bool) -> None:
+        """Feed the (full-frame) pixel landmarks found this frame, shape (n, 21, 2)."""
+        if not cropped:
+            self._since_scan = 0
+        else:
+            self._since_scan += 1
+
+        if len(pixels) == 0:
+            self._box = None
+            self._hands = 0
+            return
+        if cropped and len(pixels) < self._hands:
+            self._box = None  # lost a hand inside the crop — re-scan next frame
+            return
+        self._hands = len(pixels)
+
+        (bx0, by0), (bx1, by1) = pixels.min(axis=(0, 1)), pixels.max(axis=(0, 1))
+
+        if self._box is not None:
+            x0, y0, side = self._box
+            inner = side * self._margin / (1 + 2 * self._margin)
+            if (bx0 >= x0 + inner * 0.5 and bx1 <= x0 + side - inner * 0.5
+                    and by0 >= y0 + inner * 0.5 and by1 <= y0 + side - inner * 0.5):
+                return  # still comfortably inside — keep the box
+
+        side = int(max(bx1 - bx0, by1 - by0) * (1 + 2 * self._margin))
+        if side >= min(w, h):
+            self._box = None  # crop would not be smaller than the frame
+            return
+        cx, cy = (bx0 + bx1) / 2, (by0 + by1) / 2
+        x0 = int(min(max(cx - side / 2, 0), w - side))
+        y0 = int(min(max(cy - side / 2, 0), h - side))
+        self._box = (x0, y0, side)
+
+    def reset(self) -> None:
+        self._box = None
+        self._hands = 0
+        self._since_scan = 0
+
+
+class _FlowPropagator:
+    """
+    Moves the last landmarks to the current frame with pyramidal LK flow,
+    and refuses (returns None) when a keyframe is due or the track is bad.
+    """
+
+    _LK = dict(
+        winSize=(21, 21),
+        maxLevel=3,
+        criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 20, 0.03),
+    )
+    _MAX_LOST = 3   # points per hand allowed to fail before re-detecting
+
+    def __init__(self, interval: int, max_error: float) -> None:
+        self._interval = interval
+        self._max_error = max_error
+        self._gray:      Optional[np.ndarray] = None   # current frame
+        self._prev_gray: Optional[np.ndarray] = None   # frame of self._raw
+        self._raw: Optional[np.ndarray] = None          # (n, 21, 3) last output
+        self._since_key = 0
+        self.rejected = 0   # propagations refused by the forward-backward check
+
+    def grey(self, frame: np.ndarray) -> None:
+        """Convert the current frame into the reused greyscale buffer."""
+        h, w = frame.shape[:2]
+        if self._gray is None or self._gray.shape != (h, w):
+            self._gray = np.empty((h, w), dtype=np.uint8)
+        if self._prev_gray is not None and self._prev_gray.shape != (h, w):
+            self._prev_gray = None   # resolution changed — no valid reference
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+
+    def propagate(self, w: int, h: int) -> Optional[np.ndarray]:
+        """Landmarks moved onto the current frame, or None if MediaPipe must run."""
+        raw = self._raw
+        if (raw is None or len(raw) == 0 or self._prev_gray is None
+                or self._since_key >= self._interval - 1):
+            return None
+
+        scale = np.array([w, h], dtype=np.float32)
+        p0 = (raw[:, :, :2] * scale).reshape(-1, 1, 2)
+        p1, st1, _ = cv2.calcOpticalFlowPyrLK(self._prev_gray, self._gray, p0, None, **self._LK)
+        back, st2, _ = cv2.calcOpticalFlowPyrLK(self._gray, self._prev_gray, p1, None, **self._LK)
+
+        error = np.linalg.norm((p0 - back).reshape(-1, 2), axis=1)
+        good = (st1.ravel() == 1) & (st2.ravel() == 1) & (error < self._max_error)
+        good = good.reshape(len(raw), 21)
+        if ((~good).sum(axis=1) > self._MAX_LOST).any():
+            self.rejected += 1
+            return None
+
+        moved = p1.reshape(len(raw), 21, 2)
+        out = raw.copy()
+        # Points that failed keep their last position
+        out[:, :, :2] = np.where(good[:, :, None], moved / scale, raw[:, :, :2])
+        return out
 
-from domain.models import HandsData, HandsRaw, Landmark2D
+    def commit(self, raw: np.ndarray, keyframe: bool) -> None:
+        """Record this frame's output; the current grey frame becomes the reference."""
+        self._raw = raw
+        self._since_key = 0 if keyframe else self._since_key + 1
+        self._prev_gray, self._gray = self._gray, self._prev_gray
+
+    def reset(self) -> None:
+        self._raw = None
+        self._prev_gray = None
+        self._since_key = 0
 
 
 class HandTracker:
     """
     Processes a BGR frame and returns normalised hand landmarks
     (geometry-normalised so features are scale/translation invariant)
-    plus the raw MediaPipe objects (needed for Z-depth gestures).
+    plus the raw MediaPipe coordinates (needed for Z-depth gestures).
+    The input frame is left untouched.
 
     Parameters
     ----------
     max_num_hands : int
     min_detection_confidence : float
     min_tracking_confidence : float
+    model_complexity : int
+        MediaPipe hands model (1 = full, 0 = lite).
+    max_input_side : int
+        Downscale full frames whose longest side exceeds this (0 = off).
+    roi_enabled : bool
+        Crop around the previous hands instead of feeding the full frame.
+    roi_margin : float
+        Margin added on each side of the hand box, as a fraction of its size.
+    roi_rescan_interval : int
+        Frames between forced full-frame scans (new hands entering).
+    roi_input_side : int
+        Side of the square image the crop is resized to.
+    keyframe_interval : int
+        Run MediaPipe every k-th frame and propagate landmarks with optical
+        flow in between (0 or 1 = MediaPipe on every frame).
+    flow_max_error : float
+        Forward-backward flow error in pixels that forces a re-detect.
     """
 
     def __init__(
@@ -30,79 +201,219 @@ class HandTracker:
         max_num_hands: int = 2,
         min_detection_confidence: float = 0.2,
         min_tracking_confidence: float = 0.2,
+        model_complexity: int = 1,
+        max_input_side: int = 0,
+        roi_enabled: bool = False,
+        roi_margin: float = 0.25,
+        roi_rescan_interval: int = 15,
+        roi_input_side: int = 256,
+        keyframe_interval: int = 0,
+        flow_max_error: float = 1.5,
     ) -> None:
         self._mp_hands = mp.solutions.hands
-        self._mp_draw  = mp.solutions.drawing_utils
-        self._hands    = self._mp_hands.Hands(
+        self._hands_kwargs = dict(
             static_image_mode=False,
             max_num_hands=max_num_hands,
             min_detection_confidence=min_detection_confidence,
             min_tracking_confidence=min_tracking_confidence,
         )
+        self._model_complexity = model_complexity
+        self._hands = self._mp_hands.Hands(
+            model_complexity=model_complexity, **self._hands_kwargs
+        )
+        self._max_input_side = max_input_side
+        self._roi_input_side = roi_input_side
+        self._roi = _RoiSelector(roi_margin, roi_rescan_interval) if roi_enabled else None
+        self._flow = (_FlowPropagator(keyframe_interval, flow_max_error)
+                      if keyframe_interval > 1 else None)
+        self._propagated = False
+        self._identity = HandIdentityTracker()
+
+        # Reused scratch buffers (MediaPipe copies its input into its own packet)
+        self._rgb:    Optional[np.ndarray] = None   # RGB image fed to MediaPipe
+        self._scaled: Optional[np.ndarray] = None   # resized BGR (downscale / ROI)
 
     # ------------------------------------------------------------------
-    def process(self, frame: Any) -> Tuple[HandsData, HandsRaw]:
+    def process(
+        self, frame: Any, timing: Optional[FrameTiming] = None
+    ) -> Tuple[HandsData, HandsRaw, HandIds]:
         """
         Parameters
         ----------
         frame : np.ndarray
             BGR frame from OpenCV.
+        timing : FrameTiming | None
+            Capture clock of the frame; the elapsed time is recorded
+            under the "track" stage.
 
         Returns
         -------
-        (hands_data, hands_raw)
-            hands_data  : geometry-normalised landmark lists per side.
-            hands_raw   : raw mp.solutions.hands objects per side (for depth).
+        (hands_data, hands_raw, hand_ids)
+            hands_data  : geometry-normalised (21, 3) float32 views per side.
+            hands_raw   : (21, 3) float32 views per side of the MediaPipe
+                          (x, y, z) landmarks (for depth), always in
+                          full-frame normalised coordinates.
+            hand_ids    : persistent track ID per side (HandIdentityTracker);
+                          a hand keeps its side and ID while it is tracked.
         """
+        if timing is None:
+            return self._process(frame)
+        with timing.stage("track"):
+            return self._process(frame)
+
+    @property
+    def propagated(self) -> bool:
+        """True if the last result came from optical flow instead of MediaPipe."""
+        return self._propagated
+
+    def _process(self, frame: Any) -> Tuple[HandsData, HandsRaw, HandIds]:
         h, w, _ = frame.shape
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self._hands.process(rgb)
-
-        # Draw landmarks onto the original frame (mutates frame in-place)
-        raw_list: List[Any] = []
-        pixel_list: List[List[Landmark2D]] = []
-
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                self._mp_draw.draw_landmarks(
-                    frame, hand_landmarks, self._mp_hands.HAND_CONNECTIONS
-                )
-                pixel_coords = [(lm.x * w, lm.y * h) for lm in hand_landmarks.landmark]
-                pixel_list.append(pixel_coords)
-                raw_list.append(hand_landmarks)
-
-        # Assign left / right by X position (leftmost wrist → "Right" hand
-        # in mirror-view; rightmost → "Left")
+
+        raw: Optional[np.ndarray] = None
+        handedness = None
+        if self._flow is not None:
+            self._flow.grey(frame)
+            raw = self._flow.propagate(w, h)
+        self._propagated = raw is not None
+        if raw is None:
+            raw, handedness = self._detect(frame, w, h)
+        if self._flow is not None:
+            self._flow.commit(raw, keyframe=not self._propagated)
+
         hands_data: HandsData = {}
         hands_raw:  HandsRaw  = {}
+        hand_ids:   HandIds   = {}
+        if len(raw) > 2:
+            raw = raw[:2]
+        labels = self._identity.assign(raw, handedness)
+        if len(raw) == 0:
+            return hands_data, hands_raw, hand_ids
 
-        if len(pixel_list) == 1:
-            wrist_x = pixel_list[0][0][0]
-            side = "Right" if wrist_x < w // 2 else "Left"
-            hands_data[side] = self._normalise(pixel_list[0])
-            hands_raw[side]  = raw_list[0]
+        pixels = raw * np.array([w, h, w], dtype=np.float32)   # z shares the width scale
+        norm = self._normalise(pixels)
+        for i, (side, hand_id) in enumerate(labels):
+            hands_data[side] = norm[i]
+            hands_raw[side]  = raw[i]
+            hand_ids[side]   = hand_id
+        return hands_data, hands_raw, hand_ids
 
-        elif len(pixel_list) == 2:
-            paired = sorted(zip(pixel_list, raw_list), key=lambda p: p[0][0][0])
-            hands_data["Right"] = self._normalise(paired[0][0])
-            hands_data["Left"]  = self._normalise(paired[1][0])
-            hands_raw["Right"]  = paired[0][1]
-            hands_raw["Left"]   = paired[1][1]
+    # ------------------------------------------------------------------
+    def _detect(
+        self, frame: np.ndarray, w: int, h: int
+    ) -> Tuple[np.ndarray, List[Handedness]]:
+        """
+        Run MediaPipe (full frame or ROI crop) → (n, 21, 3) full-frame
+        landmarks plus the (label, score) handedness of each hand.
+        """
+        box = self._roi.select() if self._roi is not None else None
 
-        return hands_data, hands_raw
+        if box is None:
+            results = self._hands.process(self._prepare_full(frame))
+        else:
+            x0, y0, side = box
+            results = self._hands.process(
+                self._prepare(frame[y0:y0 + side, x0:x0 + side],
+                              (self._roi_input_side, self._roi_input_side))
+            )
+
+        # Pure data: the frame is never modified (drawing lives in core.overlay).
+        # Protobuf landmarks are read exactly once, into an (n, 21, 3) array.
+        raw = self._to_array(results.multi_hand_landmarks)
+        if box is not None and len(raw):
+            self._remap(raw, box, w, h)
+
+        if self._roi is not None:
+            xy = raw[:, :, :2] * np.array([w, h], dtype=np.float32)
+            self._roi.update(xy, w, h, cropped=box is not None)
+
+        handedness = [
+            (c.classification[0].label, c.classification[0].score)
+            for c in (results.multi_handedness or [])
+        ]
+        return raw, handedness
+
+    def _prepare_full(self, frame: np.ndarray) -> np.ndarray:
+        """Full-frame input, downscaled when it exceeds max_input_side."""
+        h, w = frame.shape[:2]
+        longest = max(h, w)
+        if self._max_input_side and longest > self._max_input_side:
+            scale = self._max_input_side / longest
+            return self._prepare(frame, (max(1, int(w * scale)), max(1, int(h * scale))))
+        return self._prepare(frame, None)
+
+    def _prepare(self, bgr: np.ndarray, size: Optional[Tuple[int, int]]) -> np.ndarray:
+        """Resize (optional) and convert to RGB into the reused scratch buffers."""
+        if size is not None:
+            w, h = size
+            if self._scaled is None or self._scaled.shape[:2] != (h, w):
+                self._scaled = np.empty((h, w, 3), dtype=np.uint8)
+            cv2.resize(bgr, size, dst=self._scaled, interpolation=cv2.INTER_AREA)
+            bgr = self._scaled
+        if self._rgb is None or self._rgb.shape != bgr.shape:
+            self._rgb = np.empty_like(bgr)
+        cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        return self._rgb
+
+    @staticmethod
+    def _to_array(multi_hand_landmarks: Any) -> np.ndarray:
+        """MediaPipe landmark lists → float32 (n, 21, 3) array of (x, y, z)."""
+        if not multi_hand_landmarks:
+            return np.empty((0, 21, 3), dtype=np.float32)
+        return np.array(
+            [[(lm.x, lm.y, lm.z) for lm in hand.landmark] for hand in multi_hand_landmarks],
+            dtype=np.float32,
+        )
+
+    @staticmethod
+    def _remap(raw: np.ndarray, box: Box, w: int, h: int) -> None:
+        """Convert crop-normalised landmarks to full-frame normalised (in place)."""
+        x0, y0, side = box
+        raw[:, :, 0] = (x0 + raw[:, :, 0] * side) / w
+        raw[:, :, 1] = (y0 + raw[:, :, 1] * side) / h
+        raw[:, :, 2] *= side / w   # z shares the image-width scale of x
+
+    def set_max_input_side(self, side: int) -> None:
+        """Change the full-frame downscale limit (0 = no downscaling)."""
+        self._max_input_side = side
+
+    def set_model_complexity(self, complexity: int) -> None:
+        """Rebuild the MediaPipe graph with another model (no-op if unchanged)."""
+        if complexity == self._model_complexity:
+            return
+        self._hands.close()
+        self._hands = self._mp_hands.Hands(
+            model_complexity=complexity, **self._hands_kwargs
+        )
+        self._model_complexity = complexity
+        if self._roi is not None:
+            self._roi.reset()
+        if self._flow is not None:
+            self._flow.reset()
+
+    def reset(self) -> None:
+        """
+        Forget everything carried between frames: the ROI box, the optical-flow
+        reference and the hand identities. Call after a gap in the stream
+        (capture stall, camera reconnect), where the last hands no longer
+        describe the next frame.
+        """
+        if self._roi is not None:
+            self._roi.reset()
+        if self._flow is not None:
+            self._flow.reset()
+        self._identity.reset()
+        self._propagated = False
 
-    # ------------------------------------------------------------------
     @staticmethod
-    def _normalise(landmarks: List[Landmark2D]) -> List[Landmark2D]:
+    def _normalise(pixels: np.ndarray) -> np.ndarray:
         """
         Translate so the wrist is the origin, then scale so that the
-        wrist→middle-MCP distance equals 1.
+        (x, y) wrist→middle-MCP distance equals 1. Works on all hands at once.
         """
-        x0, y0 = landmarks[0]
-        centered = [(x - x0, y - y0) for x, y in landmarks]
-        sx, sy = centered[9]
-        scale = math.hypot(sx, sy) or 1.0
-        return [(x / scale, y / scale) for x, y in centered]
+        centered = pixels - pixels[:, :1]
+        scale = np.hypot(centered[:, 9, 0], centered[:, 9, 1])
+        scale[scale == 0] = 1.0
+        return centered / scale[:, None, None]
 
     def release(self) -> None:
-        self._hands.close()
\ No newline at end of file
+        self._hands.close()
@@ -0,0 +1,76 @@
+"""
+IdleGovernor — decides the capture/inference rate from hand presence.
+
+After ``idle_after`` seconds without hands the pipeline drops to a low
+presence-check rate; the first frame that sees a hand switches straight
+back to the full rate, so the next frame is already captured at full speed.
+"""
+from __future__ import annotations
+from typing import Optional
+
+
+class IdleGovernor:
+    """
+    Parameters
+    ----------
+    active_fps : float
+        Rate used while hands are (or were recently) present.
+    idle_fps : float
+        Presence-check rate used while idle.
+    idle_after : float
+        Seconds without hands before going idle.
+    """
+
+    IDLE   = "idle"
+    ACTIVE = "active"
+
+    def __init__(
+        self,
+        active_fps: float = 30.0,
+        idle_fps: float = 2.0,
+        idle_after: float = 10.0,
+    ) -> None:
+        self._active_fps = active_fps
+        self._idle_fps   = idle_fps
+        self._idle_after = idle_after
+        self._idle       = False
+        self._last_seen: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    def update(self, hands_present: bool, now: float) -> Optional[str]:
+        """
+        Feed one frame's presence result (``now`` = capture timestamp).
+
+        Returns IdleGovernor.IDLE / IdleGovernor.ACTIVE on a transition,
+        None otherwise.
+        """
+        if self._last_seen is None:
+            self._last_seen = now
+
+        if hands_present:
+            self._last_seen = now
+            if self._idle:
+                self._idle = False
+                return self.ACTIVE
+            return None
+
+        if not self._idle and now - self._last_seen >= self._idle_after:
+            self._idle = True
+            return self.IDLE
+        return None
+
+    @property
+    def idle(self) -> bool:
+        return self._idle
+
+    @property
+    def fps(self) -> float:
+        """Rate the capture should currently run at."""
+        return self._idle_fps if self._idle else self._active_fps
+
+    def set_active_fps(self, fps: float) -> None:
+        self._active_fps = fps
+
+    def reset(self) -> None:
+        self._idle = False
+        self._last_seen = None
@@ -0,0 +1,153 @@
+"""
+GestureKey model format (.gkm) — a compiled forest as one mappable file.
+
+Loading the pickled Random Forest means unpickling every tree object
+(slow, and tied to the scikit-learn version that wrote it). A .gkm file
+holds the flat arrays of CompiledForest plus the schema, and is opened
+with a read-only memory map: loading costs a header parse, the arrays are
+views into the page cache, and every process that opens the same file
+shares those pages instead of holding its own copy.
+
+Layout (little-endian)
+----------------------
+  0   magic   b"GKM\\0"
+  4   uint32  format version
+  8   uint64  header length H
+  16  H bytes UTF-8 JSON header: kind, n_features, max_depth,
+              feature_names, classes, classes_dtype and, per array,
+              dtype/shape/offset
+  ... arrays, each starting on a 64-byte boundary
+
+Convert a trained model with ``python tools/convert_model.py``.
+"""
+from __future__ import annotations
+import json
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from core.compiled_forest import CompiledForest
+
+MAGIC = b"GKM\0"
+VERSION = 1
+SUFFIX = ".gkm"
+
+_PREFIX = struct.Struct("<4sIQ")   # magic, version, header length
+_ALIGN = 64
+_ARRAYS = ("feature", "threshold", "children", "value", "roots")
+_DTYPES = {"feature": "<i8", "threshold": "<f8", "children": "<i8", "value": "<f8", "roots": "<i8"}
+
+
+def _align(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _labels(classes: np.ndarray) -> List[Any]:
+    """Class labels as JSON values; ``classes_dtype`` restores the array type."""
+    labels = [label.item() if isinstance(label, np.generic) else label for label in classes.tolist()]
+    for label in labels:
+        if not isinstance(label, (str, int, float, bool)):
+            raise TypeError(f"Class label {label!r} of type {type(label).__name__} cannot be stored in a .gkm file")
+    return labels
+
+
+def save_forest(forest: CompiledForest, feature_names: Sequence[str], path: Path) -> None:
+    """
+    Write ``forest`` and its input schema to ``path``.
+
+    Raises
+    ------
+    TypeError
+        If a class label is not a string, integer, float or bool.
+    """
+    arrays = {name: np.ascontiguousarray(getattr(forest, name), dtype=_DTYPES[name]) for name in _ARRAYS}
+    header: Dict[str, Any] = {
+        "kind": "forest",
+        "n_features": forest.n_features_in_,
+        "max_depth": forest.max_depth,
+        "feature_names": [str(name) for name in feature_names],
+        "classes": _labels(forest.classes_),
+        "classes_dtype": forest.classes_.dtype.str,
+        "arrays": {},
+    }
+    # Offsets depend on the header size, which depends on the offsets:
+    # lay out until the header stops growing (offsets only increase).
+    body_start = 0
+    while True:
+        offset = body_start
+        for name, array in arrays.items():
+            header["arrays"][name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+            offset = _align(offset + array.nbytes)
+        blob = json.dumps(header).encode("utf-8")
+        if _align(_PREFIX.size + len(blob)) <= body_start:
+            break
+        body_start = _align(_PREFIX.size + len(blob))
+
+    with open(path, "wb") as fh:
+        fh.write(_PREFIX.pack(MAGIC, VERSION, len(blob)))
+        fh.write(blob)
+        for name, array in arrays.items():
+            fh.seek(header["arrays"][name]["offset"])
+            fh.write(array.tobytes())
+
+
+def read_header(path: Path) -> Dict[str, Any]:
+    """
+    Parse and check the header without mapping the arrays.
+
+    Raises
+    ------
+    ValueError
+        Not a .gkm file, unsupported version, or arrays outside the file.
+    """
+    size = Path(path).stat().st_size
+    with open(path, "rb") as fh:
+        prefix = fh.read(_PREFIX.size)
+        if len(prefix) < _PREFIX.size:
+            raise ValueError(f"{path}: truncated model file")
+        magic, version, length = _PREFIX.unpack(prefix)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a GestureKey model file")
+        if version != VERSION:
+            raise ValueError(f"{path}: model format v{version}, this build reads v{VERSION}")
+        header = json.loads(fh.read(length).decode("utf-8"))
+
+    if header.get("kind") != "forest":
+        raise ValueError(f"{path}: unsupported model kind {header.get('kind')!r}")
+    for name in _ARRAYS:
+        spec = header["arrays"].get(name)
+        if spec is None:
+            raise ValueError(f"{path}: missing array {name!r}")
+        end = spec["offset"] + int(np.prod(spec["shape"])) * np.dtype(spec["dtype"]).itemsize
+        if spec["offset"] % _ALIGN or end > size:
+            raise ValueError(f"{path}: array {name!r} lies outside the file")
+    return header
+
+
+def load_forest(path: Path) -> Tuple[CompiledForest, List[str]]:
+    """
+    Map a .gkm file read-only.
+
+    Returns
+    -------
+    (CompiledForest over views of the mapping, feature_names)
+    """
+    header = read_header(path)
+    mapping = np.memmap(path, dtype=np.uint8, mode="r")
+    arrays = {}
+    for name in _ARRAYS:
+        spec = header["arrays"][name]
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"]))
+        arrays[name] = np.frombuffer(mapping, dtype=dtype, count=count, offset=spec["offset"]).reshape(spec["shape"])
+    # Files without classes_dtype stored every label as a string
+    classes = np.asarray(header["classes"], dtype=header.get("classes_dtype"))
+    forest = CompiledForest(
+        classes=classes,
+        max_depth=header["max_depth"],
+        n_features=header["n_features"],
+        **arrays,
+    )
+    return forest, header["feature_names"]
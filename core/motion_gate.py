@@ -0,0 +1,87 @@
+"""
+MotionGate — cheap pre-stage that decides whether a frame needs MediaPipe.
+
+The frame is shrunk to a tiny greyscale thumbnail (INTER_AREA averages
+away sensor noise) and compared with the thumbnail of the last frame
+that actually went through the tracker. If too few pixels changed, the
+caller reuses the previous HandsData instead of running inference.
+
+Comparing against the last *processed* frame (not the previous one)
+means slow drifts still accumulate into a detected change, and
+``max_reuse_age`` guarantees a fresh result at least that often.
+"""
+from __future__ import annotations
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+class MotionGate:
+    """
+    Parameters
+    ----------
+    size : (width, height)
+        Thumbnail resolution used for the comparison.
+    pixel_threshold : int
+        Minimum grey-level difference for a thumbnail pixel to count as changed.
+    min_changed : int
+        Number of changed thumbnail pixels that forces inference.
+    max_reuse_age : float
+        Maximum seconds a previous result may be reused.
+    """
+
+    def __init__(
+        self,
+        size: Tuple[int, int] = (64, 48),
+        pixel_threshold: int = 8,
+        min_changed: int = 3,
+        max_reuse_age: float = 0.5,
+    ) -> None:
+        self._size = size
+        self._pixel_threshold = pixel_threshold
+        self._min_changed = min_changed
+        self._max_reuse_age = max_reuse_age
+
+        w, h = size
+        self._small = np.empty((h, w, 3), dtype=np.uint8)
+        self._grey  = np.empty((h, w), dtype=np.uint8)
+        self._ref   = np.empty((h, w), dtype=np.uint8)
+        self._diff  = np.empty((h, w), dtype=np.uint8)
+        self._has_ref = False
+        self._last_run: Optional[float] = None
+
+        self._skipped   = 0
+        self._processed = 0
+
+    # ------------------------------------------------------------------
+    def should_run(self, frame: np.ndarray, now: float) -> bool:
+        """
+        Return True when the tracker must run on ``frame`` (captured at
+        ``now``). A True result makes this frame the new reference.
+        """
+        cv2.resize(frame, self._size, dst=self._small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=self._grey)
+
+        if (self._has_ref
+                and self._last_run is not None
+                and now - self._last_run <= self._max_reuse_age):
+            cv2.absdiff(self._grey, self._ref, dst=self._diff)
+            changed = int(np.count_nonzero(self._diff > self._pixel_threshold))
+            if changed < self._min_changed:
+                self._skipped += 1
+                return False
+
+        self._grey, self._ref = self._ref, self._grey
+        self._has_ref  = True
+        self._last_run = now
+        self._processed += 1
+        return True
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"skipped": self._skipped, "processed": self._processed}
+
+    def reset(self) -> None:
+        self._has_ref  = False
+        self._last_run = None
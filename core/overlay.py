@@ -0,0 +1,62 @@
+"""
+Landmark overlay — optional rendering of hand skeletons onto a frame.
+
+HandTracker only returns data; drawing happens here and only for frames
+that a viewer (CameraWindow / OpenCVUI) actually displays. Pure OpenCV,
+so viewers never need mediapipe.
+"""
+from __future__ import annotations
+from typing import List, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from domain.models import HandsRaw
+
+# MediaPipe hand topology (same as mp.solutions.hands.HAND_CONNECTIONS)
+HAND_CONNECTIONS: Tuple[Tuple[int, int], ...] = (
+    (0, 1), (1, 2), (2, 3), (3, 4),          # thumb
+    (0, 5), (5, 6), (6, 7), (7, 8),          # index
+    (5, 9), (9, 10), (10, 11), (11, 12),     # middle
+    (9, 13), (13, 14), (14, 15), (15, 16),   # ring
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),  # pinky + palm
+)
+
+_POINT_COLOR = (0, 0, 255)       # BGR, as mediapipe's default drawing spec
+_LINE_COLOR  = (224, 224, 224)
+
+
+def hand_points(hands_raw: HandsRaw) -> List[np.ndarray]:
+    """Full-frame normalised (21, 2) float32 views, one per tracked hand."""
+    return [raw[:, :2] for raw in hands_raw.values()]
+
+
+def draw_hands(
+    frame: np.ndarray,
+    hands: Sequence[np.ndarray],
+    mirrored: bool = False,
+    thickness: int = 2,
+) -> None:
+    """
+    Draw hand skeletons onto ``frame`` in place.
+
+    Parameters
+    ----------
+    frame : np.ndarray
+        BGR image to draw on.
+    hands : sequence of (21, 2) arrays
+        Normalised landmark coordinates as returned by hand_points().
+    mirrored : bool
+        Set when ``frame`` was flipped horizontally after capture.
+    """
+    h, w = frame.shape[:2]
+    for points in hands:
+        xs = points[:, 0] * w
+        if mirrored:
+            xs = w - 1 - xs
+        pixels = np.stack((xs, points[:, 1] * h), axis=1).astype(np.int32)
+        for a, b in HAND_CONNECTIONS:
+            cv2.line(frame, tuple(pixels[a]), tuple(pixels[b]), _LINE_COLOR, thickness)
+        for x, y in pixels:
+            cv2.circle(frame, (int(x), int(y)), thickness + 1, _POINT_COLOR, -1)
+
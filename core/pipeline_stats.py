@@ -0,0 +1,89 @@
+"""
+PipelineStats — windowed per-stage timing aggregator.
+
+Fed one FrameTiming per processed frame; every ``interval`` seconds it
+produces a flat snapshot (dict of floats) that the worker emits to the UI.
+Other components publish their own gauges/counters through set()/count().
+All methods are thread-safe, so pipeline stages may report concurrently.
+"""
+from __future__ import annotations
+import threading
+import time
+from collections import defaultdict
+from typing import Dict
+
+from domain.models import FrameTiming
+
+
+class PipelineStats:
+    """
+    Parameters
+    ----------
+    interval : float
+        Seconds between snapshots.
+    """
+
+    def __init__(self, interval: float = 1.0) -> None:
+        self._interval = interval
+        self._window_start = time.monotonic()
+        self._frames = 0
+        self._stage_sum: Dict[str, float] = defaultdict(float)
+        self._latency_sum = 0.0
+        self._latency_max = 0.0
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._gauges: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    def add_frame(self, timing: FrameTiming) -> None:
+        """Account one finished frame (latency measured from capture to now)."""
+        latency = timing.age
+        with self._lock:
+            self._frames += 1
+            self._latency_sum += latency
+            self._latency_max = max(self._latency_max, latency)
+            for name, seconds in timing.stages.items():
+                self._stage_sum[name] += seconds
+
+    def count(self, name: str, n: float = 1) -> None:
+        """Accumulate a counter that is reset with every snapshot."""
+        with self._lock:
+            self._counters[name] += n
+
+    def set(self, name: str, value: float) -> None:
+        """Publish a gauge that keeps its value across snapshots."""
+        with self._lock:
+            self._gauges[name] = value
+
+    def due(self) -> bool:
+        return time.monotonic() - self._window_start >= self._interval
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Return the stats for the current window and start a new one.
+
+        Keys: "fps", "latency_ms", "latency_max_ms", "<stage>_ms" (mean per
+        frame), every counter and every gauge.
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = max(now - self._window_start, 1e-9)
+            n = max(self._frames, 1)
+
+            snap: Dict[str, float] = {
+                "fps": self._frames / elapsed,
+                "latency_ms": 1000.0 * self._latency_sum / n,
+                "latency_max_ms": 1000.0 * self._latency_max,
+            }
+            for name, total in self._stage_sum.items():
+                snap[f"{name}_ms"] = 1000.0 * total / n
+            snap.update(self._counters)
+            snap.update(self._gauges)
+
+            self._window_start = now
+            self._frames = 0
+            self._stage_sum.clear()
+            self._latency_sum = 0.0
+            self._latency_max = 0.0
+            self._counters.clear()
+        return snap
@@ -0,0 +1,244 @@
+"""
+RemoteHandTracker — HandTracker hosted in a dedicated worker process.
+
+MediaPipe inference then runs on another core and outside this process's
+GIL, so the Qt GUI thread (pixmap scaling, painting) stays responsive
+while the pipeline thread simply waits on a pipe.
+
+Frames travel through a shared-memory buffer owned by this side (one
+memcpy, no pickling); only the small landmark arrays come back over the
+pipe. The interface mirrors HandTracker, so CameraWorker can use either.
+
+Lifecycle
+---------
+  - The child is started with the "spawn" method (safe with Qt/MediaPipe
+    threads) and is a daemon, so it never outlives the application.
+  - release() asks it to stop, joins it, and unlinks the shared buffer;
+    pipeline restarts simply create a new RemoteHandTracker.
+  - The child exits on its own when the pipe closes (parent gone).
+  - If the child dies mid-run it is restarted with the same settings and
+    the frame is reported as having no hands. A restart that fails is
+    retried with exponential backoff (frames meanwhile have no hands);
+    the reason is kept in ``last_error``.
+"""
+from __future__ import annotations
+import multiprocessing as mp
+import time
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from core.frame_broadcast import _attach
+from domain.models import FrameTiming, HandIds, HandsData, HandsRaw
+
+_START_TIMEOUT = 60.0   # MediaPipe graph creation can take several seconds
+_STOP_TIMEOUT  = 2.0
+_RESTART_BACKOFF     = 1.0    # s before retrying a failed restart (doubles)
+_RESTART_BACKOFF_MAX = 30.0
+
+
+def _serve(conn: Any, kwargs: Dict[str, Any]) -> None:
+    """Child-process loop: owns the real HandTracker."""
+    try:
+        from core.hand_tracker import HandTracker
+        tracker = HandTracker(**kwargs)
+    except Exception as exc:
+        conn.send(("error", f"{type(exc).__name__}: {exc}"))
+        return
+    conn.send(("ready", None))
+
+    shm: Optional[shared_memory.SharedMemory] = None
+    shm_name = ""
+    while True:
+        try:
+            msg = conn.recv()
+        except (EOFError, OSError):
+            break   # parent closed the pipe or died
+        cmd = msg[0]
+        if cmd == "stop":
+            break
+        try:
+            if cmd == "frame":
+                _, name, shape = msg
+                if name != shm_name:
+                    if shm is not None:
+                        shm.close()
+                    # The parent owns the segment: the child's resource
+                    # tracker must not unlink it when the child exits
+                    shm = _attach(name)
+                    shm_name = name
+                frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+                hands_data, hands_raw, hand_ids = tracker.process(frame)
+                del frame
+                conn.send(("ok", (hands_data, hands_raw, hand_ids, tracker.propagated)))
+            else:
+                getattr(tracker, cmd)(*msg[1:])
+                conn.send(("ok", None))
+        except Exception as exc:
+            conn.send(("error", f"{type(exc).__name__}: {exc}"))
+
+    tracker.release()
+    if shm is not None:
+        shm.close()
+
+
+class RemoteHandTracker:
+    """
+    Drop-in replacement for HandTracker running in a child process.
+
+    Parameters
+    ----------
+    **kwargs
+        Forwarded to HandTracker in the child process.
+
+    Raises
+    ------
+    RuntimeError
+        If the child cannot build its HandTracker (e.g. MediaPipe missing).
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._kwargs = kwargs
+        self._ctx = mp.get_context("spawn")
+        self._proc: Optional[Any] = None
+        self._conn: Optional[Any] = None
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._frame: Optional[np.ndarray] = None
+        self._propagated = False
+        self.restarts = 0
+        self.last_error: Optional[str] = None
+        self._backoff = _RESTART_BACKOFF
+        self._retry_at = 0.0
+        self._start()
+
+    # ------------------------------------------------------------------
+    def process(
+        self, frame: Any, timing: Optional[FrameTiming] = None
+    ) -> Tuple[HandsData, HandsRaw, HandIds]:
+        """Same contract as HandTracker.process (IPC time counts as "track")."""
+        if timing is None:
+            return self._process(frame)
+        with timing.stage("track"):
+            return self._process(frame)
+
+    @property
+    def propagated(self) -> bool:
+        return self._propagated
+
+    def set_max_input_side(self, side: int) -> None:
+        self._kwargs["max_input_side"] = side
+        self._call(("set_max_input_side", side))
+
+    def set_model_complexity(self, complexity: int) -> None:
+        self._kwargs["model_complexity"] = complexity
+        self._call(("set_model_complexity", complexity))
+
+    def reset(self) -> None:
+        """Same as HandTracker.reset (a restarted child starts clean anyway)."""
+        self._propagated = False
+        self._call(("reset",))
+
+    def release(self) -> None:
+        """Stop the child process and free the shared frame buffer."""
+        self._stop()
+        self._free_buffer()
+
+    # ------------------------------------------------------------------
+    def _process(self, frame: np.ndarray) -> Tuple[HandsData, HandsRaw, HandIds]:
+        if self._frame is None or self._frame.shape != frame.shape:
+            self._alloc_buffer(frame.shape)
+        np.copyto(self._frame, frame)
+        reply = self._call(("frame", self._shm.name, frame.shape))
+        if reply is None:
+            self._propagated = False
+            return {}, {}, {}
+        hands_data, hands_raw, hand_ids, self._propagated = reply
+        return hands_data, hands_raw, hand_ids
+
+    def _call(self, msg: tuple) -> Any:
+        """Send one request and wait for its reply; restarts a dead child."""
+        if self._conn is None and not self._restart():
+            return None
+        try:
+            self._conn.send(msg)
+            status, payload = self._conn.recv()
+        except (EOFError, OSError):
+            self.restarts += 1
+            self._stop()
+            self._restart()
+            return None
+        if status == "error":
+            raise RuntimeError(f"HandTracker process: {payload}")
+        return payload
+
+    def _restart(self) -> bool:
+        """Start a new child unless backing off; never raises."""
+        now = time.monotonic()
+        if now < self._retry_at:
+            return False
+        try:
+            self._start()
+        except (RuntimeError, OSError) as exc:
+            self._stop()
+            self.last_error = str(exc)
+            self._retry_at = now + self._backoff
+            self._backoff = min(2.0 * self._backoff, _RESTART_BACKOFF_MAX)
+            return False
+        self._backoff = _RESTART_BACKOFF
+        self._retry_at = 0.0
+        return True
+
+    def _start(self) -> None:
+        parent, child = self._ctx.Pipe()
+        self._proc = self._ctx.Process(
+            target=_serve, args=(child, self._kwargs),
+            name="HandTrackerProcess", daemon=True,
+        )
+        self._proc.start()
+        child.close()
+        self._conn = parent
+
+        if not parent.poll(_START_TIMEOUT):
+            self._stop()
+            raise RuntimeError("HandTracker process did not start in time")
+        try:
+            status, payload = parent.recv()
+        except EOFError:
+            self._proc.join(_STOP_TIMEOUT)
+            status, payload = "error", f"exited with code {self._proc.exitcode}"
+        if status != "ready":
+            self._stop()
+            raise RuntimeError(f"HandTracker process: {payload}")
+
+    def _stop(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.send(("stop",))
+            except (OSError, ValueError):
+                pass
+        if self._proc is not None:
+            self._proc.join(_STOP_TIMEOUT)
+            if self._proc.is_alive():
+                self._proc.terminate()
+                self._proc.join(_STOP_TIMEOUT)
+            self._proc = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _alloc_buffer(self, shape: Tuple[int, ...]) -> None:
+        self._free_buffer()
+        self._shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+        self._frame = np.ndarray(shape, dtype=np.uint8, buffer=self._shm.buf)
+
+    def _free_buffer(self) -> None:
+        if self._shm is None:
+            return
+        self._frame = None
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = None
@@ -0,0 +1,204 @@
+"""
+StagePipeline — runs processing stages concurrently, connected by bounded
+queues with an explicit overflow policy.
+
+Each stage is one thread that takes items from its inbox, applies its
+function and hands the result to the next stage's inbox. One thread per
+stage plus FIFO queues keeps items in submission order end to end; a
+policy only ever removes items, it never reorders them.
+
+Policies (what put() does when the inbox is full)
+-------------------------------------------------
+  drop_oldest : discard the oldest queued item, enqueue the new one.
+  block       : wait until the consumer frees a slot (back-pressure).
+  coalesce    : keep a single pending item; a new one replaces (or is
+                merged into) it — "latest wins" regardless of maxsize.
+
+Dropped items go to ``on_drop`` so owners can release resources
+(e.g. pooled frame buffers).
+"""
+from __future__ import annotations
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+POLICIES = ("drop_oldest", "block", "coalesce")
+
+_CLOSED = object()
+
+
+class BoundedQueue:
+    """
+    Thread-safe FIFO with a size bound and an overflow policy.
+
+    Parameters
+    ----------
+    maxsize : int
+        Capacity (coalesce always behaves as 1).
+    policy : str
+        One of POLICIES.
+    on_drop : callable | None
+        Called with every item the policy discards.
+    merge : callable | None
+        coalesce only: ``merge(pending, new)`` → item to keep (default: new).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 2,
+        policy: str = "drop_oldest",
+        on_drop: Optional[Callable[[Any], None]] = None,
+        merge: Optional[Callable[[Any, Any], Any]] = None,
+    ) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown queue policy {policy!r}; expected one of {POLICIES}")
+        self._maxsize = 1 if policy == "coalesce" else max(1, maxsize)
+        self._policy = policy
+        self._on_drop = on_drop
+        self._merge = merge
+        self._items: Deque[Any] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._dropped = 0
+        self._max_depth = 0
+
+    # ------------------------------------------------------------------
+    def put(self, item: Any) -> bool:
+        """Enqueue ``item``. Returns False if the queue is closed (item dropped)."""
+        dropped = None
+        with self._cond:
+            if self._policy == "block":
+                while len(self._items) >= self._maxsize and not self._closed:
+                    self._cond.wait()
+            if self._closed:
+                dropped = item
+            elif len(self._items) >= self._maxsize:
+                old = self._items.popleft()
+                if self._policy == "coalesce" and self._merge is not None:
+                    item = self._merge(old, item)
+                else:
+                    dropped = old
+                self._dropped += 1
+            if dropped is not item:
+                self._items.append(item)
+                self._max_depth = max(self._max_depth, len(self._items))
+                self._cond.notify_all()
+        if dropped is not None and self._on_drop is not None:
+            self._on_drop(dropped)
+        return dropped is not item
+
+    def get(self) -> Any:
+        """Next item, waiting if empty; returns the _CLOSED sentinel once closed."""
+        with self._cond:
+            while not self._items and not self._closed:
+                self._cond.wait()
+            if self._closed:
+                return _CLOSED
+            item = self._items.popleft()
+            self._cond.notify_all()
+            return item
+
+    def close(self) -> List[Any]:
+        """Wake all waiters and return the items still queued."""
+        with self._cond:
+            self._closed = True
+            left = list(self._items)
+            self._items.clear()
+            self._cond.notify_all()
+        return left
+
+    def stats(self) -> Dict[str, float]:
+        """Current depth plus max depth and drops since the previous call."""
+        with self._cond:
+            snap = {"depth": len(self._items), "max": self._max_depth, "dropped": self._dropped}
+            self._max_depth = len(self._items)
+            self._dropped = 0
+        return snap
+
+
+@dataclass
+class Stage:
+    """One pipeline stage: ``fn(item)`` returns the item for the next stage or None to stop it."""
+    name: str
+    fn: Callable[[Any], Any]
+    maxsize: int = 2
+    policy: str = "drop_oldest"
+    merge: Optional[Callable[[Any, Any], Any]] = None   # coalesce only
+
+
+class StagePipeline:
+    """
+    Parameters
+    ----------
+    stages : sequence of Stage
+        In processing order; each gets its own inbox queue and thread.
+    on_drop : callable | None
+        Receives every item discarded by a queue policy or left over on stop().
+    on_error : callable | None
+        ``on_error(stage_name, exc)`` when a stage function raises; the
+        item is then dropped and the stage keeps running.
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[Stage],
+        on_drop: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+    ) -> None:
+        self._stages = list(stages)
+        self._on_drop = on_drop
+        self._on_error = on_error
+        self._queues = [BoundedQueue(s.maxsize, s.policy, on_drop, s.merge) for s in self._stages]
+        self._threads: List[threading.Thread] = []
+
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        for i, stage in enumerate(self._stages):
+            thread = threading.Thread(
+                target=self._run, args=(i,), name=f"Stage-{stage.name}", daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, item: Any) -> bool:
+        """Feed the first stage (subject to its queue policy)."""
+        return self._queues[0].put(item)
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Close every queue, join the stage threads and drop leftovers."""
+        for queue in self._queues:
+            for item in queue.close():
+                if self._on_drop is not None:
+                    self._on_drop(item)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def stats(self) -> Dict[str, float]:
+        """Flat per-queue stats: q_<stage>_depth / _max / _dropped (windowed)."""
+        out: Dict[str, float] = {}
+        for stage, queue in zip(self._stages, self._queues):
+            for key, value in queue.stats().items():
+                out[f"q_{stage.name}_{key}"] = value
+        return out
+
+    # ------------------------------------------------------------------
+    def _run(self, index: int) -> None:
+        stage = self._stages[index]
+        inbox = self._queues[index]
+        outbox = self._queues[index + 1] if index + 1 < len(self._queues) else None
+        while True:
+            item = inbox.get()
+            if item is _CLOSED:
+                return
+            try:
+                result = stage.fn(item)
+            except Exception as exc:
+                if self._on_error is not None:
+                    self._on_error(stage.name, exc)
+                if self._on_drop is not None:
+                    self._on_drop(item)
+                continue
+            if result is not None and outbox is not None:
+                outbox.put(result)
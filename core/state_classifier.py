@@ -1,17 +1,34 @@
 """
-StateClassifier — wraps the Random Forest model.
+StateClassifier — wraps the hand-state model.
 No buffer, no consensus — just predict().
+
+The model is loaded through a ClassifierBackend (see
+core.classifier_backends) and its input schema is checked once at load
+time; per frame the features are written into a preallocated float32 row
+(the dtype the trees use internally, so sklearn does not copy it) and a
+single predict_proba call yields both the class (argmax) and its
+confidence. The "compiled" backend falls back to "sklearn" for models
+CompiledForest cannot flatten. An optional FeatureCache answers repeated
+poses without calling the model at all, and forest backends can stop
+voting early once the leading state is settled (anytime inference).
+A GeometricClassifier can resolve unambiguous FIST / PALM frames from the
+features alone; in "shadow" mode it only measures agreement with the model.
+predict_hands() also classifies each hand on its own, batched with the
+combined row into a single model call.
 """
 from __future__ import annotations
-import math
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-import joblib
 import numpy as np
-import pandas as pd
 
+from core.classifier_backends import BACKEND_KINDS, ClassifierBackend, open_backend
+from core.feature_cache import FeatureCache
+from core.geometric_classifier import GeometricClassifier
 from domain.enums import HandState
+from domain.models import FrameTiming, HandsData, Landmarks
 
 # ---- feature definition --------------------------------------------------
 FINGERS = {
@@ -41,67 +58,283 @@ FEATURE_NAMES = (
 )
 
 
-# ---- geometry helpers (no external deps) ---------------------------------
-def _dist(a: tuple, b: tuple) -> float:
-    return math.hypot(a[0] - b[0], a[1] - b[1])
-
+# ---- geometry (vectorised over the five fingers) --------------------------
+_BASE = np.array([f[0] for f in FINGERS.values()])
+_JOINT = np.array([f[1] for f in FINGERS.values()])
+_TIP = np.array([f[2] for f in FINGERS.values()])
 
-def _angle(a: tuple, b: tuple, c: tuple) -> float:
-    ba = (a[0] - b[0], a[1] - b[1])
-    bc = (c[0] - b[0], c[1] - b[1])
-    dot = ba[0] * bc[0] + ba[1] * bc[1]
-    mag = math.hypot(*ba) * math.hypot(*bc)
-    if mag == 0:
-        return 0.0
-    return math.degrees(math.acos(max(-1.0, min(1.0, dot / mag))))
 
+def _extract_features(landmarks: Optional[Landmarks]) -> np.ndarray:
+    """
+    Five wrist→tip distances followed by five base-joint-tip angles
+    (degrees, 0 for degenerate segments), from the (x, y) of a
+    normalised (21, 3) hand.
+    """
+    if landmarks is None:
+        return np.zeros(10)
+    xy = landmarks[:, :2].astype(np.float64)
+    tips = xy[_TIP]
+    dists = np.hypot(*(tips - xy[0]).T)
 
-def _extract_features(landmarks: Optional[List]) -> List[float]:
-    if not landmarks or landmarks[0] == (-1.0, -1.0):
-        return [0.0] * 10
-    wrist = landmarks[0]
-    dists  = [_dist(wrist, landmarks[f[2]]) for f in FINGERS.values()]
-    angles = [_angle(landmarks[f[0]], landmarks[f[1]], landmarks[f[2]]) for f in FINGERS.values()]
-    return dists + angles
+    ba = xy[_BASE] - xy[_JOINT]
+    bc = tips - xy[_JOINT]
+    dot = (ba * bc).sum(axis=1)
+    mag = np.hypot(*ba.T) * np.hypot(*bc.T)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos = np.clip(dot / mag, -1.0, 1.0)
+    angles = np.where(mag == 0, 0.0, np.degrees(np.arccos(cos)))
+    return np.concatenate((dists, angles))
 
 
 # ---- classifier -----------------------------------------------------------
+def _schema_order(model: Any) -> Optional[np.ndarray]:
+    """
+    Check the model's training columns against FEATURE_NAMES.
+
+    Returns
+    -------
+    None when the columns are already in FEATURE_NAMES order (or the model
+    was fitted without names), else the index array that reorders a
+    FEATURE_NAMES row into the model's order.
+
+    Raises
+    ------
+    ValueError
+        If the model expects a different feature set.
+    """
+    n = getattr(model, "n_features_in_", len(FEATURE_NAMES))
+    if n != len(FEATURE_NAMES):
+        raise ValueError(f"Model expects {n} features, classifier produces {len(FEATURE_NAMES)}")
+    names = getattr(model, "feature_names_in_", None)
+    if names is None:
+        return None
+    names = [str(name) for name in names]
+    if names == FEATURE_NAMES:
+        return None
+    if sorted(names) != sorted(FEATURE_NAMES):
+        unknown = sorted(set(names) - set(FEATURE_NAMES))
+        raise ValueError(f"Model feature names do not match FEATURE_NAMES: {unknown}")
+    return np.array([FEATURE_NAMES.index(name) for name in names])
+
+
+def _to_state(label: Any) -> HandState:
+    try:
+        return HandState(label)
+    except ValueError:
+        return HandState.UNKNOWN
+
+
+Result = Tuple[HandState, float]
+FAST_PATH_MODES = ("off", "on", "shadow")
+
+
 class StateClassifier:
     """
-    Wraps the trained scikit-learn model.
+    Wraps the trained hand-state model.
 
     Parameters
     ----------
     model_path : Path
-        Path to the serialised Random Forest (.pkl).
+        Serialised model: a pickled scikit-learn classifier (.pkl) for
+        "compiled" / "sklearn", or an exported .npz for "knn" / "mlp".
+    backend : str
+        One of BACKEND_KINDS.
+    cache : FeatureCache | None
+        Result cache consulted before the model (None = always run it).
+    early_exit_chunk : int
+        Trees per step of anytime inference (0 = evaluate the whole forest).
+        Ignored for backends where it cannot save time — non-ensembles and
+        the compiled forest (see ``early_exit`` and ClassifierBackend.anytime).
+        Only single-row calls use it: predict_hands() batches with two hands
+        evaluate the whole forest.
+    early_exit_margin : float | None
+        Also stop once the leading state's lead over the runner-up reaches
+        this fraction of the trees evaluated; None stops only when the
+        remaining trees can no longer change the answer.
+    fast_path : GeometricClassifier | None
+        Rule-based pre-classifier tried before the cache and the model.
+    fast_path_mode : str
+        "on" returns the rule decision directly; "shadow" still runs the
+        model and only counts how often the two agree; "off" (default)
+        disables the fast path (as does ``fast_path=None``). "on" only
+        saves time when the rules resolve more frames than their own cost
+        relative to the model's, which benchmarks/fast_path_bench.py reports.
+
+    Raises
+    ------
+    ValueError
+        If the model was trained on a different feature schema, or the
+        backend name / fast-path mode is unknown.
     """
 
-    def __init__(self, model_path: Path) -> None:
-        self._model = joblib.load(model_path)
-        self._model.verbose = 0
+    def __init__(
+        self,
+        model_path: Path,
+        backend: str = "compiled",
+        cache: Optional[FeatureCache] = None,
+        early_exit_chunk: int = 0,
+        early_exit_margin: Optional[float] = None,
+        fast_path: Optional[GeometricClassifier] = None,
+        fast_path_mode: str = "off",
+    ) -> None:
+        if backend not in BACKEND_KINDS:
+            raise ValueError(f"Unknown classifier backend {backend!r}; expected one of {BACKEND_KINDS}")
+        if fast_path_mode not in FAST_PATH_MODES:
+            raise ValueError(f"Unknown fast-path mode {fast_path_mode!r}; expected one of {FAST_PATH_MODES}")
+        self.fallback_reason: Optional[str] = None
+        try:
+            self._backend: ClassifierBackend = open_backend(backend, model_path)
+        except TypeError as exc:
+            self.fallback_reason = str(exc)
+            self._backend = open_backend("sklearn", model_path)
+        self.backend = self._backend.name
+        self._order = _schema_order(self._backend)
+        self._states = [_to_state(label) for label in self._backend.classes_]
+        self.cache = cache
+        self.early_exit = early_exit_chunk > 0 and self._backend.anytime
+        self._chunk = early_exit_chunk
+        self._margin = early_exit_margin
+        self.fast_path = fast_path if fast_path_mode != "off" else None
+        self._shadow = fast_path_mode == "shadow"
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._trees = 0
+        self._frames = 0
+        self._resolved = 0
+        self._agreed = 0
+        # Row 0: both hands (the trained schema); rows 1-2: each hand alone
+        self._batch = np.zeros((3, len(FEATURE_NAMES)))
+        self._rows = np.zeros((3, len(FEATURE_NAMES)), dtype=np.float32)
 
-    def predict(self, hands_data: Dict[str, List]) -> Tuple[HandState, float]:
+    def predict(
+        self, hands_data: HandsData, timing: Optional[FrameTiming] = None
+    ) -> Tuple[HandState, float]:
         """
         Parameters
         ----------
         hands_data : dict
-            Normalised landmark lists keyed by "Left" / "Right".
+            Normalised (21, 3) landmark arrays keyed by "Left" / "Right".
+        timing : FrameTiming | None
+            Capture clock of the frame; the elapsed time is recorded
+            under the "classify" stage, and capture_ts ages cache entries.
 
         Returns
         -------
         (HandState, confidence)
         """
-        left_features  = _extract_features(hands_data.get("Left"))
-        right_features = _extract_features(hands_data.get("Right"))
-        features = left_features + right_features
+        if timing is None:
+            return self._predict(hands_data)
+        with timing.stage("classify"):
+            return self._predict(hands_data, timing.capture_ts)
 
-        X = pd.DataFrame([features], columns=FEATURE_NAMES)
-        raw_prediction = self._model.predict(X)[0]
-        confidence = float(max(self._model.predict_proba(X)[0]))
+    def predict_hands(
+        self, hands_data: HandsData, timing: Optional[FrameTiming] = None
+    ) -> Tuple[HandState, float, Dict[str, Result]]:
+        """
+        Combined state plus the state of each hand on its own.
 
-        try:
-            state = HandState(raw_prediction)
-        except ValueError:
-            state = HandState.UNKNOWN
+        With two hands, each is also classified with the other hand's
+        features zeroed (as the model sees a single-hand frame); the three
+        rows go to the model as one batch, so the cost stays that of one
+        call. With one hand its state is the combined one.
+
+        Returns
+        -------
+        (HandState, confidence, {side: (HandState, confidence)})
+        """
+        if timing is None:
+            return self._predict_hands(hands_data)
+        with timing.stage("classify"):
+            return self._predict_hands(hands_data, timing.capture_ts)
+
+    def _predict(self, hands_data: HandsData, now: Optional[float] = None) -> Result:
+        self._batch[0, :10] = _extract_features(hands_data.get("Left"))
+        self._batch[0, 10:] = _extract_features(hands_data.get("Right"))
+        return self._classify((0,), now)[0]
+
+    def _predict_hands(
+        self, hands_data: HandsData, now: Optional[float] = None
+    ) -> Tuple[HandState, float, Dict[str, Result]]:
+        self._batch[0, :10] = _extract_features(hands_data.get("Left"))
+        self._batch[0, 10:] = _extract_features(hands_data.get("Right"))
+        if "Left" in hands_data and "Right" in hands_data:
+            self._batch[1, :10] = self._batch[0, :10]
+            self._batch[2, 10:] = self._batch[0, 10:]
+            both, left, right = self._classify((0, 1, 2), now)
+            return both[0], both[1], {"Left": left, "Right": right}
+        result = self._classify((0,), now)[0]
+        return result[0], result[1], {side: result for side in hands_data}
+
+    def _classify(self, rows: Tuple[int, ...], now: Optional[float]) -> List[Result]:
+        """
+        Results for the given rows of ``_batch``: fast path, then cache,
+        then one model call for every row still unresolved.
+        """
+        results: List[Optional[Result]] = [None] * len(rows)
+        rules: List[Optional[HandState]] = [None] * len(rows)
+        for k, i in enumerate(rows):
+            if self.fast_path is not None:
+                rules[k] = self.fast_path.classify(self._batch[i])
+                if rules[k] is not None and not self._shadow:
+                    results[k] = (rules[k], self.fast_path.confidence)
+                    continue
+            if self.cache is not None:
+                results[k] = self.cache.get(self._batch[i], now, slot=i)
+
+        pending = [k for k, result in enumerate(results) if result is None]
+        if pending:
+            t0 = time.perf_counter()
+            inferred = self._infer([rows[k] for k in pending])
+            cost = (time.perf_counter() - t0) / len(pending)
+            for k, result in zip(pending, inferred):
+                results[k] = result
+                if self.cache is not None:
+                    self.cache.put(self._batch[rows[k]], result, cost, now, slot=rows[k])
+
+        if self.fast_path is not None:
+            # Counted per frame, on the combined row (always rows[0] == 0)
+            with self._lock:
+                self._frames += 1
+                if rules[0] is not None:
+                    self._resolved += 1
+                    self._agreed += rules[0] == results[0][0]
+        return results
+
+    def _infer(self, rows: List[int]) -> List[Result]:
+        """Run the model once on the given rows of ``_batch``."""
+        n = len(rows)
+        for j, i in enumerate(rows):
+            if self._order is None:
+                self._rows[j] = self._batch[i]
+            else:
+                self._rows[j] = self._batch[i, self._order]
+
+        # Anytime inference is per row; batches evaluate the whole forest
+        if self.early_exit and n == 1:
+            proba, trees = self._backend.predict_proba_anytime(self._rows[0], self._chunk, self._margin)
+            probas = proba[None]
+            with self._lock:
+                self._calls += 1
+                self._trees += trees
+        else:
+            probas = self._backend.predict_proba(self._rows[:n])
+        best = probas.argmax(axis=1)
+        return [(self._states[b], float(p[b])) for p, b in zip(probas, best)]
 
-        return state, confidence
\ No newline at end of file
+    def stats(self) -> Dict[str, float]:
+        """Cache, anytime-inference and fast-path counters since the previous call."""
+        out: Dict[str, float] = {} if self.cache is None else self.cache.stats()
+        if self.fast_path is not None:
+            with self._lock:
+                frames, resolved, agreed = self._frames, self._resolved, self._agreed
+                self._frames = self._resolved = self._agreed = 0
+            out["fast_path_rate"] = resolved / frames if frames else 0.0
+            if self._shadow:
+                out["fast_path_agree"] = agreed / resolved if resolved else 1.0
+        if self.early_exit:
+            with self._lock:
+                calls, trees = self._calls, self._trees
+                self._calls = self._trees = 0
+            out["trees_mean"] = trees / calls if calls else 0.0
+            out["trees_total"] = self._backend.n_trees
+        return out
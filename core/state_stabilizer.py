@@ -10,6 +10,7 @@ from collections import deque, Counter
 from typing import Optional
 
 from domain.enums import HandState
+from domain.models import FrameTiming
 
 
 class StateStabilizer:
@@ -38,16 +39,29 @@ class StateStabilizer:
         self._min_confidence = min_confidence
         self._buffer: deque[HandState] = deque(maxlen=window)
         self._current: Optional[HandState] = None
+        self._current_since: Optional[float] = None
+        self._last_ts: Optional[float] = None
 
     # ------------------------------------------------------------------
-    def update(self, raw_state: HandState, confidence: float) -> Optional[HandState]:
+    def update(
+        self,
+        raw_state: HandState,
+        confidence: float,
+        timing: Optional[FrameTiming] = None,
+    ) -> Optional[HandState]:
         """
         Feed a new prediction.
 
         Returns the stable (consensus) state if consensus is reached,
         or None if the buffer hasn't settled yet.
         The *current stable state* is also cached in self.current.
+
+        When ``timing`` is given, its capture timestamp (not the time of
+        this call) is used for current_since / last_timestamp.
         """
+        if timing is not None:
+            self._last_ts = timing.capture_ts
+
         # Low-confidence predictions are treated as unknown
         effective = raw_state if confidence >= self._min_confidence else HandState.UNKNOWN
         self._buffer.append(effective)
@@ -60,6 +74,7 @@ class StateStabilizer:
             stable = HandState(most_common)
             if stable != self._current:
                 self._current = stable
+                self._current_since = self._last_ts
             return stable
 
         return None  # no consensus yet
@@ -69,6 +84,18 @@ class StateStabilizer:
         """The last confirmed stable state, or None if not yet settled."""
         return self._current
 
+    @property
+    def current_since(self) -> Optional[float]:
+        """Capture timestamp of the frame that confirmed the current state."""
+        return self._current_since
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        """Capture timestamp of the most recent update."""
+        return self._last_ts
+
     def reset(self) -> None:
         self._buffer.clear()
-        self._current = None
\ No newline at end of file
+        self._current = None
+        self._current_since = None
+        self._last_ts = None
\ No newline at end of file
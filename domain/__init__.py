@@ -1,4 +1,4 @@
 from domain.enums import HandState, GestureEvent
-from domain.models import FrameData
+from domain.models import FrameData, FrameTiming
 
-__all__ = ["HandState", "GestureEvent", "FrameData"]
\ No newline at end of file
+__all__ = ["HandState", "GestureEvent", "FrameData", "FrameTiming"]
\ No newline at end of file
@@ -1,15 +1,48 @@
 from __future__ import annotations
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Dict, Iterator, Optional, Tuple
 import time
 
+import numpy as np
+
 from domain.enums import HandState
 
 # Type aliases
 Landmark2D = Tuple[float, float]
-LandmarkList = List[Landmark2D]
-HandsData = Dict[str, LandmarkList]   # {"Left": [...], "Right": [...]}
-HandsRaw = Dict[str, Any]             # {"Left": mp_hand_landmarks, ...}
+Landmarks = np.ndarray                # (21, 3) float32 view — x, y, z per landmark
+HandsData = Dict[str, Landmarks]      # {"Left": normalised, "Right": normalised}
+HandsRaw = Dict[str, Landmarks]       # {"Left": full-frame normalised (x, y, z), ...}
+HandIds = Dict[str, int]              # {"Left": persistent track id, ...}
+HandStates = Dict[str, HandState]     # {"Left": stable state of that hand alone, ...}
+
+
+@dataclass
+class FrameTiming:
+    """
+    Capture-time clock of a single frame.
+
+    capture_ts is a time.monotonic() stamp taken when the frame was grabbed
+    and is never modified afterwards; each pipeline stage only appends its
+    own elapsed time (seconds) to ``stages``.
+    """
+    capture_ts: float
+    seq: int = 0
+    stages: Dict[str, float] = field(default_factory=dict)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block and record it under ``name``."""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - t0
+
+    @property
+    def age(self) -> float:
+        """Seconds elapsed since capture (glass-to-now latency)."""
+        return time.monotonic() - self.capture_ts
 
 
 @dataclass
@@ -17,20 +50,45 @@ class FrameData:
     """
     All data relevant to a single processed frame.
     Passed through the gesture pipeline instead of individual arguments.
+
+    timestamp is the monotonic capture time of the frame, so gesture
+    kinematics are measured against when the image was taken, not when
+    it finished processing.
+
+    state is the stable state of the whole frame; hand_states holds the
+    stable state of each hand classified on its own (empty when per-hand
+    classification is disabled — use state_of()).
     """
     state: HandState
     hands: HandsData
     hands_raw: HandsRaw = field(default_factory=dict)
-    timestamp: float = field(default_factory=time.time)
+    timestamp: float = field(default_factory=time.monotonic)
+    timing: Optional[FrameTiming] = None
+    hand_ids: HandIds = field(default_factory=dict)
+    hand_states: HandStates = field(default_factory=dict)
 
     # ---- convenience accessors ----------------------------------------
     @property
-    def main_hand(self) -> Optional[LandmarkList]:
-        return self.hands.get("Right") or self.hands.get("Left")
+    def main_hand(self) -> Optional[Landmarks]:
+        hand = self.hands.get("Right")
+        return hand if hand is not None else self.hands.get("Left")
 
     @property
-    def main_hand_raw(self) -> Optional[Any]:
-        return self.hands_raw.get("Right") or self.hands_raw.get("Left")
+    def main_hand_raw(self) -> Optional[Landmarks]:
+        hand = self.hands_raw.get("Right")
+        return hand if hand is not None else self.hands_raw.get("Left")
+
+    @property
+    def main_hand_id(self) -> Optional[int]:
+        """Persistent ID of the hand returned by main_hand (None if unknown)."""
+        side = "Right" if self.hands.get("Right") is not None else "Left"
+        return self.hand_ids.get(side)
+
+    def state_of(self, side: str) -> HandState:
+        """State of one hand: its own if known, else the frame state."""
+        if side not in self.hands:
+            return HandState.NO_HANDS
+        return self.hand_states.get(side, self.state)
 
     @property
     def has_both_hands(self) -> bool:
@@ -33,7 +33,7 @@ class CloseWindowGesture(Gesture):
 
         if self._prev_center is not None:
             dy = center[1] - self._prev_center[1]
-            if dy > 0.12 and self._cooldown.ok(self.NAME):
+            if dy > 0.12 and self._cooldown.ok(self.NAME, now=frame_data.timestamp):
                 events.append(GestureEvent.CLOSE_WINDOW)
 
         self._prev_center = center
@@ -36,7 +36,7 @@ class MuteToggleGesture(Gesture):
                     and s2 == HandState.FIST
                     and s3 == HandState.PALM
                     and (t3 - t1) < self._max_time
-                    and self._cooldown.ok(self.NAME)):
+                    and self._cooldown.ok(self.NAME, now=t3)):
                 events.append(GestureEvent.MUTE_TOGGLE)
                 self._history.clear()
 
@@ -32,7 +32,7 @@ class PauseResumeGesture(Gesture):
         self._max_time      = max_time
         self._pause_cooldown = pause_cooldown
         self._paused        = False
-        self._last_toggle   = 0.0
+        self._last_toggle   = float("-inf")
         self.reset()
 
     # ------------------------------------------------------------------
@@ -81,7 +81,7 @@ class PauseResumeGesture(Gesture):
     def _local_cooldown_ok(self, now: float) -> bool:
         if now - self._last_toggle < self._pause_cooldown:
             return False
-        if self._cooldown.ok(self.NAME):
+        if self._cooldown.ok(self.NAME, now=now):
             self._last_toggle = now
             return True
         return False
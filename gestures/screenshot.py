@@ -34,7 +34,7 @@ class ScreenshotGesture(Gesture):
         scale      = dist(wrist, middle_mcp)
 
         if self._prev_scale is not None:
-            if (self._prev_scale - scale) > 0.08 and self._cooldown.ok(self.NAME):
+            if (self._prev_scale - scale) > 0.08 and self._cooldown.ok(self.NAME, now=frame_data.timestamp):
                 events.append(GestureEvent.SCREENSHOT)
 
         self._prev_scale = scale
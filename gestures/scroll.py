@@ -14,6 +14,7 @@ Fixes vs. previous version:
 from __future__ import annotations
 from typing import List
 
+import numpy as np
 import pyautogui
 
 from domain.enums import GestureEvent, HandState
@@ -74,7 +75,7 @@ class ScrollGesture(Gesture):
             return events
 
         center_raw        = hand_center(main_hand)
-        current_hand_size = self._calc_hand_size(hand_raw) if hand_raw else None
+        current_hand_size = self._calc_hand_size(hand_raw) if hand_raw is not None else None
 
         # ---- suavizado de tamaño de mano (normalización) --------------
         if self._smoothed_hand_size is None:
@@ -210,5 +211,4 @@ class ScrollGesture(Gesture):
 
     @staticmethod
     def _calc_hand_size(hand_raw) -> float:
-        w, m = hand_raw.landmark[0], hand_raw.landmark[12]
-        return ((m.x - w.x) ** 2 + (m.y - w.y) ** 2 + (m.z - w.z) ** 2) ** 0.5
\ No newline at end of file
+        return float(np.linalg.norm(hand_raw[12] - hand_raw[0]))
\ No newline at end of file
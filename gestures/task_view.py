@@ -39,7 +39,7 @@ class TaskViewGesture(Gesture):
         self._arm_time          = arm_time
         self._min_approach      = min_approach
         self._task_view_cooldown = task_view_cooldown
-        self._last_activation   = 0.0
+        self._last_activation   = float("-inf")
         self.reset()
 
     # ------------------------------------------------------------------
@@ -47,7 +47,11 @@ class TaskViewGesture(Gesture):
         events: List[GestureEvent] = []
         now = frame_data.timestamp
 
-        if not frame_data.has_both_hands or frame_data.state != HandState.PALM:
+        # Each hand must be an open palm on its own (falls back to the
+        # frame state when per-hand classification is disabled)
+        if not frame_data.has_both_hands or not all(
+            frame_data.state_of(side) == HandState.PALM for side in ("Left", "Right")
+        ):
             self.reset()
             return events
 
@@ -140,7 +144,7 @@ class TaskViewGesture(Gesture):
     def _local_cooldown_ok(self, now: float) -> bool:
         if now - self._last_activation < self._task_view_cooldown:
             return False
-        if self._cooldown.ok(self.NAME):
+        if self._cooldown.ok(self.NAME, now=now):
             self._last_activation = now
             return True
         return False
@@ -5,6 +5,7 @@ from __future__ import annotations
 import math
 from typing import List
 
+import numpy as np
 import pyautogui
 
 from domain.enums import GestureEvent, HandState
@@ -37,6 +38,7 @@ STILLNESS_TIMEOUT      = 0.1
 
 INTENT_Z_ENTER         = -0.045
 INTENT_Z_EXIT          = -0.005
+_TIPS                  = [4, 8, 12, 16, 20]   # fingertip landmark indices
 
 
 def _euclidean(p1, p2) -> float:
@@ -67,7 +69,7 @@ class PinchZoomGesture(Gesture):
 
         center_raw        = hand_center(main_hand)
         pinch_dist_raw    = _euclidean(main_hand[4], main_hand[8])
-        current_hand_size = self._calc_hand_size(hand_raw) if hand_raw else None
+        current_hand_size = self._calc_hand_size(hand_raw) if hand_raw is not None else None
 
         if self._smoothed_hand_size is None:
             self._smoothed_hand_size = current_hand_size
@@ -221,11 +223,8 @@ class PinchZoomGesture(Gesture):
 
     @staticmethod
     def _relative_depth(hand_raw) -> float:
-        wrist_z = hand_raw.landmark[0].z
-        tip_z   = sum(hand_raw.landmark[i].z for i in [4, 8, 12, 16, 20]) / 5
-        return tip_z - wrist_z
+        return float(hand_raw[_TIPS, 2].mean() - hand_raw[0, 2])
 
     @staticmethod
     def _calc_hand_size(hand_raw) -> float:
-        w, m = hand_raw.landmark[0], hand_raw.landmark[12]
-        return ((m.x-w.x)**2 + (m.y-w.y)**2 + (m.z-w.z)**2) ** 0.5
\ No newline at end of file
+        return float(np.linalg.norm(hand_raw[12] - hand_raw[0]))
\ No newline at end of file
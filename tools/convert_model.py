@@ -0,0 +1,80 @@
+"""
+convert_model.py — exporta el Random Forest entrenado al formato .gkm.
+
+El .gkm (ver core/model_format.py) guarda los árboles aplanados de
+CompiledForest junto con FEATURE_NAMES y la lista de clases; se carga con
+un mapeo de memoria en milisegundos, sin deserializar y sin depender de
+la versión de scikit-learn. Con --verify se comprueba que las
+probabilidades del .gkm son idénticas bit a bit a las del .pkl.
+
+Uso:
+    python tools/convert_model.py models/hand_state_rf.pkl [-o models/hand_state_rf.gkm] [--verify]
+"""
+from __future__ import annotations
+import argparse
+import copy
+import sys
+import time
+from pathlib import Path
+
+# Asegurar que el root del proyecto esté en el path
+_ROOT = Path(__file__).parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+import joblib
+import numpy as np
+
+from core.compiled_forest import CompiledForest
+from core.model_format import SUFFIX, load_forest, save_forest
+from core.state_classifier import FEATURE_NAMES, _schema_order
+
+
+def verify(model, path: Path, rows: int = 5000) -> bool:
+    """Compara predict_proba de sklearn y del .gkm sobre filas aleatorias."""
+    forest, _ = load_forest(path)
+    rng = np.random.default_rng(0)
+    splits = forest.threshold[forest.feature >= 0]
+    X = rng.uniform(splits.min() - 1.0, splits.max() + 1.0, (rows, forest.n_features_in_)).astype(np.float32)
+    if hasattr(model, "feature_names_in_"):
+        # Copia superficial: el modelo del llamante conserva su esquema
+        model = copy.copy(model)
+        del model.feature_names_in_
+    return bool(np.array_equal(model.predict_proba(X), forest.predict_proba(X)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("model", type=Path, help="modelo entrenado (.pkl)")
+    parser.add_argument("-o", "--output", type=Path, default=None)
+    parser.add_argument("--verify", action="store_true")
+    args = parser.parse_args()
+    out = args.output or args.model.with_suffix(SUFFIX)
+
+    t0 = time.perf_counter()
+    model = joblib.load(args.model)
+    pkl_ms = 1000.0 * (time.perf_counter() - t0)
+
+    _schema_order(model)   # ValueError si no coincide con FEATURE_NAMES
+    names = [str(n) for n in getattr(model, "feature_names_in_", FEATURE_NAMES)]
+    try:
+        forest = CompiledForest.from_sklearn(model)
+        save_forest(forest, names, out)
+    except TypeError as exc:
+        sys.exit(f"[ERROR] {exc}")
+
+    t0 = time.perf_counter()
+    load_forest(out)
+    gkm_ms = 1000.0 * (time.perf_counter() - t0)
+
+    print(f"[INFO] {out}: {forest.n_trees} árboles, {len(forest.threshold)} nodos, "
+          f"{out.stat().st_size / 1024:.0f} KB")
+    print(f"[INFO] Carga: .pkl {pkl_ms:.1f} ms → .gkm {gkm_ms:.2f} ms")
+    if args.verify:
+        if not verify(model, out):
+            sys.exit("[ERROR] Las probabilidades del .gkm no coinciden con las del .pkl")
+        print("[INFO] Verificado: probabilidades idénticas")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ from __future__ import annotations
 import math
 from typing import Sequence, Tuple
 
+import numpy as np
+
 Point2D = Tuple[float, float]
 
 
@@ -15,7 +17,10 @@ def dist(a: Point2D, b: Point2D) -> float:
 
 
 def hand_center(landmarks: Sequence[Point2D]) -> Point2D:
-    """Geometric centroid of a hand landmark list."""
+    """Geometric (x, y) centroid of a hand — point list or (21, 2|3) array."""
+    if isinstance(landmarks, np.ndarray):
+        cx, cy = landmarks[:, :2].mean(axis=0)
+        return (float(cx), float(cy))
     xs = [p[0] for p in landmarks]
     ys = [p[1] for p in landmarks]
     n = len(landmarks)